@@ -2,5 +2,11 @@
 from .sec_financial_cache import SecFinancialCache
 from .cached_manager import CachedFinancialManager
 from .data_cache import FinancialDataCache
+from .cache_warmer import CacheWarmer, warm_cache
+from .statement_store import StatementStore, get_statement_store
+from .filing_registry import FilingRegistry, get_filing_registry
+from .http_cache import get_http_client, get_http_cache_stats, install_edgar_http_cache
 
-__all__ = ['SecFinancialCache', 'CachedFinancialManager', 'FinancialDataCache']
+__all__ = ['SecFinancialCache', 'CachedFinancialManager', 'FinancialDataCache', 'CacheWarmer', 'warm_cache',
+           'StatementStore', 'get_statement_store', 'FilingRegistry', 'get_filing_registry',
+           'get_http_client', 'get_http_cache_stats', 'install_edgar_http_cache']
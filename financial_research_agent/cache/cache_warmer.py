@@ -0,0 +1,341 @@
+"""
+Parallel multi-ticker warmer for the SEC financial cache.
+
+Fetches filings for many tickers concurrently while a single writer thread
+feeds SQLite, so network latency overlaps and writes never contend.
+
+Pipeline:
+    tickers -> fetch workers (thread pool, rate limited) -> queue -> writer thread -> SQLite
+
+Usage:
+    from financial_research_agent.cache import warm_cache
+
+    results = warm_cache(["AAPL", "MSFT", "NVDA"], workers=8)
+"""
+
+import queue
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+from .sec_financial_cache import SecFinancialCache
+
+logger = logging.getLogger(__name__)
+
+
+# SEC fair-access policy: no more than 10 requests per second
+SEC_MAX_REQUESTS_PER_SECOND = 10.0
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter shared by all fetch workers.
+
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    acquire() blocks until enough tokens are available.
+    """
+
+    def __init__(self, rate: float = SEC_MAX_REQUESTS_PER_SECOND, capacity: Optional[float] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to `rate`)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take `tokens` from the bucket, sleeping until they are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of {self.capacity}")
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+
+                delay = (tokens - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+
+class CacheWarmer:
+    """
+    Refresh the SEC cache for many tickers in parallel.
+
+    Features:
+    - Concurrent filing downloads on a bounded thread pool
+    - Shared token bucket keeping all workers under SEC's rate ceiling
+    - Retries with exponential backoff per ticker
+    - Single writer thread, so SQLite sees one writer at a time
+    - Per-ticker progress reporting
+    """
+
+    def __init__(
+        self,
+        cache: Optional[SecFinancialCache] = None,
+        workers: int = 4,
+        rate_limit: float = SEC_MAX_REQUESTS_PER_SECOND,
+        max_retries: int = 3,
+        backoff_seconds: float = 2.0,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+    ):
+        """
+        Initialize the warmer.
+
+        Args:
+            cache: Cache to fill (defaults to the standard database)
+            workers: Number of concurrent fetch threads
+            rate_limit: Maximum SEC calls per second across all workers
+            max_retries: Attempts per ticker before giving up
+            backoff_seconds: Base delay for exponential backoff between attempts
+            progress_callback: Called as (fraction_complete, message) after each ticker
+        """
+        self.cache = cache or SecFinancialCache()
+        self.workers = max(1, workers)
+        self.limiter = TokenBucket(rate_limit)
+        self.max_retries = max(1, max_retries)
+        self.backoff_seconds = backoff_seconds
+        self.progress_callback = progress_callback
+
+    # ========================================
+    # FETCH STAGE (worker threads)
+    # ========================================
+
+    def _fetch_ticker(self, ticker: str, max_filings: int) -> Dict[str, Any]:
+        """Download every required filing for one ticker (no database writes)."""
+        self.limiter.acquire()
+        filings_info = self.cache.get_required_filings(ticker)
+
+        company = filings_info.get('company')
+        rows = [filings_info['annual']] + list(filings_info['quarterlies'][:max(0, max_filings - 1)])
+
+        filings = []
+        for row in rows:
+            filing_data = row.to_dict() if hasattr(row, 'to_dict') else dict(row)
+            filing_data['is_foreign'] = filings_info['is_foreign']
+            filing_data['accounting_standard'] = filings_info['accounting_standard']
+
+            self.limiter.acquire()
+            statements = self.cache.fetch_filing_statements(ticker, filing_data, company=company)
+            filings.append((filing_data, statements))
+
+        return {'is_foreign': filings_info['is_foreign'], 'filings': filings}
+
+    def _fetch_with_retry(self, ticker: str, max_filings: int, writes: queue.Queue):
+        """Fetch one ticker with retries, then hand the payload to the writer."""
+        start_time = time.time()
+        last_error = None
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                payload = self._fetch_ticker(ticker, max_filings)
+                writes.put((ticker, payload, attempt, start_time))
+                return
+            except Exception as e:
+                last_error = e
+                if attempt < self.max_retries:
+                    delay = self.backoff_seconds * (2 ** (attempt - 1)) * (1 + random.random() * 0.25)
+                    logger.warning(f"{ticker}: attempt {attempt} failed ({e}), retrying in {delay:.1f}s")
+                    time.sleep(delay)
+
+        logger.error(f"{ticker}: giving up after {self.max_retries} attempts: {last_error}")
+        writes.put((ticker, {'error': str(last_error)}, self.max_retries, start_time))
+
+    # ========================================
+    # WRITE STAGE (single writer thread)
+    # ========================================
+
+    def _write_loop(self, writes: queue.Queue, results: Dict[str, Dict[str, Any]], total: int):
+        """Drain the queue into SQLite until the sentinel arrives."""
+        while True:
+            item = writes.get()
+            if item is None:
+                break
+
+            ticker, payload, attempts, start_time = item
+            result = {
+                'ticker': ticker,
+                'filings_cached': 0,
+                'total_items': 0,
+                'attempts': attempts,
+                'from_cache': False,
+            }
+
+            if 'error' in payload:
+                result['error'] = payload['error']
+            else:
+                result['is_foreign'] = payload['is_foreign']
+                for filing_data, statements in payload['filings']:
+                    try:
+                        filing_id = self.cache.store_filing(ticker, filing_data, statements)
+                        result['filings_cached'] += 1
+                        result['total_items'] += self.cache._get_filing_item_count(filing_id)
+                    except Exception as e:
+                        logger.error(f"{ticker}: error writing {filing_data.get('form')} filing: {e}")
+                        result['error'] = str(e)
+
+            result['cache_time_seconds'] = round(time.time() - start_time, 2)
+            self._record(results, result, total)
+
+    def _record(self, results: Dict[str, Dict[str, Any]], result: Dict[str, Any], total: int):
+        """Store a per-ticker result and report progress."""
+        results[result['ticker']] = result
+
+        status = "❌ " + result['error'] if result.get('error') else (
+            "cached (current)" if result.get('from_cache')
+            else f"{result['filings_cached']} filings, {result['total_items']} items"
+        )
+        message = f"[{len(results)}/{total}] {result['ticker']}: {status}"
+        logger.info(message)
+
+        if self.progress_callback:
+            try:
+                self.progress_callback(len(results) / total, message)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+
+    # ========================================
+    # PUBLIC API
+    # ========================================
+
+    def warm(
+        self,
+        tickers: List[str],
+        max_filings: int = 4,
+        force_refresh: bool = False,
+        defer_indexes: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Cache every ticker, fetching concurrently and writing from one thread.
+
+        Args:
+            tickers: Stock ticker symbols
+            max_filings: Filings per ticker (1 annual + up to max_filings-1 quarterlies)
+            force_refresh: Re-cache tickers that are already current
+            defer_indexes: Drop line-item indexes during the load and rebuild once
+                at the end (worth it for large backfills)
+
+        Returns:
+            Dict of ticker -> result dict (same keys as SecFinancialCache.cache_company,
+            plus 'attempts')
+        """
+        tickers = list(dict.fromkeys(t.upper() for t in tickers))
+        results: Dict[str, Dict[str, Any]] = {}
+        if not tickers:
+            return results
+
+        start_time = time.time()
+        writes: queue.Queue = queue.Queue(maxsize=self.workers * 2)
+        writer = threading.Thread(
+            target=self._write_loop, args=(writes, results, len(tickers)), name="sec-cache-writer"
+        )
+
+        pending = []
+        for ticker in tickers:
+            status = self.cache.check_cache_status(ticker)
+            if not force_refresh and status['cached'] and status['current']:
+                self._record(results, {
+                    'ticker': ticker,
+                    'filings_cached': status['filing_count'],
+                    'total_items': self.cache._get_item_count(ticker),
+                    'is_foreign': status['is_foreign'],
+                    'cache_time_seconds': 0,
+                    'from_cache': True,
+                    'attempts': 0,
+                }, len(tickers))
+            else:
+                pending.append(ticker)
+
+        logger.info(
+            f"Warming {len(pending)} tickers with {self.workers} workers "
+            f"({len(tickers) - len(pending)} already current)"
+        )
+
+        if pending:
+            if defer_indexes:
+                # Indexes are dropped/rebuilt on this thread; the writer only inserts
+                with self.cache.deferred_indexes():
+                    self._run(pending, max_filings, writes, writer)
+            else:
+                self._run(pending, max_filings, writes, writer)
+
+        logger.info(f"Warmed {len(tickers)} tickers in {time.time() - start_time:.1f}s")
+        return results
+
+    def _run(self, tickers: List[str], max_filings: int, writes: queue.Queue, writer: threading.Thread):
+        """Run the fetch pool and writer thread to completion."""
+        writer.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sec-cache-fetch") as pool:
+                for ticker in tickers:
+                    pool.submit(self._fetch_with_retry, ticker, max_filings, writes)
+        finally:
+            writes.put(None)
+            writer.join()
+
+
+def warm_cache(
+    tickers: List[str],
+    workers: int = 4,
+    cache: Optional[SecFinancialCache] = None,
+    max_filings: int = 4,
+    force_refresh: bool = False,
+    defer_indexes: bool = False,
+    rate_limit: float = SEC_MAX_REQUESTS_PER_SECOND,
+    max_retries: int = 3,
+    progress_callback: Optional[Callable[[float, str], None]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Refresh the SEC cache for many tickers in parallel.
+
+    Args:
+        tickers: Stock ticker symbols
+        workers: Number of concurrent fetch threads
+        cache: Cache to fill (defaults to the standard database)
+        max_filings: Filings per ticker (1 annual + up to max_filings-1 quarterlies)
+        force_refresh: Re-cache tickers that are already current
+        defer_indexes: Rebuild line-item indexes once at the end instead of per insert
+        rate_limit: Maximum SEC calls per second across all workers
+        max_retries: Attempts per ticker before giving up
+        progress_callback: Called as (fraction_complete, message) after each ticker
+
+    Returns:
+        Dict of ticker -> result dict
+    """
+    warmer = CacheWarmer(
+        cache=cache,
+        workers=workers,
+        rate_limit=rate_limit,
+        max_retries=max_retries,
+        progress_callback=progress_callback,
+    )
+    return warmer.warm(
+        tickers,
+        max_filings=max_filings,
+        force_refresh=force_refresh,
+        defer_indexes=defer_indexes,
+    )
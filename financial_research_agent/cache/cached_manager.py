@@ -57,27 +57,19 @@ class CachedFinancialManager:
             'financing_cash_flow': ['us-gaap_NetCashProvidedByUsedInFinancingActivities', 'ifrs-full_CashFlowsFromUsedInFinancingActivities'],
         }
     
-    def _get_by_concept(self, ticker: str, concepts: List[str]) -> Optional[float]:
-        """Get value by trying each concept in order."""
-        conn = self.cache._get_connection()
-        cursor = conn.cursor()
+    def _ensure_cached(self, ticker: str, force_refresh: bool = False) -> Dict[str, Any]:
+        """Fetch from SEC if the ticker is missing or stale. Returns status plus 'source' or 'error'."""
+        status = self.cache.check_cache_status(ticker)
         
-        for concept in concepts:
-            for table in ['balance_sheet', 'income_statement', 'cash_flow']:
-                cursor.execute(f"""
-                    SELECT value FROM {table}
-                    WHERE ticker = ? AND concept = ?
-                    ORDER BY filing_date DESC
-                    LIMIT 1
-                """, (ticker.upper(), concept))
-                
-                row = cursor.fetchone()
-                if row and row['value'] is not None:
-                    conn.close()
-                    return row['value']
+        if not status['cached'] or not status['current'] or force_refresh:
+            logger.info(f"Cache miss for {ticker}, fetching from SEC...")
+            cache_result = self.cache.cache_company(ticker, force_refresh=force_refresh)
+            
+            if cache_result.get('error'):
+                return {**status, 'error': cache_result['error'], 'source': 'error'}
+            return {**status, 'source': 'sec'}
         
-        conn.close()
-        return None
+        return {**status, 'source': 'cache'}
     
     def get_financials(
         self,
@@ -88,21 +80,15 @@ class CachedFinancialManager:
         """Get financial data for a company (cache-first)."""
         start_time = time.time()
         
-        status = self.cache.check_cache_status(ticker)
+        status = self._ensure_cached(ticker, force_refresh=force_refresh)
         
-        if not status['cached'] or not status['current'] or force_refresh:
-            logger.info(f"Cache miss for {ticker}, fetching from SEC...")
-            cache_result = self.cache.cache_company(ticker, force_refresh=force_refresh)
-            
-            if cache_result.get('error'):
-                return {
-                    'ticker': ticker,
-                    'error': cache_result['error'],
-                    'source': 'error'
-                }
-            source = 'sec'
-        else:
-            source = 'cache'
+        if status.get('error'):
+            return {
+                'ticker': ticker,
+                'error': status['error'],
+                'source': 'error'
+            }
+        source = status['source']
         
         data = self.cache.get_cached_financials(ticker, periods=periods)
         elapsed = time.time() - start_time
@@ -116,17 +102,45 @@ class CachedFinancialManager:
             'periods': data.get('periods', []) if data else []
         }
     
+    def get_financials_matrix(self, ticker: str, periods: int = 4):
+        """Get financial data as a concept x period DataFrame (cache-first)."""
+        if self._ensure_cached(ticker).get('error'):
+            return None
+        return self.cache.get_financials_matrix(ticker, periods=periods)
+    
     def get_metric(self, ticker: str, metric: str) -> Optional[float]:
         """Get a specific metric for a company using XBRL concepts."""
-        self.get_financials(ticker)
+        return self.get_metrics(ticker, [metric])[metric]
+    
+    def get_metrics(self, ticker: str, metrics: List[str]) -> Dict[str, Optional[float]]:
+        """
+        Get several metrics for a company in one lookup.
+        
+        Every friendly name is resolved through the concept map and all
+        candidate concepts are read from latest_concept_values in a single
+        query. Names not in the map fall back to a label search.
+        """
+        self._ensure_cached(ticker)
         
-        concepts = self._concept_map.get(metric.lower())
-        if concepts:
-            return self._get_by_concept(ticker, concepts)
+        candidates = {metric: self._concept_map.get(metric.lower(), []) for metric in metrics}
+        found = self.cache.get_latest_values(
+            ticker, [concept for concepts in candidates.values() for concept in concepts]
+        )
         
-        # Fallback: search by label
-        results = self.cache.search_line_items(metric, ticker=ticker, limit=1)
-        return results[0]['value'] if results else None
+        result = {}
+        for metric, concepts in candidates.items():
+            if concepts:
+                # First concept in priority order that has a value
+                result[metric] = next(
+                    (found[c]['value'] for c in concepts if c in found and found[c]['value'] is not None),
+                    None
+                )
+            else:
+                # Fallback: search by label
+                results = self.cache.search_line_items(metric, ticker=ticker, limit=1)
+                result[metric] = results[0]['value'] if results else None
+        
+        return result
     
     def compare(
         self,
@@ -134,16 +148,7 @@ class CachedFinancialManager:
         metrics: List[str]
     ) -> Dict[str, Dict[str, Optional[float]]]:
         """Compare metrics across multiple companies."""
-        for ticker in tickers:
-            self.get_financials(ticker)
-        
-        result = {}
-        for ticker in tickers:
-            result[ticker] = {}
-            for metric in metrics:
-                result[ticker][metric] = self.get_metric(ticker, metric)
-        
-        return result
+        return {ticker: self.get_metrics(ticker, metrics) for ticker in tickers}
     
     def search(self, search_term: str, ticker: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
         """Search for financial items by label or concept."""
@@ -153,11 +158,9 @@ class CachedFinancialManager:
     
     def get_key_metrics(self, ticker: str) -> Dict[str, Optional[float]]:
         """Get key financial metrics for a company."""
-        self.get_financials(ticker)
-        
         key_metrics = ['assets', 'liabilities', 'equity', 'cash', 'revenue', 'net_income']
         
-        return {metric: self.get_metric(ticker, metric) for metric in key_metrics}
+        return self.get_metrics(ticker, key_metrics)
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
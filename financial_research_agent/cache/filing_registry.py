@@ -0,0 +1,287 @@
+"""
+Shared in-process registry of resolved edgartools objects.
+
+A single analysis resolves the same company and filing many times (financial
+extraction, risk factors, charts, metrics). Each resolution costs SEC round
+trips and, for XBRL, a full parse. This registry keeps the resolved objects in
+a size-bounded LRU so every consumer in the process shares them.
+
+Keys:
+    ('company', TICKER_OR_CIK)                    -> Company
+    ('latest', TICKER, forms, amendments)         -> latest Filing across forms
+    ('obj', accession)                            -> filing.obj() (TenK, TenQ, ...)
+    ('financials', accession)                     -> filing.obj().financials
+    ('xbrl', accession)                           -> filing.xbrl()
+
+Accession-keyed entries never go stale (filings are immutable). Company and
+latest-filing resolutions expire after `resolution_ttl` seconds so new filings
+are picked up by long-running processes.
+
+Parsed filings ('obj', 'financials', 'xbrl') hold the full document and XBRL
+instance, often tens of MB each, so they have their own much smaller bound
+(`max_parsed_entries`, AgentConfig.EDGAR_REGISTRY_MAX_PARSED) on top of the
+overall entry limit.
+
+Concurrent requests for the same key are coalesced: the first caller does
+the work, the others wait for its result.
+
+Usage:
+    from financial_research_agent.cache.filing_registry import get_filing_registry
+
+    registry = get_filing_registry()
+    filing = registry.latest_filing("AAPL", ["10-Q", "10-K", "20-F"], amendments=False)
+    financials = registry.financials(filing)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+import logging
+
+from financial_research_agent.config import AgentConfig
+from .http_cache import install_edgar_http_cache
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_ENTRIES = 128
+
+# Parsed filings are far larger than Company/Filing handles
+DEFAULT_MAX_PARSED_ENTRIES = 8
+PARSED_KINDS = ('obj', 'financials', 'xbrl')
+
+# How long company / latest-filing lookups are trusted before re-resolving
+DEFAULT_RESOLUTION_TTL_SECONDS = 3600
+
+
+class FilingRegistry:
+    """
+    Size-bounded LRU of Company, Filing, XBRL and Financials objects.
+
+    Features:
+    - Least-recently-used eviction once `max_entries` is reached, and among
+      parsed filings once `max_parsed_entries` is reached
+    - Request coalescing: concurrent misses for one key run the loader once
+    - Failed loads are not cached (the next caller retries)
+    - Hit/miss/coalesced/eviction counters
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        resolution_ttl: float = DEFAULT_RESOLUTION_TTL_SECONDS,
+        max_parsed_entries: int = DEFAULT_MAX_PARSED_ENTRIES,
+    ):
+        """
+        Initialize the registry.
+
+        Args:
+            max_entries: Maximum number of cached objects
+            resolution_ttl: Seconds before company/latest-filing lookups are refreshed
+            max_parsed_entries: Maximum number of cached obj/financials/xbrl objects
+        """
+        self.max_entries = max(1, max_entries)
+        self.max_parsed_entries = max(1, max_parsed_entries)
+        self.resolution_ttl = resolution_ttl
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0}
+
+    # ========================================
+    # CORE LRU
+    # ========================================
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value for `key`, loading it once if missing.
+
+        Args:
+            key: Registry key
+            loader: Zero-argument callable producing the value
+            ttl: Seconds the value stays valid (None = until evicted)
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return value
+                del self._entries[key]
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._stats['coalesced'] += 1
+                owner = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self._stats['misses'] += 1
+                owner = True
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._in_flight.pop(key, None)
+            expires_at = time.monotonic() + ttl if ttl is not None else None
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+            if self._is_parsed(key):
+                parsed = [k for k in self._entries if self._is_parsed(k)]
+                for oldest in parsed[:len(parsed) - self.max_parsed_entries]:
+                    del self._entries[oldest]
+                    self._stats['evictions'] += 1
+
+        future.set_result(value)
+        return value
+
+    @staticmethod
+    def _is_parsed(key: Hashable) -> bool:
+        return isinstance(key, tuple) and bool(key) and key[0] in PARSED_KINDS
+
+    def invalidate(self, ticker: Optional[str] = None):
+        """
+        Drop cached entries.
+
+        Args:
+            ticker: Only drop company/latest-filing lookups for this ticker
+                (default: clear everything)
+        """
+        with self._lock:
+            if ticker is None:
+                self._entries.clear()
+                return
+
+            ticker = str(ticker).upper()
+            for key in [k for k in self._entries if k[0] in ('company', 'latest') and k[1] == ticker]:
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Get registry counters."""
+        with self._lock:
+            return {**self._stats, 'entries': len(self._entries)}
+
+    # ========================================
+    # EDGARTOOLS RESOLVERS
+    # ========================================
+
+    def company(self, ticker_or_cik: Any) -> Any:
+        """Resolve an edgartools Company by ticker or CIK."""
+        from edgar import Company
+
+        identifier = str(ticker_or_cik).upper()
+        return self.get_or_load(
+            ('company', identifier),
+            lambda: Company(ticker_or_cik),
+            ttl=self.resolution_ttl,
+        )
+
+    def latest_filing(
+        self,
+        ticker: str,
+        forms: Sequence[str],
+        amendments: Optional[bool] = None,
+    ) -> Optional[Any]:
+        """
+        Resolve the most recently filed Filing among `forms`.
+
+        Args:
+            ticker: Ticker symbol or CIK
+            forms: Form types to consider (e.g. ["10-Q", "10-K", "20-F"])
+            amendments: Passed to get_filings(); None keeps edgartools' default
+
+        Returns:
+            The newest Filing by filing date, or None if no form has filings
+
+        Raises:
+            Exception: The last lookup error when nothing was found and at least
+                one form lookup failed (so the miss is not cached)
+        """
+        def load():
+            company = self.company(ticker)
+            kwargs = {} if amendments is None else {'amendments': amendments}
+
+            filing = None
+            latest_date = None
+            last_error = None
+            for form in forms:
+                try:
+                    filings = company.get_filings(form=form, **kwargs)
+                    if filings and len(filings) > 0:
+                        candidate = filings.latest(1)
+                        candidate_date = candidate.filing_date if hasattr(candidate, 'filing_date') else None
+                        if candidate_date and (latest_date is None or candidate_date > latest_date):
+                            filing = candidate
+                            latest_date = candidate_date
+                except Exception as e:
+                    logger.debug(f"No {form} filings found for {ticker}: {e}")
+                    last_error = e
+                    continue
+
+            if filing is None and last_error is not None:
+                raise last_error
+            return filing
+
+        return self.get_or_load(
+            ('latest', str(ticker).upper(), tuple(forms), amendments),
+            load,
+            ttl=self.resolution_ttl,
+        )
+
+    @staticmethod
+    def _accession(filing: Any) -> str:
+        accession = getattr(filing, 'accession_no', None) or getattr(filing, 'accession_number', None)
+        if not accession:
+            raise ValueError(f"Filing has no accession number: {filing!r}")
+        return str(accession)
+
+    def filing_object(self, filing: Any) -> Any:
+        """Parsed form object for a filing (filing.obj(), e.g. TenK/TenQ)."""
+        return self.get_or_load(('obj', self._accession(filing)), filing.obj)
+
+    def financials(self, filing: Any) -> Any:
+        """Financials object for a filing (filing.obj().financials)."""
+        return self.get_or_load(
+            ('financials', self._accession(filing)),
+            lambda: self.filing_object(filing).financials,
+        )
+
+    def xbrl(self, filing: Any) -> Any:
+        """Parsed XBRL for a filing (filing.xbrl())."""
+        return self.get_or_load(('xbrl', self._accession(filing)), filing.xbrl)
+
+
+_default_registry: Optional[FilingRegistry] = None
+_default_registry_lock = threading.Lock()
+
+
+def get_filing_registry() -> FilingRegistry:
+    """Get the process-wide filing registry."""
+    global _default_registry
+    with _default_registry_lock:
+        if _default_registry is None:
+            # Every edgartools consumer resolves through the registry, so this
+            # is the one place that needs the persistent HTTP cache in place
+            install_edgar_http_cache()
+            _default_registry = FilingRegistry(max_parsed_entries=AgentConfig.EDGAR_REGISTRY_MAX_PARSED)
+        return _default_registry
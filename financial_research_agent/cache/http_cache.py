@@ -0,0 +1,255 @@
+"""
+Persistent HTTP response cache for SEC EDGAR traffic.
+
+Built on hishel (an RFC 9111 cache for httpx) with an SEC-specific freshness
+policy, because SEC responses carry no useful Cache-Control headers:
+
+- Filing documents (/Archives/edgar/data/<cik>/<accession>/...) never change
+  after acceptance and are served from disk forever.
+- Submission indexes, company facts and ticker lists change as companies
+  file; they are reused for `index_ttl` seconds and then revalidated with
+  If-None-Match / If-Modified-Since, so an unchanged index costs a 304.
+
+The same disk cache backs edgartools (via its pluggable httpx client factory)
+and the calculation-linkbase downloads in xbrl_calculation.
+
+Usage:
+    from financial_research_agent.cache.http_cache import get_http_client, install_edgar_http_cache
+
+    install_edgar_http_cache()            # route edgartools through the cache
+    response = get_http_client().get(url) # cached GET for our own SEC requests
+    print(get_http_cache_stats())
+"""
+
+import os
+import re
+import threading
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlsplit
+import logging
+
+import hishel
+import httpx
+from hishel._controller import get_age
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_HTTP_CACHE_DIR = "data/http_cache"
+
+# Submission indexes and other mutable SEC resources are trusted this long
+DEFAULT_INDEX_TTL_SECONDS = 15 * 60
+
+# Anything inside an accession folder is an immutable filing document
+IMMUTABLE_PATH = re.compile(r"^/Archives/edgar/data/\d+/(\d{18}|\d{10}-\d{2}-\d{6})")
+
+SEC_USER_AGENT = os.getenv("SEC_EDGAR_USER_AGENT", "FinancialResearchAgent/1.0 (contact@example.com)")
+
+
+def is_immutable_url(url: Union[str, bytes]) -> bool:
+    """Check whether a URL points at a filing document (never changes once accepted)."""
+    if isinstance(url, bytes):
+        url = url.decode("ascii", errors="ignore")
+    path = urlsplit(url).path if "://" in url else url
+    return bool(IMMUTABLE_PATH.match(path))
+
+
+class HttpCacheStats:
+    """Thread-safe hit/miss counters, updated from an httpx response hook."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {'hits': 0, 'revalidated': 0, 'misses': 0}
+
+    def record(self, response: httpx.Response):
+        """Classify one response by the flags hishel sets on it."""
+        from_cache = response.extensions.get('from_cache', False)
+        revalidated = response.extensions.get('revalidated', False)
+
+        if from_cache and revalidated:
+            key = 'revalidated'  # 304 Not Modified, body served from disk
+        elif from_cache:
+            key = 'hits'
+        else:
+            key = 'misses'
+
+        with self._lock:
+            self._counts[key] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        total = sum(counts.values())
+        served = counts['hits'] + counts['revalidated']
+        counts['hit_rate'] = round(served / total, 3) if total else 0.0
+        return counts
+
+    def reset(self):
+        with self._lock:
+            for key in self._counts:
+                self._counts[key] = 0
+
+
+class SecCacheController(hishel.Controller):
+    """
+    hishel controller applying the SEC freshness policy.
+
+    Every successful GET is stored regardless of response headers; the
+    decision to reuse it depends only on whether the URL is immutable.
+    """
+
+    def __init__(self, index_ttl: float = DEFAULT_INDEX_TTL_SECONDS, **kwargs):
+        super().__init__(cacheable_methods=["GET"], cacheable_status_codes=[200], **kwargs)
+        self.index_ttl = index_ttl
+
+    def is_cachable(self, request, response) -> bool:
+        return request.method == b"GET" and response.status == 200
+
+    def construct_response_from_cache(self, request, response, original_request):
+        if not self._validate_vary(request=request, response=response, original_request=original_request):
+            return None
+
+        if is_immutable_url(request.url.target):
+            return response
+
+        try:
+            fresh = get_age(response, self._clock) < self.index_ttl
+        except RuntimeError:
+            fresh = False  # No Date header: always revalidate
+
+        if fresh:
+            return response
+
+        # Stale index: ask SEC whether it changed (ETag / Last-Modified)
+        self._make_request_conditional(request=request, response=response)
+        return request
+
+
+_stats = HttpCacheStats()
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+_edgar_installed = False
+
+
+def get_http_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for every cached SEC request in this process."""
+    return _stats.snapshot()
+
+
+def _record_response(response: httpx.Response):
+    _stats.record(response)
+
+
+async def _record_response_async(response: httpx.Response):
+    _stats.record(response)
+
+
+def create_cached_client(
+    cache_dir: Union[str, Path] = DEFAULT_HTTP_CACHE_DIR,
+    index_ttl: float = DEFAULT_INDEX_TTL_SECONDS,
+    **client_kwargs,
+) -> hishel.CacheClient:
+    """
+    Create an httpx client backed by the persistent SEC cache.
+
+    Args:
+        cache_dir: Directory for cached responses
+        index_ttl: Seconds before mutable SEC resources are revalidated
+        **client_kwargs: Passed to httpx.Client (headers, timeout, transport, ...)
+
+    Returns:
+        hishel.CacheClient
+    """
+    client_kwargs.setdefault('headers', {'User-Agent': SEC_USER_AGENT})
+    hooks = client_kwargs.pop('event_hooks', {})
+    hooks = {**hooks, 'response': [*hooks.get('response', []), _record_response]}
+
+    return hishel.CacheClient(
+        controller=SecCacheController(index_ttl=index_ttl),
+        storage=hishel.FileStorage(base_path=Path(cache_dir)),
+        event_hooks=hooks,
+        **client_kwargs,
+    )
+
+
+def _create_async_cached_client(cache_dir: Path, index_ttl: float, **client_kwargs) -> hishel.AsyncCacheClient:
+    hooks = client_kwargs.pop('event_hooks', {})
+    hooks = {**hooks, 'response': [*hooks.get('response', []), _record_response_async]}
+
+    return hishel.AsyncCacheClient(
+        controller=SecCacheController(index_ttl=index_ttl),
+        storage=hishel.AsyncFileStorage(base_path=cache_dir),
+        event_hooks=hooks,
+        **client_kwargs,
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide cached client for our own SEC requests."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = create_cached_client(follow_redirects=True)
+        return _client
+
+
+def _edgar_reads_client_factories(httpclient: Any) -> bool:
+    """
+    Check that edgartools builds its clients from the factory hooks we replace.
+
+    edgartools 4.x creates clients via `client_factory_class` /
+    `asyncclient_factory_class`; releases that dropped the hooks would leave
+    the attributes unused, so the functions that build clients are inspected.
+    """
+    builders = (
+        (getattr(httpclient, '_client_factory', None), 'client_factory_class'),
+        (getattr(httpclient, 'async_http_client', None), 'asyncclient_factory_class'),
+    )
+    for builder, hook in builders:
+        if not hasattr(httpclient, hook) or builder is None:
+            return False
+        code = getattr(getattr(builder, '__wrapped__', builder), '__code__', None)
+        if code is None or hook not in code.co_names:
+            return False
+    return hasattr(httpclient, 'close_clients')
+
+
+def install_edgar_http_cache(
+    cache_dir: Union[str, Path] = DEFAULT_HTTP_CACHE_DIR,
+    index_ttl: float = DEFAULT_INDEX_TTL_SECONDS,
+) -> bool:
+    """
+    Route edgartools' HTTP traffic through the persistent cache.
+
+    Idempotent. Set SEC_HTTP_CACHE=false to opt out.
+
+    Returns:
+        True if the cache is installed, False if disabled or unsupported
+    """
+    global _edgar_installed
+
+    if os.getenv("SEC_HTTP_CACHE", "true").lower() == "false":
+        return False
+
+    with _client_lock:
+        if _edgar_installed:
+            return True
+
+        try:
+            from edgar import httpclient
+        except ImportError:
+            httpclient = None
+        if httpclient is None or not _edgar_reads_client_factories(httpclient):
+            logger.warning("This edgartools version has no pluggable HTTP client; SEC responses will not be cached")
+            return False
+
+        cache_dir = Path(cache_dir)
+        httpclient.client_factory_class = partial(create_cached_client, cache_dir, index_ttl)
+        httpclient.asyncclient_factory_class = partial(_create_async_cached_client, cache_dir, index_ttl)
+        httpclient.close_clients()  # Drop any client created before installation
+
+        _edgar_installed = True
+        logger.info(f"SEC HTTP cache installed for edgartools: {cache_dir}")
+        return True
@@ -155,6 +155,20 @@ CREATE INDEX IF NOT EXISTS idx_segment_filing ON segment_data(filing_id);
 CREATE INDEX IF NOT EXISTS idx_segment_ticker_date ON segment_data(ticker, filing_date DESC);
 CREATE INDEX IF NOT EXISTS idx_segment_type ON segment_data(segment_type);
 
+-- ============================================================
+-- LATEST CONCEPT VALUES
+-- ============================================================
+-- Most recent non-null value of every XBRL concept per ticker.
+-- Maintained at ingest time so metric lookups are a single indexed read.
+CREATE TABLE IF NOT EXISTS latest_concept_values (
+    ticker TEXT NOT NULL,
+    concept TEXT NOT NULL,
+    value REAL,
+    filing_date TEXT NOT NULL,
+    statement TEXT NOT NULL,  -- balance_sheet, income_statement, cash_flow
+    PRIMARY KEY (ticker, concept)
+) WITHOUT ROWID;
+
 -- ============================================================
 -- CACHE STATISTICS
 -- ============================================================
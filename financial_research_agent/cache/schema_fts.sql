@@ -0,0 +1,74 @@
+-- SQLite FTS5 search index for SEC Financial Data Cache
+-- Version: 1.0
+-- Optional: only applied when the SQLite build includes FTS5.
+
+-- ============================================================
+-- LINE ITEM SEARCH INDEX
+-- ============================================================
+-- One row per line item across all three statements.
+-- rowid = source id * 3 + statement offset (0=balance, 1=income, 2=cash flow)
+CREATE VIRTUAL TABLE IF NOT EXISTS line_items_fts USING fts5(
+    label,
+    concept,
+    statement_type UNINDEXED,
+    ticker UNINDEXED,
+    filing_date UNINDEXED,
+    value UNINDEXED,
+    currency UNINDEXED
+);
+
+-- ============================================================
+-- SYNC TRIGGERS
+-- ============================================================
+
+-- Balance sheet
+CREATE TRIGGER IF NOT EXISTS balance_sheet_fts_insert AFTER INSERT ON balance_sheet BEGIN
+    INSERT INTO line_items_fts(rowid, label, concept, statement_type, ticker, filing_date, value, currency)
+    VALUES (new.id * 3, new.label, new.concept, 'balance_sheet', new.ticker, new.filing_date, new.value, new.currency);
+END;
+
+CREATE TRIGGER IF NOT EXISTS balance_sheet_fts_delete AFTER DELETE ON balance_sheet BEGIN
+    DELETE FROM line_items_fts WHERE rowid = old.id * 3;
+END;
+
+CREATE TRIGGER IF NOT EXISTS balance_sheet_fts_update AFTER UPDATE ON balance_sheet BEGIN
+    DELETE FROM line_items_fts WHERE rowid = old.id * 3;
+    INSERT INTO line_items_fts(rowid, label, concept, statement_type, ticker, filing_date, value, currency)
+    VALUES (new.id * 3, new.label, new.concept, 'balance_sheet', new.ticker, new.filing_date, new.value, new.currency);
+END;
+
+-- Income statement
+CREATE TRIGGER IF NOT EXISTS income_statement_fts_insert AFTER INSERT ON income_statement BEGIN
+    INSERT INTO line_items_fts(rowid, label, concept, statement_type, ticker, filing_date, value, currency)
+    VALUES (new.id * 3 + 1, new.label, new.concept, 'income_statement', new.ticker, new.filing_date, new.value, new.currency);
+END;
+
+CREATE TRIGGER IF NOT EXISTS income_statement_fts_delete AFTER DELETE ON income_statement BEGIN
+    DELETE FROM line_items_fts WHERE rowid = old.id * 3 + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS income_statement_fts_update AFTER UPDATE ON income_statement BEGIN
+    DELETE FROM line_items_fts WHERE rowid = old.id * 3 + 1;
+    INSERT INTO line_items_fts(rowid, label, concept, statement_type, ticker, filing_date, value, currency)
+    VALUES (new.id * 3 + 1, new.label, new.concept, 'income_statement', new.ticker, new.filing_date, new.value, new.currency);
+END;
+
+-- Cash flow
+CREATE TRIGGER IF NOT EXISTS cash_flow_fts_insert AFTER INSERT ON cash_flow BEGIN
+    INSERT INTO line_items_fts(rowid, label, concept, statement_type, ticker, filing_date, value, currency)
+    VALUES (new.id * 3 + 2, new.label, new.concept, 'cash_flow', new.ticker, new.filing_date, new.value, new.currency);
+END;
+
+CREATE TRIGGER IF NOT EXISTS cash_flow_fts_delete AFTER DELETE ON cash_flow BEGIN
+    DELETE FROM line_items_fts WHERE rowid = old.id * 3 + 2;
+END;
+
+CREATE TRIGGER IF NOT EXISTS cash_flow_fts_update AFTER UPDATE ON cash_flow BEGIN
+    DELETE FROM line_items_fts WHERE rowid = old.id * 3 + 2;
+    INSERT INTO line_items_fts(rowid, label, concept, statement_type, ticker, filing_date, value, currency)
+    VALUES (new.id * 3 + 2, new.label, new.concept, 'cash_flow', new.ticker, new.filing_date, new.value, new.currency);
+END;
+
+-- ============================================================
+-- INITIALIZATION COMPLETE
+-- ============================================================
@@ -13,14 +13,20 @@ Supports both US (10-K/10-Q) and foreign (20-F/6-K) companies.
 
 import sqlite3
 import json
+import re
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import logging
+import time
+from contextlib import contextmanager
+import pandas as pd
 from edgar import Company, Filing, set_identity
 import os
 from dotenv import load_dotenv
 
+from .connection_pool import SQLiteConnectionPool
+
 # Load environment variables
 load_dotenv()
 
@@ -35,6 +41,33 @@ else:
 logger = logging.getLogger(__name__)
 
 
+# Statement type -> cache table
+STATEMENT_TABLES = {
+    'balance': 'balance_sheet',
+    'income': 'income_statement',
+    'cash_flow': 'cash_flow',
+}
+
+# Every line item with its statement priority (balance sheet wins ties)
+RANKED_LINE_ITEMS_SQL = """
+    SELECT id, filing_id, ticker, filing_date, concept, value, 'balance_sheet' AS statement, 0 AS statement_rank
+    FROM balance_sheet
+    UNION ALL
+    SELECT id, filing_id, ticker, filing_date, concept, value, 'income_statement', 1
+    FROM income_statement
+    UNION ALL
+    SELECT id, filing_id, ticker, filing_date, concept, value, 'cash_flow', 2
+    FROM cash_flow
+"""
+
+# Statement type -> EdgarTools XBRL statement type
+STATEMENT_XBRL_TYPES = {
+    'balance': 'BalanceSheet',
+    'income': 'IncomeStatement',
+    'cash_flow': 'CashFlowStatement',
+}
+
+
 class SecFinancialCache:
     """
     SQLite cache for SEC financial data.
@@ -45,6 +78,7 @@ class SecFinancialCache:
     - Automatic staleness detection
     - Full-text search across line items
     - Multi-period queries
+    - Pooled thread-local connections (one per thread, PRAGMAs applied once)
     """
 
     def __init__(self, db_path: str = "data/sec_cache/financials.db"):
@@ -57,6 +91,9 @@ class SecFinancialCache:
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # One long-lived connection per thread
+        self._pool = SQLiteConnectionPool(self.db_path)
+
         # Initialize database
         self._init_database()
 
@@ -70,16 +107,23 @@ class SecFinancialCache:
             self._create_schema()
         else:
             # Verify schema exists
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name='filings_metadata'
-            """)
-            if not cursor.fetchone():
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT name FROM sqlite_master 
+                    WHERE type='table' AND name='filings_metadata'
+                """)
+                schema_exists = cursor.fetchone() is not None
+
+            if not schema_exists:
                 logger.warning("Database exists but schema missing. Creating schema...")
                 self._create_schema()
-            conn.close()
+
+        # Tables added after the first schema version
+        self._init_latest_values()
+
+        # Optional full-text index (needs SQLite built with FTS5)
+        self._fts_enabled = self._init_search_index()
 
     def _create_schema(self):
         """Create database schema from schema.sql."""
@@ -88,27 +132,94 @@ class SecFinancialCache:
         if not schema_path.exists():
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
 
-        conn = self._get_connection()
         with open(schema_path, "r") as f:
             schema_sql = f.read()
+
+        with self.connection() as conn:
             conn.executescript(schema_sql)
-        conn.commit()
-        conn.close()
 
         logger.info("Database schema created successfully")
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection with optimizations."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row  # Access columns by name
+    def _init_latest_values(self):
+        """Create and backfill latest_concept_values on databases that predate it."""
+        with self.connection() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'latest_concept_values'"
+            ).fetchone() is not None
+
+        if not exists:
+            logger.info("Adding latest_concept_values table...")
+            self._create_schema()
+            self.refresh_latest_values()
+
+    def _init_search_index(self) -> bool:
+        """
+        Create the FTS5 line-item index and its sync triggers if needed.
+
+        Returns:
+            True if full-text search is available, False to fall back to LIKE
+        """
+        schema_path = Path(__file__).parent / "schema_fts.sql"
+
+        try:
+            with self.connection() as conn:
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'line_items_fts'"
+                ).fetchone() is not None
+
+                with open(schema_path, "r") as f:
+                    conn.executescript(f.read())
 
-        # Performance optimizations
-        conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging
-        conn.execute("PRAGMA synchronous=NORMAL")  # Faster writes
-        conn.execute("PRAGMA cache_size=10000")  # 10MB cache
-        conn.execute("PRAGMA temp_store=MEMORY")  # Use memory for temp tables
+        except (sqlite3.OperationalError, FileNotFoundError) as e:
+            logger.warning(f"Full-text search unavailable, using LIKE search: {e}")
+            return False
 
-        return conn
+        if not exists:
+            # Existing databases: index rows cached before the triggers existed
+            self.rebuild_search_index()
+
+        return True
+
+    def rebuild_search_index(self) -> int:
+        """
+        Repopulate the full-text index from the statement tables.
+
+        Returns:
+            Number of line items indexed
+        """
+        with self.connection() as conn:
+            conn.execute("DELETE FROM line_items_fts")
+            for offset, table in enumerate(STATEMENT_TABLES.values()):
+                conn.execute(f"""
+                    INSERT INTO line_items_fts(
+                        rowid, label, concept, statement_type, ticker, filing_date, value, currency
+                    )
+                    SELECT id * 3 + {offset}, label, concept, '{table}', ticker, filing_date, value, currency
+                    FROM {table}
+                """)
+            total = conn.execute("SELECT COUNT(*) FROM line_items_fts").fetchone()[0]
+
+        logger.info(f"Indexed {total} line items for full-text search")
+        return total
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow this thread's pooled database connection.
+
+        Commits on exit, rolls back on error. Do not close the connection;
+        it is reused by every later call on the same thread.
+        """
+        with self._pool.connection() as conn:
+            yield conn
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's pooled database connection.
+
+        Prefer ``connection()``; the caller must not close this connection.
+        """
+        return self._pool._thread_connection()
 
 
     def _cache_filing_metadata(
@@ -174,9 +285,6 @@ class SecFinancialCache:
             ),
         )
 
-        # Persist the insert immediately to ensure lastrowid is stable across connections
-        conn.commit()
-
         filing_id = cursor.lastrowid
 
         logger.info(
@@ -186,6 +294,125 @@ class SecFinancialCache:
         return filing_id
 
 
+    def _normalize_statement(self, statement_data: Any) -> List[Tuple[str, str, float, str, int]]:
+        """
+        Flatten a financial statement into line-item rows.
+        
+        EdgarTools 4.x returns statements as dicts with 'data' key containing line items.
+        Only the first (most recent) usable value of each item is kept.
+        
+        Returns:
+            List of (concept, label, value, unit, level) tuples
+        """
+        rows = []
+        
+        # EdgarTools 4.x format: dict with 'data' key
+        if not (isinstance(statement_data, dict) and 'data' in statement_data):
+            return rows
+        
+        for item in statement_data['data']:
+            # Skip abstract items (headers)
+            if item.get('is_abstract', False):
+                continue
+            
+            concept = item.get('concept', 'unknown')
+            label = item.get('label', concept)
+            
+            # Get the most recent value from 'values' dict
+            values = item.get('values', {})
+            if not values:
+                continue
+            
+            # Keys are like 'instant_2025-09-27' or 'duration_...'
+            units = item.get('units', {})
+            for period_key, value in values.items():
+                # Skip empty values
+                if value == '' or value is None:
+                    continue
+                
+                try:
+                    numeric_value = float(value)
+                except (ValueError, TypeError):
+                    # Skip items that can't be converted to float
+                    continue
+                
+                rows.append((
+                    concept,
+                    label,
+                    numeric_value,
+                    units.get(period_key, 'usd'),
+                    item.get('level', 0)
+                ))
+                
+                # Only cache the first (most recent) period
+                break
+        
+        return rows
+
+
+    def _cache_statements_bulk(
+        self,
+        conn: sqlite3.Connection,
+        filing_id: int,
+        ticker: str,
+        filing_date: str,
+        statements: Dict[str, Any]
+    ) -> Dict[str, int]:
+        """
+        Cache several financial statements for one filing in a single batch.
+        
+        All statements are normalized up front, then written with one
+        executemany() per table inside the caller's transaction.
+        
+        Args:
+            conn: Database connection
+            filing_id: Database ID of the filing
+            ticker: Stock ticker
+            filing_date: Filing date (YYYY-MM-DD)
+            statements: Statement type ('balance', 'income', 'cash_flow') -> statement data
+            
+        Returns:
+            Dict of statement type -> number of items cached
+        """
+        # Normalize everything before touching the database
+        batches = {}
+        for statement_type, statement_data in statements.items():
+            table_name = STATEMENT_TABLES.get(statement_type)
+            if not table_name:
+                raise ValueError(f"Invalid statement type: {statement_type}")
+            
+            batches[statement_type] = (table_name, [
+                (filing_id, ticker.upper(), filing_date, concept, label, value, 'USD', unit, level)
+                for concept, label, value, unit, level in self._normalize_statement(statement_data)
+            ])
+        
+        counts = {}
+        try:
+            for statement_type, (table_name, rows) in batches.items():
+                if rows:
+                    conn.executemany(f"""
+                        INSERT INTO {table_name} (
+                            filing_id,
+                            ticker,
+                            filing_date,
+                            concept,
+                            label,
+                            value,
+                            currency,
+                            unit,
+                            level
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, rows)
+                counts[statement_type] = len(rows)
+                logger.info(f"Cached {len(rows)} items for {statement_type} statement")
+        
+        except Exception as e:
+            logger.error(f"Error caching statements for {ticker} ({filing_date}): {e}")
+            raise
+        
+        return counts
+
+
     def _cache_statement(
         self,
         conn: sqlite3.Connection,
@@ -200,180 +427,299 @@ class SecFinancialCache:
         
         EdgarTools 4.x returns statements as dicts with 'data' key containing line items.
         """
-        cursor = conn.cursor()
-        
-        # Map statement type to table name
-        table_map = {
-            'balance': 'balance_sheet',
-            'income': 'income_statement',
-            'cash_flow': 'cash_flow'
+        counts = self._cache_statements_bulk(
+            conn, filing_id, ticker, filing_date, {statement_type: statement_data}
+        )
+        return counts[statement_type]
+
+
+    def _update_latest_values(self, conn: sqlite3.Connection, filing_id: int):
+        """
+        Fold one filing's line items into latest_concept_values.
+
+        A concept is replaced only if this filing is at least as recent as
+        the stored value, so back-filling older filings never regresses it.
+        """
+        conn.execute(f"""
+            INSERT INTO latest_concept_values (ticker, concept, value, filing_date, statement)
+            SELECT ticker, concept, value, filing_date, statement FROM (
+                SELECT ticker, concept, value, filing_date, statement,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY concept ORDER BY statement_rank, id
+                       ) AS pick
+                FROM ({RANKED_LINE_ITEMS_SQL})
+                WHERE filing_id = ? AND value IS NOT NULL
+            )
+            WHERE pick = 1
+            ON CONFLICT (ticker, concept) DO UPDATE SET
+                value = excluded.value,
+                filing_date = excluded.filing_date,
+                statement = excluded.statement
+            WHERE excluded.filing_date >= latest_concept_values.filing_date
+        """, (filing_id,))
+
+    def refresh_latest_values(self, ticker: Optional[str] = None) -> int:
+        """
+        Rebuild latest_concept_values from the statement tables.
+
+        Args:
+            ticker: Only rebuild this ticker (default: all tickers)
+
+        Returns:
+            Number of (ticker, concept) rows written
+        """
+        ticker_filter = "AND ticker = ?" if ticker else ""
+        params = [ticker.upper()] if ticker else []
+
+        with self.connection() as conn:
+            conn.execute(
+                "DELETE FROM latest_concept_values" + (" WHERE ticker = ?" if ticker else ""), params
+            )
+            cursor = conn.execute(f"""
+                INSERT INTO latest_concept_values (ticker, concept, value, filing_date, statement)
+                SELECT ticker, concept, value, filing_date, statement FROM (
+                    SELECT ticker, concept, value, filing_date, statement,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY ticker, concept
+                               ORDER BY filing_date DESC, statement_rank, id
+                           ) AS pick
+                    FROM ({RANKED_LINE_ITEMS_SQL})
+                    WHERE value IS NOT NULL {ticker_filter}
+                )
+                WHERE pick = 1
+            """, params)
+            written = cursor.rowcount
+
+        logger.info(f"Refreshed {written} latest concept values{f' for {ticker}' if ticker else ''}")
+        return written
+
+    def get_latest_values(self, ticker: str, concepts: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up the most recent value of several XBRL concepts in one query.
+
+        Args:
+            ticker: Stock ticker symbol
+            concepts: XBRL concept names (e.g. ['us-gaap_Assets', 'ifrs-full_Assets'])
+
+        Returns:
+            Dict of concept -> {'value', 'filing_date', 'statement'} for concepts found
+        """
+        concepts = list(dict.fromkeys(concepts))
+        if not concepts:
+            return {}
+
+        with self.connection() as conn:
+            rows = conn.execute(f"""
+                SELECT concept, value, filing_date, statement
+                FROM latest_concept_values
+                WHERE ticker = ? AND concept IN ({",".join("?" * len(concepts))})
+            """, [ticker.upper()] + concepts).fetchall()
+
+        return {
+            row['concept']: {
+                'value': row['value'],
+                'filing_date': row['filing_date'],
+                'statement': row['statement'],
+            }
+            for row in rows
         }
+
+    @contextmanager
+    def deferred_indexes(self):
+        """
+        Drop line-item lookup indexes for a bulk load and rebuild them once at the end.
         
-        table_name = table_map.get(statement_type)
-        if not table_name:
-            raise ValueError(f"Invalid statement type: {statement_type}")
+        Use around large backfills (hundreds of tickers). The filing_id indexes
+        are kept so per-filing counts stay fast; other readers fall back to
+        table scans until the block exits.
+        """
+        with self.connection() as conn:
+            placeholders = ",".join("?" * len(STATEMENT_TABLES))
+            indexes = conn.execute(f"""
+                SELECT name, sql FROM sqlite_master
+                WHERE type = 'index'
+                AND tbl_name IN ({placeholders})
+                AND sql IS NOT NULL
+                AND name NOT LIKE '%_filing'
+            """, list(STATEMENT_TABLES.values())).fetchall()
+            
+            for index in indexes:
+                conn.execute(f"DROP INDEX IF EXISTS {index['name']}")
         
-        items_cached = 0
+        logger.info(f"Deferred {len(indexes)} indexes for bulk load")
         
         try:
-            # EdgarTools 4.x format: dict with 'data' key
-            if isinstance(statement_data, dict) and 'data' in statement_data:
-                line_items = statement_data['data']
-                
-                for item in line_items:
-                    # Skip abstract items (headers)
-                    if item.get('is_abstract', False):
-                        continue
-                    
-                    concept = item.get('concept', 'unknown')
-                    label = item.get('label', concept)
-                    
-                    # Get the most recent value from 'values' dict
-                    values = item.get('values', {})
-                    if not values:
-                        continue
-                    
-                    # Get the first (most recent) value
-                    # Keys are like 'instant_2025-09-27' or 'duration_...'
-                    for period_key, value in values.items():
-                        # Skip empty values
-                        if value == '' or value is None:
-                            continue
-                        
-                        # Get units
-                        units = item.get('units', {})
-                        unit = units.get(period_key, 'usd')
-                        
-                        try:
-                            cursor.execute(f"""
-                                INSERT INTO {table_name} (
-                                    filing_id,
-                                    ticker,
-                                    filing_date,
-                                    concept,
-                                    label,
-                                    value,
-                                    currency,
-                                    unit,
-                                    level
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """, (
-                                filing_id,
-                                ticker.upper(),
-                                filing_date,
-                                concept,
-                                label,
-                                float(value) if value is not None else None,
-                                'USD',
-                                unit,
-                                item.get('level', 0)
-                            ))
-                            items_cached += 1
-                        except (ValueError, TypeError) as e:
-                            # Skip items that can't be converted to float
-                            continue
-                        
-                        # Only cache the first (most recent) period
-                        break
-            
-            logger.info(f"Cached {items_cached} items for {statement_type} statement")
-            
+            yield
+        finally:
+            start = time.time()
+            with self.connection() as conn:
+                for index in indexes:
+                    conn.execute(index['sql'])
+            logger.info(f"Rebuilt {len(indexes)} indexes in {time.time() - start:.2f}s")
+
+
+    def fetch_filing_statements(
+        self,
+        ticker: str,
+        filing_data: Dict[str, Any],
+        company: Optional[Company] = None
+    ) -> Dict[str, Any]:
+        """
+        Download the XBRL statements for one filing (network only, no database writes).
+
+        Args:
+            ticker: Stock ticker symbol
+            filing_data: Filing information from edgartools
+            company: Already-resolved Company, to skip a second lookup
+
+        Returns:
+            Dict of statement type ('balance', 'income', 'cash_flow') -> statement data.
+            Empty if the filing or its XBRL could not be found.
+        """
+        form_type = filing_data.get('form')
+        filing_date = filing_data.get('filing_date')
+
+        logger.debug(f"Getting {form_type} filing for {ticker} on {filing_date}")
+
+        company = company or Company(ticker)
+        filings_list = company.get_filings(form=form_type)
+
+        filing_obj = None
+        for filing in filings_list:
+            if str(filing.filing_date) == str(filing_date):
+                filing_obj = filing
+                break
+
+        if filing_obj is None:
+            print(f"   ❌ Could not find matching {form_type} filing for {ticker} on {filing_date}")
+            return {}
+
+        statements = {}
+        try:
+            xbrl = filing_obj.xbrl()
+
+            if xbrl:
+                for statement_type, xbrl_type in STATEMENT_XBRL_TYPES.items():
+                    statement = xbrl.get_statement_by_type(xbrl_type)
+                    if statement and isinstance(statement, dict) and 'data' in statement:
+                        statements[statement_type] = statement
+
         except Exception as e:
-            logger.error(f"Error caching {statement_type} statement: {e}")
-            raise
-        
-        return items_cached
+            print(f"   ❌ XBRL extraction error: {e}")
 
+        return statements
 
-    def cache_filing(
-        self, 
-        ticker: str, 
-        filing_data: Dict[str, Any]
+
+    def store_filing(
+        self,
+        ticker: str,
+        filing_data: Dict[str, Any],
+        statements: Dict[str, Any]
     ) -> int:
-        """Cache a complete SEC filing."""
-        from edgar import Company
-        
-        conn = self._get_connection()
-        
-        try:
-            is_foreign = filing_data.get('is_foreign', False)
-            accounting_standard = filing_data.get('accounting_standard', 'US-GAAP')
-            
+        """
+        Write filing metadata and its statements to the cache in one transaction.
+
+        Args:
+            ticker: Stock ticker symbol
+            filing_data: Filing information from edgartools
+            statements: Output of fetch_filing_statements()
+
+        Returns:
+            filing_id: Database ID of the filing
+        """
+        with self.connection() as conn:
             filing_id = self._cache_filing_metadata(
                 conn,
                 ticker,
                 filing_data,
-                is_foreign,
-                accounting_standard
+                filing_data.get('is_foreign', False),
+                filing_data.get('accounting_standard', 'US-GAAP')
             )
-            
-            print(f"\n🔍 Debug: Getting filing object for {ticker}")
-            
-            company = Company(ticker)
-            form_type = filing_data.get('form')
-            filing_date = filing_data.get('filing_date')
-            
-            print(f"   Looking for {form_type} on {filing_date}")
-            
-            filings_list = company.get_filings(form=form_type)
-            print(f"   Found {len(filings_list)} {form_type} filings")
-            
-            filing_obj = None
-            for filing in filings_list:
-                print(f"   Checking filing from {filing.filing_date}")
-                if str(filing.filing_date) == str(filing_date):
-                    filing_obj = filing
-                    print(f"   ✅ Found matching filing!")
-                    break
-            
-            if filing_obj is None:
-                print(f"   ❌ Could not find matching filing")
-                conn.commit()
-                return filing_id
-            
-            # Check what methods are available
-            print(f"   Filing object type: {type(filing_obj)}")
-            print(f"   Available methods: {[m for m in dir(filing_obj) if not m.startswith('_')]}")
-            
-            # Try different ways to get financials
-            financials = None
-                
-            try:
-                xbrl = filing_obj.xbrl()
-                
-                if xbrl:
-                    print(f"   ✅ Got XBRL object")
-                    
-                    # Get Balance Sheet
-                    bs = xbrl.get_statement_by_type('BalanceSheet')
-                    if bs and isinstance(bs, dict) and 'data' in bs:
-                        items = self._cache_statement(conn, filing_id, ticker, filing_date, 'balance', bs)
-                        print(f"   ✅ Cached {items} balance sheet items")
-                    
-                    # Get Income Statement
-                    inc = xbrl.get_statement_by_type('IncomeStatement')
-                    if inc and isinstance(inc, dict) and 'data' in inc:
-                        items = self._cache_statement(conn, filing_id, ticker, filing_date, 'income', inc)
-                        print(f"   ✅ Cached {items} income statement items")
-                    
-                    # Get Cash Flow Statement
-                    cf = xbrl.get_statement_by_type('CashFlowStatement')
-                    if cf and isinstance(cf, dict) and 'data' in cf:
-                        items = self._cache_statement(conn, filing_id, ticker, filing_date, 'cash_flow', cf)
-                        print(f"   ✅ Cached {items} cash flow items")
-    
-            except Exception as e:
-                print(f"   ❌ XBRL extraction error: {e}")
-            
-            conn.commit()
-            return filing_id
-            
-        except Exception as e:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
-   
+
+            counts = self._cache_statements_bulk(
+                conn, filing_id, ticker, filing_data.get('filing_date'), statements
+            )
+            self._update_latest_values(conn, filing_id)
+            for statement_type, items in counts.items():
+                print(f"   ✅ Cached {items} {STATEMENT_TABLES[statement_type].replace('_', ' ')} items")
+
+        return filing_id
+
+
+    def cache_filing(
+        self, 
+        ticker: str, 
+        filing_data: Dict[str, Any],
+        company: Optional[Company] = None
+    ) -> int:
+        """Cache a complete SEC filing."""
+        statements = self.fetch_filing_statements(ticker, filing_data, company=company)
+        return self.store_filing(ticker, filing_data, statements)
+
+
+    def _fetch_period_rows(
+        self, conn: sqlite3.Connection, ticker: str, periods: int
+    ) -> Tuple[List[Dict[str, Any]], List[sqlite3.Row]]:
+        """
+        Load the latest filings and all of their statement rows in two queries.
+
+        Statement rows for every filing come back from a single UNION ALL query,
+        ordered by filing then statement then original insert order.
+
+        Returns:
+            (filings, rows) - filings newest first; rows carry filing_id and statement
+        """
+        cursor = conn.cursor()
+
+        # Get filing metadata
+        cursor.execute(
+            """
+            SELECT *
+            FROM filings_metadata
+            WHERE ticker = ?
+            ORDER BY filing_date DESC, id DESC
+            LIMIT ?
+        """,
+            (ticker.upper(), periods),
+        )
+        filings = [dict(row) for row in cursor.fetchall()]
+
+        if not filings:
+            return filings, []
+
+        # Every statement row for exactly those filings in one round trip
+        filing_ids = [f["id"] for f in filings]
+        in_ids = ",".join("?" * len(filing_ids))
+        cursor.execute(
+            f"""
+            SELECT s.filing_id, 'balance_sheet' AS statement, s.id AS row_id,
+                   s.concept, s.label, s.value, s.currency
+            FROM balance_sheet s WHERE s.filing_id IN ({in_ids})
+            UNION ALL
+            SELECT s.filing_id, 'income_statement', s.id,
+                   s.concept, s.label, s.value, s.currency
+            FROM income_statement s WHERE s.filing_id IN ({in_ids})
+            UNION ALL
+            SELECT s.filing_id, 'cash_flow', s.id,
+                   s.concept, s.label, s.value, s.currency
+            FROM cash_flow s WHERE s.filing_id IN ({in_ids})
+            ORDER BY 1, 2, 3
+        """,
+            filing_ids * 3,
+        )
+        rows = cursor.fetchall()
+
+        # Update last_accessed
+        cursor.execute(
+            f"""
+            UPDATE filings_metadata
+            SET last_accessed = ?
+            WHERE id IN ({in_ids})
+        """,
+            [datetime.now().isoformat()] + filing_ids,
+        )
+
+        return filings, rows
 
 
     def get_cached_financials(
@@ -389,101 +735,99 @@ class SecFinancialCache:
         Returns:
             Dict with complete financial data or None if not cached
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         try:
-            # Get filing metadata
-            cursor.execute(
-                """
-                SELECT *
-                FROM filings_metadata
-                WHERE ticker = ?
-                ORDER BY filing_date DESC
-                LIMIT ?
-            """,
-                (ticker.upper(), periods),
-            )
-
-            filings = [dict(row) for row in cursor.fetchall()]
+            with self.connection() as conn:
+                filings, rows = self._fetch_period_rows(conn, ticker, periods)
 
             if not filings:
                 return None
 
-            # Get financial statements for each filing
-            result = {"ticker": ticker.upper(), "periods": []}
+            # Pivot rows into per-filing statement lists in one pass
+            by_filing = {
+                f["id"]: {table: [] for table in STATEMENT_TABLES.values()}
+                for f in filings
+            }
+            for row in rows:
+                by_filing[row["filing_id"]][row["statement"]].append({
+                    "concept": row["concept"],
+                    "label": row["label"],
+                    "value": row["value"],
+                    "currency": row["currency"],
+                })
 
+            result = {"ticker": ticker.upper(), "periods": []}
             for filing in filings:
-                filing_id = filing["id"]
-
-                # Get balance sheet
-                cursor.execute(
-                    """
-                    SELECT concept, label, value, currency
-                    FROM balance_sheet
-                    WHERE filing_id = ?
-                    ORDER BY id
-                """,
-                    (filing_id,),
-                )
-                balance_sheet = [dict(row) for row in cursor.fetchall()]
-
-                # Get income statement
-                cursor.execute(
-                    """
-                    SELECT concept, label, value, currency
-                    FROM income_statement
-                    WHERE filing_id = ?
-                    ORDER BY id
-                """,
-                    (filing_id,),
-                )
-                income_statement = [dict(row) for row in cursor.fetchall()]
-
-                # Get cash flow
-                cursor.execute(
-                    """
-                    SELECT concept, label, value, currency
-                    FROM cash_flow
-                    WHERE filing_id = ?
-                    ORDER BY id
-                """,
-                    (filing_id,),
-                )
-                cash_flow = [dict(row) for row in cursor.fetchall()]
-
-                # Update last_accessed
-                cursor.execute(
-                    """
-                    UPDATE filings_metadata
-                    SET last_accessed = ?
-                    WHERE id = ?
-                """,
-                    (datetime.now().isoformat(), filing_id),
-                )
-
+                statements = by_filing[filing["id"]]
                 result["periods"].append(
                     {
                         "filing_date": filing["filing_date"],
                         "form_type": filing["form_type"],
                         "is_foreign": bool(filing["is_foreign"]),
                         "accounting_standard": filing["accounting_standard"],
-                        "balance_sheet": balance_sheet,
-                        "income_statement": income_statement,
-                        "cash_flow": cash_flow,
+                        "balance_sheet": statements["balance_sheet"],
+                        "income_statement": statements["income_statement"],
+                        "cash_flow": statements["cash_flow"],
                     }
                 )
 
-            conn.commit()
-            conn.close()
-
             logger.info(f"Retrieved {len(result['periods'])} periods for {ticker}")
 
             return result
 
         except Exception as e:
             logger.error(f"Error retrieving cached financials for {ticker}: {e}")
-            conn.close()
+            return None
+
+
+    def get_financials_matrix(
+        self, ticker: str, periods: int = 4
+    ) -> Optional[pd.DataFrame]:
+        """
+        Retrieve cached financials as a concept x period matrix.
+
+        Args:
+            ticker: Stock ticker symbol
+            periods: Number of periods to retrieve
+
+        Returns:
+            DataFrame indexed by (statement, concept) with a 'label' column and
+            one value column per filing date (newest first), or None if not cached
+        """
+        try:
+            with self.connection() as conn:
+                filings, rows = self._fetch_period_rows(conn, ticker, periods)
+
+            if not filings:
+                return None
+
+            # Filing dates are unique per form, so the first (newest) filing wins a shared date
+            period_of = {}
+            for filing in filings:
+                if filing["filing_date"] not in period_of.values():
+                    period_of[filing["id"]] = filing["filing_date"]
+            columns = list(period_of.values())
+
+            # One pass: (statement, concept) -> {label, period: value}
+            matrix: Dict[Tuple[str, str], Dict[str, Any]] = {}
+            for row in rows:
+                period = period_of.get(row["filing_id"])
+                if period is None:
+                    continue
+                entry = matrix.setdefault((row["statement"], row["concept"]), {"label": row["label"]})
+                entry.setdefault(period, row["value"])
+
+            index = pd.MultiIndex.from_arrays(
+                [[key[0] for key in matrix], [key[1] for key in matrix]],
+                names=["statement", "concept"],
+            )
+            df = pd.DataFrame(list(matrix.values()), index=index, columns=["label"] + columns)
+
+            logger.info(f"Retrieved {len(df)} concepts x {len(columns)} periods for {ticker}")
+
+            return df
+
+        except Exception as e:
+            logger.error(f"Error retrieving financials matrix for {ticker}: {e}")
             return None
         
         
@@ -511,7 +855,6 @@ class SecFinancialCache:
                 'cache_time_seconds': float
             }
         """
-        import time
         start_time = time.time()
         
         # Check if already cached and current
@@ -550,7 +893,7 @@ class SecFinancialCache:
             annual_data['is_foreign'] = filings_info['is_foreign']
             annual_data['accounting_standard'] = filings_info['accounting_standard']
             
-            filing_id = self.cache_filing(ticker, annual_data)
+            filing_id = self.cache_filing(ticker, annual_data, company=filings_info.get('company'))
             if filing_id:
                 filings_cached += 1
                 total_items += self._get_filing_item_count(filing_id)
@@ -567,7 +910,7 @@ class SecFinancialCache:
                 quarterly_data['is_foreign'] = filings_info['is_foreign']
                 quarterly_data['accounting_standard'] = filings_info['accounting_standard']
                 
-                filing_id = self.cache_filing(ticker, quarterly_data)
+                filing_id = self.cache_filing(ticker, quarterly_data, company=filings_info.get('company'))
                 if filing_id:
                     filings_cached += 1
                     total_items += self._get_filing_item_count(filing_id)
@@ -593,29 +936,25 @@ class SecFinancialCache:
 
     def _get_item_count(self, ticker: str) -> int:
         """Get total number of cached items for a ticker."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
         total = 0
-        for table in ['balance_sheet', 'income_statement', 'cash_flow']:
-            cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE ticker = ?", (ticker.upper(),))
-            total += cursor.fetchone()[0]
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for table in ['balance_sheet', 'income_statement', 'cash_flow']:
+                cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE ticker = ?", (ticker.upper(),))
+                total += cursor.fetchone()[0]
         
-        conn.close()
         return total
 
 
     def _get_filing_item_count(self, filing_id: int) -> int:
         """Get total number of items for a specific filing."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        
         total = 0
-        for table in ['balance_sheet', 'income_statement', 'cash_flow']:
-            cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE filing_id = ?", (filing_id,))
-            total += cursor.fetchone()[0]
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            for table in ['balance_sheet', 'income_statement', 'cash_flow']:
+                cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE filing_id = ?", (filing_id,))
+                total += cursor.fetchone()[0]
         
-        conn.close()
         return total    
             
             
@@ -644,24 +983,25 @@ class SecFinancialCache:
                 'is_foreign': bool
             }
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self.connection() as conn:
+            cursor = conn.cursor()
 
-        # Check if ticker exists in cache
-        cursor.execute(
-            """
-            SELECT 
-                COUNT(*) as filing_count,
-                MAX(filing_date) as latest_date,
-                MAX(cached_at) as last_cached,
-                MAX(is_foreign) as is_foreign
-            FROM filings_metadata
-            WHERE ticker = ?
-        """,
-            (ticker.upper(),),
-        )
+            # Check if ticker exists in cache
+            cursor.execute(
+                """
+                SELECT 
+                    COUNT(*) as filing_count,
+                    MAX(filing_date) as latest_date,
+                    MAX(cached_at) as last_cached,
+                    MAX(is_foreign) as is_foreign
+                FROM filings_metadata
+                WHERE ticker = ?
+            """,
+                (ticker.upper(),),
+            )
+
+            result = cursor.fetchone()
 
-        result = cursor.fetchone()
         filing_count = result["filing_count"]
         latest_date = result["latest_date"]
         last_cached = result["last_cached"]
@@ -669,8 +1009,6 @@ class SecFinancialCache:
             bool(result["is_foreign"]) if result["is_foreign"] is not None else False
         )
 
-        conn.close()
-
         # Not cached at all
         if filing_count == 0:
             return {
@@ -711,6 +1049,9 @@ class SecFinancialCache:
         """
         Search for line items across financial statements.
 
+        Uses the FTS5 index (BM25-ranked, one query across all statements)
+        when available, otherwise falls back to LIKE scans.
+
         Args:
             ticker: Stock ticker symbol
             search_term: Term to search for (in label or concept)
@@ -719,59 +1060,101 @@ class SecFinancialCache:
         Returns:
             List of matching line items
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        if statement_type and statement_type not in STATEMENT_TABLES:
+            return []
+
+        match_query = _fts_match_query(search_term)
+        if self._fts_enabled and match_query:
+            return self._search_line_items_fts(match_query, ticker, statement_type, limit)
+
+        return self._search_line_items_like(search_term, ticker, statement_type, limit)
+
+    def _search_line_items_fts(
+        self,
+        match_query: str,
+        ticker: Optional[str],
+        statement_type: Optional[str],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Full-text search across all statements, best match first."""
+        query = """
+            SELECT statement_type, ticker, filing_date, concept, label, value, currency
+            FROM line_items_fts
+            WHERE line_items_fts MATCH ?
+        """
+        params: List[Any] = [match_query]
+
+        if ticker:
+            query += " AND ticker = ?"
+            params.append(ticker.upper())
+
+        if statement_type:
+            query += " AND statement_type = ?"
+            params.append(STATEMENT_TABLES[statement_type])
+
+        # Label matches weigh twice as much as concept matches
+        query += " ORDER BY bm25(line_items_fts, 2.0, 1.0), filing_date DESC LIMIT ?"
+        params.append(limit)
+
+        with self.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
 
+        return [dict(row) for row in rows]
+
+    def _search_line_items_like(
+        self,
+        search_term: str,
+        ticker: Optional[str],
+        statement_type: Optional[str],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Substring search, one table scan per statement."""
         results = []
 
         # Tables to search
         if statement_type:
-            table_map = {
-                'balance': 'balance_sheet',
-                'income': 'income_statement',
-                'cash_flow': 'cash_flow'
-            }
-            tables = [table_map.get(statement_type)]
-            if tables[0] is None:
-                return []
+            tables = [STATEMENT_TABLES[statement_type]]
         else:
-            tables = ['balance_sheet', 'income_statement', 'cash_flow']
+            tables = list(STATEMENT_TABLES.values())
 
-        for table in tables:
-            query = f"""
-                SELECT 
-                    '{table}' as statement_type,
-                    ticker,
-                    filing_date,
-                    concept,
-                    label,
-                    value,
-                    currency
-                FROM {table}
-                WHERE (label LIKE ? OR concept LIKE ?)
-            """
-            params = [f'%{search_term}%', f'%{search_term}%']
+        with self.connection() as conn:
+            cursor = conn.cursor()
 
-            if ticker:
-                query += " AND ticker = ?"
-                params.append(ticker.upper())
+            for table in tables:
+                query = f"""
+                    SELECT 
+                        '{table}' as statement_type,
+                        ticker,
+                        filing_date,
+                        concept,
+                        label,
+                        value,
+                        currency
+                    FROM {table}
+                    WHERE (label LIKE ? OR concept LIKE ?)
+                """
+                params = [f'%{search_term}%', f'%{search_term}%']
 
-            query += f" ORDER BY filing_date DESC LIMIT {limit}"
+                if ticker:
+                    query += " AND ticker = ?"
+                    params.append(ticker.upper())
 
-            cursor.execute(query, params)
+                # Bound parameter keeps the SQL text stable for statement reuse
+                query += " ORDER BY filing_date DESC LIMIT ?"
+                params.append(limit)
 
-            for row in cursor.fetchall():
-                results.append({
-                    'statement_type': row['statement_type'],
-                    'ticker': row['ticker'],
-                    'filing_date': row['filing_date'],
-                    'concept': row['concept'],
-                    'label': row['label'],
-                    'value': row['value'],
-                    'currency': row['currency']
-                })
+                cursor.execute(query, params)
 
-        conn.close()
+                for row in cursor.fetchall():
+                    results.append({
+                        'statement_type': row['statement_type'],
+                        'ticker': row['ticker'],
+                        'filing_date': row['filing_date'],
+                        'concept': row['concept'],
+                        'label': row['label'],
+                        'value': row['value'],
+                        'currency': row['currency']
+                    })
 
         # Sort by relevance then by date
         def sort_key(item):
@@ -795,31 +1178,30 @@ class SecFinancialCache:
             ticker: Stock ticker symbol
             items: List of concept names OR labels (e.g., ['Total Assets', 'Cash'])
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-    
         results = {}
     
-        for item in items:
-            for table in ['balance_sheet', 'income_statement', 'cash_flow']:
-                #search by both concept and label
-                cursor.execute(f"""
-                    SELECT value, filing_date
-                    FROM {table}
-                    WHERE ticker = ? 
-                    AND (concept = ? OR label LIKE ? OR label LIKE ?)
-                    ORDER BY filing_date DESC
-                    LIMIT 1
-                """, (ticker.upper(), item, item, f'%{item}%'))
-                
-                row = cursor.fetchone()
-                if row:
-                    results[item] = row['value']
-                    break
-            else:
-                results[item] = None
+        with self.connection() as conn:
+            cursor = conn.cursor()
+
+            for item in items:
+                for table in ['balance_sheet', 'income_statement', 'cash_flow']:
+                    #search by both concept and label
+                    cursor.execute(f"""
+                        SELECT value, filing_date
+                        FROM {table}
+                        WHERE ticker = ? 
+                        AND (concept = ? OR label LIKE ? OR label LIKE ?)
+                        ORDER BY filing_date DESC
+                        LIMIT 1
+                    """, (ticker.upper(), item, item, f'%{item}%'))
+                    
+                    row = cursor.fetchone()
+                    if row:
+                        results[item] = row['value']
+                        break
+                else:
+                    results[item] = None
 
-        conn.close()
         return results
 
     def compare_companies(
@@ -842,30 +1224,28 @@ class SecFinancialCache:
         Returns:
             Dict with cache statistics
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self.connection() as conn:
+            cursor = conn.cursor()
 
-        # Get counts
-        cursor.execute("SELECT COUNT(*) FROM filings_metadata")
-        total_filings = cursor.fetchone()[0]
+            # Get counts
+            cursor.execute("SELECT COUNT(*) FROM filings_metadata")
+            total_filings = cursor.fetchone()[0]
 
-        cursor.execute("SELECT COUNT(DISTINCT ticker) FROM filings_metadata")
-        unique_companies = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(DISTINCT ticker) FROM filings_metadata")
+            unique_companies = cursor.fetchone()[0]
 
-        cursor.execute("""
-            SELECT 
-                SUM(CASE WHEN is_foreign = 1 THEN 1 ELSE 0 END) as foreign_count,
-                SUM(CASE WHEN is_foreign = 0 THEN 1 ELSE 0 END) as domestic_count
-            FROM filings_metadata
-        """)
-        foreign, domestic = cursor.fetchone()
+            cursor.execute("""
+                SELECT 
+                    SUM(CASE WHEN is_foreign = 1 THEN 1 ELSE 0 END) as foreign_count,
+                    SUM(CASE WHEN is_foreign = 0 THEN 1 ELSE 0 END) as domestic_count
+                FROM filings_metadata
+            """)
+            foreign, domestic = cursor.fetchone()
 
         # Get database size
         db_size_bytes = self.db_path.stat().st_size
         db_size_mb = db_size_bytes / (1024 * 1024)
 
-        conn.close()
-
         return {
             "total_filings": total_filings,
             "unique_companies": unique_companies,
@@ -877,8 +1257,19 @@ class SecFinancialCache:
 
     def close(self):
         """Close database connection and cleanup."""
+        self._pool.close_all()
         logger.info("SecFinancialCache closed")
 
+    def get_connection_stats(self) -> Dict[str, int]:
+        """
+        Get connection pool counters.
+
+        Returns:
+            Dict with connections_opened, pragmas_executed, borrows and
+            open_connections
+        """
+        return self._pool.stats()
+
     def get_required_filings(self, ticker: str) -> Dict[str, Any]:
         """
         Determine which filings are required for a ticker.
@@ -967,6 +1358,19 @@ class SecFinancialCache:
 # ========================================
 
 
+def _fts_match_query(search_term: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every word must match as a prefix, e.g. "current liab" -> "current"* "liab"*.
+    Returns None when the term has no searchable words.
+    """
+    words = re.findall(r"\w+", search_term or "")
+    if not words:
+        return None
+    return " ".join(f'"{word}"*' for word in words)
+
+
 def get_filing_strategy(form_type: str, is_foreign: bool = False) -> Dict[str, Any]:
     """
     Determine filing strategy based on company type.
@@ -0,0 +1,303 @@
+"""
+Content-addressed Parquet store for extracted financial statement DataFrames.
+
+Parsing a filing's XBRL is the most expensive CPU step of a run, yet a filing
+never changes once it has an accession number. This store keeps the parsed
+statement DataFrames on disk so later runs can skip edgartools entirely.
+
+Layout:
+    {root}/objects/ab/abcdef....parquet        one file per unique DataFrame (sha256 of its bytes)
+    {root}/refs/{cik}/{accession}.json         statement name -> object hash, plus filing metadata
+
+Identical DataFrames (e.g. re-extracted filings) share one object file. Reads
+memory-map the Parquet file, so loading a statement does not copy the file
+into a Python buffer first.
+
+pyarrow ships with edgartools, so it is always available alongside it.
+
+Usage:
+    store = StatementStore()
+
+    store.put(cik, accession, {'balance_sheet': bs_df}, metadata={'ticker': 'AAPL'})
+    snapshot = store.get(cik, accession, ['balance_sheet'])
+    if snapshot:
+        bs_df = snapshot['frames']['balance_sheet']
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+import logging
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_STORE_PATH = "data/statement_store"
+
+# Statement name -> debug CSV prefix (file names used by the audit trail)
+CSV_EXPORT_NAMES = {
+    'balance_sheet': 'xbrl_raw_balance_sheet',
+    'income_statement': 'xbrl_raw_income_statement',
+    'cash_flow': 'xbrl_raw_cashflow',
+}
+
+
+def _normalize_cik(cik: Union[str, int]) -> str:
+    """CIKs arrive as ints or zero-padded strings; store them unpadded."""
+    return str(cik).lstrip('0') or '0'
+
+
+def _to_arrow(df: pd.DataFrame) -> pa.Table:
+    """
+    Convert a DataFrame to an Arrow table.
+
+    edgartools occasionally returns object columns mixing numbers and strings,
+    which Arrow rejects; those columns are stored as strings.
+    """
+    try:
+        return pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df = df.copy()
+        for col in df.columns:
+            if df[col].dtype == object:
+                try:
+                    pa.array(df[col])
+                except (pa.ArrowInvalid, pa.ArrowTypeError):
+                    df[col] = df[col].map(lambda v: None if pd.isna(v) else str(v))
+        return pa.Table.from_pandas(df)
+
+
+class StatementStore:
+    """
+    Parquet snapshots of statement DataFrames keyed by (CIK, accession, statement).
+
+    Features:
+    - Content-addressed objects (sha256 of the Parquet bytes), deduplicated
+    - Memory-mapped reads
+    - Atomic writes (temp file + rename), safe for concurrent runs
+    - CSV export for the debug/audit trail
+    """
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_STORE_PATH):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding the objects/ and refs/ trees
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.refs_dir = self.root / "refs"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.refs_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+
+    # ========================================
+    # PATHS
+    # ========================================
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}.parquet"
+
+    def _ref_path(self, cik: Union[str, int], accession: str) -> Path:
+        return self.refs_dir / _normalize_cik(cik) / f"{accession}.json"
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes):
+        """Write bytes via a temp file in the same directory, then rename."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    # ========================================
+    # WRITE
+    # ========================================
+
+    def _put_object(self, df: pd.DataFrame) -> str:
+        """Serialize a DataFrame to Parquet and store it under its content hash."""
+        buffer = io.BytesIO()
+        pq.write_table(_to_arrow(df), buffer)
+        data = buffer.getvalue()
+
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            self._atomic_write(path, data)
+        return digest
+
+    def put(
+        self,
+        cik: Union[str, int],
+        accession: str,
+        frames: Dict[str, pd.DataFrame],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, str]:
+        """
+        Store statement DataFrames for one filing.
+
+        Statements and metadata are merged into any existing snapshot, so the
+        deterministic and enhanced extractors can each add what they parse.
+
+        Args:
+            cik: Company CIK
+            accession: Filing accession number
+            frames: Statement name -> DataFrame
+            metadata: JSON-serializable filing metadata (dates, form, periods, ...)
+
+        Returns:
+            Statement name -> object hash
+        """
+        digests = {name: self._put_object(df) for name, df in frames.items() if df is not None}
+
+        with self._lock:
+            ref_path = self._ref_path(cik, accession)
+            ref = self._read_ref(ref_path) or {
+                'cik': _normalize_cik(cik),
+                'accession': accession,
+                'statements': {},
+                'metadata': {},
+            }
+            ref['statements'].update(digests)
+            ref['metadata'].update(metadata or {})
+            ref['updated_at'] = datetime.now().isoformat()
+
+            self._atomic_write(ref_path, json.dumps(ref, indent=2, default=str).encode())
+
+        return digests
+
+    # ========================================
+    # READ
+    # ========================================
+
+    @staticmethod
+    def _read_ref(path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable statement snapshot {path}: {e}")
+            return None
+
+    def read_table(self, digest: str) -> pa.Table:
+        """Memory-map one stored object as an Arrow table."""
+        return pq.read_table(self._object_path(digest), memory_map=True)
+
+    def get(
+        self,
+        cik: Union[str, int],
+        accession: str,
+        statements: Optional[Iterable[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load a filing snapshot.
+
+        Args:
+            cik: Company CIK
+            accession: Filing accession number
+            statements: Statement names that must all be present (default: everything stored)
+
+        Returns:
+            {'frames': name -> DataFrame, 'metadata': dict}, or None if the
+            filing (or any requested statement) is not stored
+        """
+        ref = self._read_ref(self._ref_path(cik, accession))
+        if ref is None:
+            return None
+
+        names = list(statements) if statements is not None else list(ref['statements'])
+        if any(name not in ref['statements'] for name in names):
+            return None
+
+        try:
+            frames = {name: self.read_table(ref['statements'][name]).to_pandas() for name in names}
+        except (OSError, pa.ArrowInvalid) as e:
+            logger.warning(f"Statement snapshot {cik}/{accession} is damaged, ignoring: {e}")
+            return None
+
+        return {'frames': frames, 'metadata': ref.get('metadata', {})}
+
+    def has(self, cik: Union[str, int], accession: str, statements: Iterable[str]) -> bool:
+        """Check whether every named statement is stored for a filing."""
+        ref = self._read_ref(self._ref_path(cik, accession))
+        return ref is not None and all(name in ref['statements'] for name in statements)
+
+    # ========================================
+    # EXPORT
+    # ========================================
+
+    def export_csv(
+        self,
+        cik: Union[str, int],
+        accession: str,
+        output_dir: Union[str, Path],
+        ticker: str,
+        filing_date_str: str,
+    ) -> Dict[str, Path]:
+        """
+        Write the raw statement CSVs used by the debug/audit trail.
+
+        Files are named xbrl_raw_<statement>_<ticker>_<YYYYMMDD>.csv as before.
+
+        Returns:
+            Statement name -> written path
+        """
+        ref = self._read_ref(self._ref_path(cik, accession))
+        if ref is None:
+            return {}
+
+        snapshot = self.get(cik, accession, [n for n in CSV_EXPORT_NAMES if n in ref['statements']])
+        if snapshot is None:
+            return {}
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        written = {}
+        for name, df in snapshot['frames'].items():
+            path = output_dir / f"{CSV_EXPORT_NAMES[name]}_{ticker}_{filing_date_str}.csv"
+            df.to_csv(path, index=False)
+            written[name] = path
+        return written
+
+    def stats(self) -> Dict[str, Any]:
+        """Get store size statistics."""
+        objects = list(self.objects_dir.glob("*/*.parquet"))
+        return {
+            'filings': sum(1 for _ in self.refs_dir.glob("*/*.json")),
+            'objects': len(objects),
+            'size_mb': round(sum(p.stat().st_size for p in objects) / (1024 * 1024), 2),
+            'root': str(self.root),
+        }
+
+
+_default_store: Optional[StatementStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_statement_store() -> StatementStore:
+    """Get the process-wide store at the default location."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = StatementStore()
+        return _default_store
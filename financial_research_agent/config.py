@@ -57,6 +57,33 @@ class AgentConfig:
     # Output configuration
     OUTPUT_DIR = os.getenv("OUTPUT_DIR", "financial_research_agent/output")
     CHROMA_DB_DIR = os.getenv("CHROMA_DB_DIR", "./chroma_db")
+    EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+    """Texts per embedding call when indexing into ChromaDB (new chunks from
+    every directory in a batch are embedded together)."""
+
+    # Blocking edgartools / SEC HTTP work runs on a bounded thread pool
+    EDGAR_IO_WORKERS = int(os.getenv("EDGAR_IO_WORKERS", "4"))
+    """Threads for blocking EDGAR I/O (keep low: SEC allows ~10 requests/second)."""
+    EDGAR_REGISTRY_MAX_PARSED = int(os.getenv("EDGAR_REGISTRY_MAX_PARSED", "8"))
+    """Parsed filings (filing.obj(), financials, XBRL) kept in memory for reuse.
+    Each can take tens of MB; lower this on memory-constrained hosts."""
+
+    # RAG answer cache (reuses synthesized KB answers for repeated questions)
+    RAG_ANSWER_CACHE = os.getenv("RAG_ANSWER_CACHE", "true").lower() == "true"
+    RAG_ANSWER_CACHE_SIMILARITY = float(os.getenv("RAG_ANSWER_CACHE_SIMILARITY", "0.999"))
+    """Minimum query-embedding cosine similarity to reuse an answer. The default
+    only matches repeated questions; around 0.95 also matches close paraphrases."""
+    RAG_ANSWER_CACHE_TTL_HOURS = float(os.getenv("RAG_ANSWER_CACHE_TTL_HOURS", "24"))
+
+    # Hybrid KB retrieval (BM25 + vector, fused with reciprocal rank fusion)
+    RAG_HYBRID_RETRIEVAL = os.getenv("RAG_HYBRID_RETRIEVAL", "true").lower() == "true"
+    RAG_RERANKER = os.getenv("RAG_RERANKER", "heuristic")  # heuristic | cross-encoder | none
+    RAG_CROSS_ENCODER_MODEL = os.getenv("RAG_CROSS_ENCODER_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+
+    # Synthesis prompt context (retrieved chunks are deduplicated and merged first)
+    RAG_CONTEXT_TOKEN_BUDGET = int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET", "8000"))
+    """Maximum estimated tokens of KB excerpts in the synthesis prompt (0 = no limit).
+    Excerpts are kept in relevance order; lower-ranked ones are cut or dropped."""
 
     # Feature flags
     ENABLE_EDGAR_INTEGRATION = os.getenv("ENABLE_EDGAR_INTEGRATION", "false").lower() == "true"
@@ -138,6 +165,11 @@ class EdgarConfig:
     # - get_financial_statements
     # - get_insider_transactions
 
+    # Server pool - servers stay connected across runs and are shared by
+    # concurrent analyses (see utils/mcp_pool.py)
+    MCP_POOL_SIZE = int(os.getenv("EDGAR_MCP_POOL_SIZE", "1"))
+    MCP_HEALTH_CHECK_SECONDS = float(os.getenv("EDGAR_MCP_HEALTH_CHECK_SECONDS", "60"))
+
     @classmethod
     def get_mcp_env(cls) -> dict[str, str]:
         """Get environment variables for the MCP server."""
@@ -20,8 +20,112 @@ import re
 from pathlib import Path
 import pandas as pd
 
+from financial_research_agent.cache.filing_registry import get_filing_registry
+from financial_research_agent.cache.statement_store import get_statement_store
+from financial_research_agent.utils.edgar_executor import run_edgar_io
 
-async def extract_financial_data_deterministic(
+# Statements parsed from filing.obj().financials (both extractors)
+FINANCIALS_STATEMENTS = ['balance_sheet', 'income_statement', 'cash_flow']
+
+# Unfiltered statements (every period in the filing) kept for trend charts
+RAW_STATEMENTS = ['raw_balance_sheet', 'raw_income_statement']
+
+# Enhanced result key -> (store name, display name) for filing.xbrl().statements
+XBRL_STATEMENTS = {
+    'income_statement_enhanced': ('xbrl_income_statement', 'Income Statement'),
+    'balance_sheet_enhanced': ('xbrl_balance_sheet', 'Balance Sheet'),
+    'cash_flow_enhanced': ('xbrl_cash_flow', 'Cash Flow Statement'),
+}
+
+
+def _filing_accession(filing: Any) -> Optional[str]:
+    """Accession number of an edgartools Filing, if it has one."""
+    return getattr(filing, 'accession_no', None) or getattr(filing, 'accession_number', None)
+
+
+def _filter_to_recent_periods(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep only the first 2 date columns (current and prior period from latest filing)."""
+    # Get all date columns
+    date_cols = [col for col in df.columns if isinstance(col, str) and '-' in col and col[0].isdigit()]
+
+    # Get non-date columns (like 'label', 'concept', 'abstract', etc.)
+    non_date_cols = [col for col in df.columns if col not in date_cols]
+
+    cols_to_keep = non_date_cols + date_cols[:2]
+    return df[cols_to_keep].copy()
+
+
+def _find_calculation_linkbase_url(filing: Any) -> Optional[str]:
+    """Find the XBRL calculation linkbase URL (_cal.xml) among a filing's attachments."""
+    try:
+        if hasattr(filing, 'attachments'):
+            for att in filing.attachments:
+                if hasattr(att, 'document') and '_cal.xml' in att.document:
+                    # Construct full URL from attachment path
+                    if hasattr(att, 'path'):
+                        path = att.path
+                        return f"https://www.sec.gov{path}" if not path.startswith('http') else path
+    except Exception:
+        # If we can't get the filing URL, continue without it
+        pass
+    return None
+
+
+def _enhanced_statement_result(info: dict[str, Any], df: pd.DataFrame) -> dict[str, Any]:
+    """Build an enhanced statement entry (name, title, periods, markdown + DataFrames)."""
+    # Snapshots stored before raw_data was dropped still carry it
+    info = {key: value for key, value in info.items() if key != 'raw_data'}
+
+    # Filter to main line items (exclude dimensional/segment breakdowns)
+    # Main items have dimension=False or no dimension column
+    if 'dimension' in df.columns:
+        main_df = df[df['dimension'] == False].copy()
+    else:
+        main_df = df.copy()
+
+    return {**info, 'dataframe': df, 'main_items_df': main_df}
+
+
+def _store_statements(
+    cik: Any,
+    accession: Optional[str],
+    ticker: str,
+    filing: Any,
+    frames: dict[str, pd.DataFrame],
+    metadata: Optional[dict[str, Any]] = None,
+) -> None:
+    """Snapshot freshly parsed statements; a failed write only costs a re-parse later."""
+    if not accession:
+        return
+    try:
+        get_statement_store().put(cik, accession, frames, metadata={
+            'ticker': ticker,
+            'form': str(getattr(filing, 'form', '')),
+            'filing_date': str(getattr(filing, 'filing_date', '')),
+            **(metadata or {}),
+        })
+    except Exception as e:
+        print(f"⚠️  Could not store statement snapshot for {ticker}: {e}")
+
+
+def _export_debug_csvs(
+    cik: Any,
+    accession: Optional[str],
+    ticker: str,
+    filing_date_str: str,
+    debug_dir: Path,
+    frames: dict[str, pd.DataFrame],
+) -> None:
+    """Write the raw statement CSVs for the audit trail, from the snapshot store when possible."""
+    if accession and get_statement_store().export_csv(cik, accession, debug_dir, ticker, filing_date_str):
+        return
+
+    frames['balance_sheet'].to_csv(debug_dir / f"xbrl_raw_balance_sheet_{ticker}_{filing_date_str}.csv", index=False)
+    frames['income_statement'].to_csv(debug_dir / f"xbrl_raw_income_statement_{ticker}_{filing_date_str}.csv", index=False)
+    frames['cash_flow'].to_csv(debug_dir / f"xbrl_raw_cashflow_{ticker}_{filing_date_str}.csv", index=False)
+
+
+def _extract_financial_data_deterministic_sync(
     mcp_server: Any,
     company_name: str,
 ) -> dict[str, Any]:
@@ -45,7 +149,7 @@ async def extract_financial_data_deterministic(
     """
 
     # Import edgartools
-    from edgar import Company, set_identity, find_company
+    from edgar import set_identity, find_company
 
     # Set SEC identity (required)
     user_agent = os.getenv("SEC_EDGAR_USER_AGENT", "FinancialResearchAgent/1.0 (test@example.com)")
@@ -83,65 +187,53 @@ async def extract_financial_data_deterministic(
     # Step 2: Get latest filing using edgartools
     # Get the most recent filing by date across 10-Q, 10-K, and 20-F
     try:
-        company = Company(ticker)
-        filing = None
-        form_type = None
-        latest_date = None
+        registry = get_filing_registry()
+        company = registry.company(ticker)
 
         # Find the most recent financial filing by comparing dates
         # Use amendments=False to get original filings with complete XBRL data
-        for form in ["10-Q", "10-K", "20-F"]:
-            try:
-                filings = company.get_filings(form=form, amendments=False)
-                if filings and len(filings) > 0:
-                    candidate = filings.latest(1)
-                    # Get filing date for comparison
-                    candidate_date = candidate.filing_date if hasattr(candidate, 'filing_date') else None
-
-                    # If this is more recent than what we have, use it
-                    if candidate_date and (latest_date is None or candidate_date > latest_date):
-                        filing = candidate
-                        form_type = form
-                        latest_date = candidate_date
-            except Exception:
-                continue
+        filing = registry.latest_filing(ticker, ["10-Q", "10-K", "20-F"], amendments=False)
 
         if not filing:
             raise RuntimeError(f"No 10-Q, 10-K, or 20-F filings found for {ticker}")
 
-        # Get financials object from the filing
-        financials = filing.obj().financials
-
     except Exception as e:
         raise RuntimeError(f"Failed to get financials for {ticker}: {e}")
 
-    # Step 3: Extract financial statements as DataFrames
-    try:
-        bs_df = financials.balance_sheet().to_dataframe()
-        is_df = financials.income_statement().to_dataframe()
-        cf_df = financials.cashflow_statement().to_dataframe()
+    # Filings never change once accepted, so a stored snapshot for this
+    # accession number replaces XBRL parsing entirely
+    accession = _filing_accession(filing)
+    snapshot = get_statement_store().get(cik, accession, FINANCIALS_STATEMENTS) if accession else None
 
-        # Filter to keep only the first 2 date columns (most recent filing periods)
-        # This ensures the financial statements match the format of the most recent filing
-        def filter_to_recent_periods(df):
-            """Keep only the first 2 date columns from the DataFrame."""
-            # Get all date columns
-            date_cols = [col for col in df.columns if isinstance(col, str) and '-' in col and col[0].isdigit()]
+    # Step 3: Extract financial statements as DataFrames
+    if snapshot:
+        print(f"📦 Using stored statements for {ticker} ({accession})")
+        bs_df = snapshot['frames']['balance_sheet']
+        is_df = snapshot['frames']['income_statement']
+        cf_df = snapshot['frames']['cash_flow']
+        filing_url = snapshot['metadata'].get('filing_url')
+    else:
+        try:
+            # Get financials object from the filing
+            financials = registry.financials(filing)
 
-            # Get non-date columns (like 'label', 'concept', 'abstract', etc.)
-            non_date_cols = [col for col in df.columns if col not in date_cols]
+            # Filter to keep only the first 2 date columns (most recent filing periods)
+            # This ensures the financial statements match the format of the most recent filing
+            bs_df = _filter_to_recent_periods(financials.balance_sheet().to_dataframe())
+            is_df = _filter_to_recent_periods(financials.income_statement().to_dataframe())
+            cf_df = _filter_to_recent_periods(financials.cashflow_statement().to_dataframe())
 
-            # Keep only first 2 date columns (current and prior period from latest filing)
-            cols_to_keep = non_date_cols + date_cols[:2]
+        except Exception as e:
+            raise RuntimeError(f"Failed to extract statements from financials: {e}")
 
-            return df[cols_to_keep].copy()
+        # Find XBRL calculation linkbase URL (_cal.xml) for validation
+        filing_url = _find_calculation_linkbase_url(filing)
 
-        bs_df = filter_to_recent_periods(bs_df)
-        is_df = filter_to_recent_periods(is_df)
-        cf_df = filter_to_recent_periods(cf_df)
-
-    except Exception as e:
-        raise RuntimeError(f"Failed to extract statements from financials: {e}")
+        _store_statements(cik, accession, ticker, filing, {
+            'balance_sheet': bs_df,
+            'income_statement': is_df,
+            'cash_flow': cf_df,
+        }, metadata={'filing_url': filing_url})
 
     # Save raw XBRL DataFrames as CSV for audit trail (will be copied to output folder later)
     debug_dir = Path("financial_research_agent/output/debug_edgar")
@@ -149,9 +241,11 @@ async def extract_financial_data_deterministic(
 
     # Export raw XBRL data to CSV for verification and audit trail
     filing_date_str = str(filing.filing_date).replace("-", "")
-    bs_df.to_csv(debug_dir / f"xbrl_raw_balance_sheet_{ticker}_{filing_date_str}.csv", index=False)
-    is_df.to_csv(debug_dir / f"xbrl_raw_income_statement_{ticker}_{filing_date_str}.csv", index=False)
-    cf_df.to_csv(debug_dir / f"xbrl_raw_cashflow_{ticker}_{filing_date_str}.csv", index=False)
+    _export_debug_csvs(cik, accession, ticker, filing_date_str, debug_dir, {
+        'balance_sheet': bs_df,
+        'income_statement': is_df,
+        'cash_flow': cf_df,
+    })
 
     # Save extraction summary
     debug_file = debug_dir / f"edgartools_extraction_{ticker}.txt"
@@ -180,21 +274,6 @@ async def extract_financial_data_deterministic(
     current_period = date_cols[0] if len(date_cols) >= 1 else 'Unknown'
     prior_period = date_cols[1] if len(date_cols) >= 2 else None
 
-    # Find XBRL calculation linkbase URL (_cal.xml) for validation
-    filing_url = None
-    try:
-        if hasattr(filing, 'attachments'):
-            for att in filing.attachments:
-                if hasattr(att, 'document') and '_cal.xml' in att.document:
-                    # Construct full URL from attachment path
-                    if hasattr(att, 'path'):
-                        path = att.path
-                        filing_url = f"https://www.sec.gov{path}" if not path.startswith('http') else path
-                        break
-    except Exception:
-        # If we can't get the filing URL, continue without it
-        pass
-
     # Extract fiscal year-end date from the filing
     # For 20-F filers, this is particularly important as they may have non-calendar year-ends
     fiscal_year_end = None
@@ -232,7 +311,19 @@ async def extract_financial_data_deterministic(
     }
 
 
-async def extract_financial_data_enhanced(
+async def extract_financial_data_deterministic(
+    mcp_server: Any,
+    company_name: str,
+) -> dict[str, Any]:
+    """
+    Extract complete financial data without blocking the event loop.
+
+    Runs _extract_financial_data_deterministic_sync on the EDGAR I/O executor.
+    """
+    return await run_edgar_io(_extract_financial_data_deterministic_sync, mcp_server, company_name)
+
+
+def _extract_financial_data_enhanced_sync(
     mcp_server: Any,
     company_name: str,
 ) -> dict[str, Any]:
@@ -258,7 +349,7 @@ async def extract_financial_data_enhanced(
     """
 
     # Import edgartools
-    from edgar import Company, set_identity, find_company
+    from edgar import set_identity, find_company
 
     # Set SEC identity (required)
     user_agent = os.getenv("SEC_EDGAR_USER_AGENT", "FinancialResearchAgent/1.0 (test@example.com)")
@@ -288,24 +379,11 @@ async def extract_financial_data_enhanced(
 
     # Step 2: Get latest filing
     try:
-        company = Company(ticker)
-        filing = None
-        form_type = None
-        latest_date = None
+        registry = get_filing_registry()
+        company = registry.company(ticker)
 
         # Use amendments=False to get original filings with complete XBRL data
-        for form in ["10-Q", "10-K", "20-F"]:
-            try:
-                filings = company.get_filings(form=form, amendments=False)
-                if filings and len(filings) > 0:
-                    candidate = filings.latest(1)
-                    candidate_date = candidate.filing_date if hasattr(candidate, 'filing_date') else None
-                    if candidate_date and (latest_date is None or candidate_date > latest_date):
-                        filing = candidate
-                        form_type = form
-                        latest_date = candidate_date
-            except Exception:
-                continue
+        filing = registry.latest_filing(ticker, ["10-Q", "10-K", "20-F"], amendments=False)
 
         if not filing:
             raise RuntimeError(f"No 10-Q, 10-K, or 20-F filings found for {ticker}")
@@ -313,74 +391,107 @@ async def extract_financial_data_enhanced(
     except Exception as e:
         raise RuntimeError(f"Failed to get filing for {ticker}: {e}")
 
+    # Filings never change once accepted, so a stored snapshot for this
+    # accession number replaces XBRL parsing entirely
+    accession = _filing_accession(filing)
+    statement_names = FINANCIALS_STATEMENTS + RAW_STATEMENTS + [name for name, _ in XBRL_STATEMENTS.values()]
+    snapshot = get_statement_store().get(cik, accession, statement_names) if accession else None
+    if snapshot and 'xbrl' not in snapshot['metadata']:
+        # Stored by the deterministic extractor, which skips the XBRL statements API
+        snapshot = None
+
     # Step 3: Get XBRL data using enhanced API
-    try:
-        xbrl = filing.xbrl()
-
-        # Get statements using XBRL statements API
-        income_stmt = xbrl.statements.income_statement()
-        balance_stmt = xbrl.statements.balance_sheet()
-        cashflow_stmt = xbrl.statements.cashflow_statement()
-
-        # Extract enhanced data for each statement
-        def extract_statement_data(stmt, name):
-            """Extract enhanced data from a statement object."""
-            result = {
-                'name': name,
-                'title': stmt.name if hasattr(stmt, 'name') else name,
-                'periods': list(stmt.periods) if hasattr(stmt, 'periods') else [],
+    if snapshot:
+        print(f"📦 Using stored statements for {ticker} ({accession})")
+        frames = snapshot['frames']
+        xbrl_meta = snapshot['metadata']['xbrl']
+
+        bs_df = frames['balance_sheet']
+        is_df = frames['income_statement']
+        cf_df = frames['cash_flow']
+        raw_bs_df = frames['raw_balance_sheet']
+        raw_is_df = frames['raw_income_statement']
+
+        enhanced = {
+            key: _enhanced_statement_result(xbrl_meta['statements'][name], frames[name])
+            for key, (name, _) in XBRL_STATEMENTS.items()
+        }
+        entity_info = xbrl_meta.get('entity_info', {})
+    else:
+        try:
+            xbrl = registry.xbrl(filing)
+
+            # Get statements using XBRL statements API
+            statements = {
+                'income_statement_enhanced': xbrl.statements.income_statement(),
+                'balance_sheet_enhanced': xbrl.statements.balance_sheet(),
+                'cash_flow_enhanced': xbrl.statements.cashflow_statement(),
             }
 
-            # Get DataFrame
-            df = stmt.to_dataframe()
-            result['dataframe'] = df
+            # Extract enhanced data for each statement
+            def extract_statement_data(stmt, name):
+                """Extract enhanced data from a statement object."""
+                info = {
+                    'name': name,
+                    'title': stmt.name if hasattr(stmt, 'name') else name,
+                    'periods': list(stmt.periods) if hasattr(stmt, 'periods') else [],
+                }
 
-            # Get text output using str() - Statement class uses __str__ for formatted output
-            try:
-                result['markdown'] = str(stmt)
-            except Exception:
-                result['markdown'] = None
+                # Get text output using str() - Statement class uses __str__ for formatted output
+                try:
+                    info['markdown'] = str(stmt)
+                except Exception:
+                    info['markdown'] = None
+
+                # get_raw_data() is not collected: nothing reads it, and its
+                # values do not survive the JSON snapshot metadata
+                return info, stmt.to_dataframe()
+
+            xbrl_info = {}
+            xbrl_frames = {}
+            enhanced = {}
+            for key, (name, display_name) in XBRL_STATEMENTS.items():
+                info, df = extract_statement_data(statements[key], display_name)
+                xbrl_info[name] = info
+                xbrl_frames[name] = df
+                enhanced[key] = _enhanced_statement_result(info, df)
+
+            # Also get financials object for backward compatibility
+            financials = registry.financials(filing)
+
+            # Filter to recent periods (charts keep every period of the filing)
+            raw_bs_df = financials.balance_sheet().to_dataframe()
+            raw_is_df = financials.income_statement().to_dataframe()
+            bs_df = _filter_to_recent_periods(raw_bs_df)
+            is_df = _filter_to_recent_periods(raw_is_df)
+            cf_df = _filter_to_recent_periods(financials.cashflow_statement().to_dataframe())
 
-            # Get raw data for detailed access
-            try:
-                result['raw_data'] = stmt.get_raw_data()
-            except Exception:
-                result['raw_data'] = []
-
-            # Filter to main line items (exclude dimensional/segment breakdowns)
-            # Main items have dimension=False or no dimension column
-            if 'dimension' in df.columns:
-                main_df = df[df['dimension'] == False].copy()
-            else:
-                main_df = df.copy()
-            result['main_items_df'] = main_df
-
-            return result
-
-        # Extract data for each statement
-        income_data = extract_statement_data(income_stmt, 'Income Statement')
-        balance_data = extract_statement_data(balance_stmt, 'Balance Sheet')
-        cashflow_data = extract_statement_data(cashflow_stmt, 'Cash Flow Statement')
-
-        # Also get financials object for backward compatibility
-        financials = filing.obj().financials
-        bs_df = financials.balance_sheet().to_dataframe()
-        is_df = financials.income_statement().to_dataframe()
-        cf_df = financials.cashflow_statement().to_dataframe()
-
-        # Filter to recent periods
-        def filter_to_recent_periods(df):
-            date_cols = [col for col in df.columns if isinstance(col, str) and '-' in col and col[0].isdigit()]
-            non_date_cols = [col for col in df.columns if col not in date_cols]
-            cols_to_keep = non_date_cols + date_cols[:2]
-            return df[cols_to_keep].copy()
-
-        bs_df = filter_to_recent_periods(bs_df)
-        is_df = filter_to_recent_periods(is_df)
-        cf_df = filter_to_recent_periods(cf_df)
+        except Exception as e:
+            raise RuntimeError(f"Failed to extract XBRL statements: {e}")
 
-    except Exception as e:
-        raise RuntimeError(f"Failed to extract XBRL statements: {e}")
+        # Extract fiscal period information from XBRL entity_info
+        entity_info = {}
+        try:
+            if hasattr(xbrl, 'entity_info'):
+                entity_info = {
+                    key: xbrl.entity_info.get(key)
+                    for key in ('fiscal_year', 'fiscal_period', 'annual_report', 'quarterly_report')
+                }
+        except Exception:
+            pass  # If entity_info not available, continue without it
+
+        _store_statements(cik, accession, ticker, filing, {
+            'balance_sheet': bs_df,
+            'income_statement': is_df,
+            'cash_flow': cf_df,
+            'raw_balance_sheet': raw_bs_df,
+            'raw_income_statement': raw_is_df,
+            **xbrl_frames,
+        }, metadata={'xbrl': {'statements': xbrl_info, 'entity_info': entity_info}})
+
+    income_data = enhanced['income_statement_enhanced']
+    balance_data = enhanced['balance_sheet_enhanced']
+    cashflow_data = enhanced['cash_flow_enhanced']
 
     # Step 4: Save debug information
     debug_dir = Path("financial_research_agent/output/debug_edgar")
@@ -389,9 +500,12 @@ async def extract_financial_data_enhanced(
     filing_date_str = str(filing.filing_date).replace("-", "")
 
     # Save raw DataFrames
-    bs_df.to_csv(debug_dir / f"xbrl_raw_balance_sheet_{ticker}_{filing_date_str}.csv", index=False)
-    is_df.to_csv(debug_dir / f"xbrl_raw_income_statement_{ticker}_{filing_date_str}.csv", index=False)
-    cf_df.to_csv(debug_dir / f"xbrl_raw_cashflow_{ticker}_{filing_date_str}.csv", index=False)
+    _export_debug_csvs(cik, accession, ticker, filing_date_str, debug_dir, {
+        'balance_sheet': bs_df,
+        'income_statement': is_df,
+        'cash_flow': cf_df,
+    })
+
 
     # Save markdown outputs
     if income_data.get('markdown'):
@@ -439,20 +553,11 @@ async def extract_financial_data_enhanced(
     except Exception:
         fiscal_year_end = current_period
 
-    # Extract fiscal period information from XBRL entity_info
-    fiscal_year = None
-    fiscal_period = None
-    is_annual = False
-    is_quarterly = False
-    try:
-        if hasattr(xbrl, 'entity_info'):
-            entity_info = xbrl.entity_info
-            fiscal_year = entity_info.get('fiscal_year')
-            fiscal_period = entity_info.get('fiscal_period')
-            is_annual = entity_info.get('annual_report', False)
-            is_quarterly = entity_info.get('quarterly_report', False)
-    except Exception:
-        pass  # If entity_info not available, continue without it
+    # Fiscal period information from XBRL entity_info
+    fiscal_year = entity_info.get('fiscal_year')
+    fiscal_period = entity_info.get('fiscal_period')
+    is_annual = entity_info.get('annual_report') or False
+    is_quarterly = entity_info.get('quarterly_report') or False
 
     # Return enhanced structure
     return {
@@ -461,6 +566,10 @@ async def extract_financial_data_enhanced(
         'income_statement_df': is_df,
         'cash_flow_statement_df': cf_df,
 
+        # Unfiltered DataFrames with every period of the filing (trend charts)
+        'raw_balance_sheet_df': raw_bs_df,
+        'raw_income_statement_df': raw_is_df,
+
         # Enhanced XBRL data
         'income_statement_enhanced': income_data,
         'balance_sheet_enhanced': balance_data,
@@ -486,6 +595,18 @@ async def extract_financial_data_enhanced(
     }
 
 
+async def extract_financial_data_enhanced(
+    mcp_server: Any,
+    company_name: str,
+) -> dict[str, Any]:
+    """
+    Extract enhanced XBRL financial data without blocking the event loop.
+
+    Runs _extract_financial_data_enhanced_sync on the EDGAR I/O executor.
+    """
+    return await run_edgar_io(_extract_financial_data_enhanced_sync, mcp_server, company_name)
+
+
 def generate_yoy_comparison_table(
     df: pd.DataFrame,
     statement_name: str,
@@ -686,7 +807,7 @@ def extract_key_metrics_from_statements(
     return metrics
 
 
-async def extract_risk_factors(ticker: str, use_cache: bool = True) -> dict[str, Any]:
+def _extract_risk_factors_sync(ticker: str, use_cache: bool = True) -> dict[str, Any]:
     """
     Extract Item 1A "Risk Factors" and MD&A from SEC filings using edgartools.
 
@@ -712,7 +833,7 @@ async def extract_risk_factors(ticker: str, use_cache: bool = True) -> dict[str,
         - filing_references: List of filing references for citations
         - from_cache: Boolean indicating if data was retrieved from cache
     """
-    from edgar import Company, set_identity
+    from edgar import set_identity
 
     # Import RAG manager for caching
     rag_manager = None
@@ -753,28 +874,28 @@ async def extract_risk_factors(ticker: str, use_cache: bool = True) -> dict[str,
     cached_10q = None
     if rag_manager and use_cache:
         try:
-            cached_10k = rag_manager.get_cached_filing(ticker, "10-K")
-            cached_10q = rag_manager.get_cached_filing(ticker, "10-Q")
+            cached_10k = rag_manager.get_cached_filing(ticker, "10-K", items=["item1a", "item3"])
+            cached_10q = rag_manager.get_cached_filing(ticker, "10-Q", items=["item1a", "item2"])
 
             if cached_10k:
-                print(f"Using cached 10-K for {ticker} (filed {cached_10k.get('filing_date', 'unknown')})")
+                print(f"Using cached 10-K for {ticker} (filed {cached_10k.get('_filing_date', 'unknown')})")
                 result['risk_factors_10k'] = cached_10k.get('item1a')
-                result['risk_factors_10k_date'] = cached_10k.get('filing_date')
-                result['risk_factors_10k_accession'] = cached_10k.get('accession')
+                result['risk_factors_10k_date'] = cached_10k.get('_filing_date')
+                result['risk_factors_10k_accession'] = cached_10k.get('_accession')
                 result['legal_proceedings'] = cached_10k.get('item3')
-                if cached_10k.get('filing_date'):
-                    result['filing_references'].append(f"10-K filed {cached_10k.get('filing_date')} (cached)")
+                if cached_10k.get('_filing_date'):
+                    result['filing_references'].append(f"10-K filed {cached_10k.get('_filing_date')} (cached)")
                 result['from_cache'] = True
 
             if cached_10q:
-                print(f"Using cached 10-Q for {ticker} (filed {cached_10q.get('filing_date', 'unknown')})")
+                print(f"Using cached 10-Q for {ticker} (filed {cached_10q.get('_filing_date', 'unknown')})")
                 result['risk_factors_10q'] = cached_10q.get('item1a')
-                result['risk_factors_10q_date'] = cached_10q.get('filing_date')
-                result['risk_factors_10q_accession'] = cached_10q.get('accession')
+                result['risk_factors_10q_date'] = cached_10q.get('_filing_date')
+                result['risk_factors_10q_accession'] = cached_10q.get('_accession')
                 result['mda_text'] = cached_10q.get('item2')
-                result['mda_date'] = cached_10q.get('filing_date')
-                if cached_10q.get('filing_date'):
-                    result['filing_references'].append(f"10-Q filed {cached_10q.get('filing_date')} (cached)")
+                result['mda_date'] = cached_10q.get('_filing_date')
+                if cached_10q.get('_filing_date'):
+                    result['filing_references'].append(f"10-Q filed {cached_10q.get('_filing_date')} (cached)")
                 result['from_cache'] = True
 
             # If we have both cached, we still need to fetch 8-Ks (they change frequently)
@@ -783,15 +904,15 @@ async def extract_risk_factors(ticker: str, use_cache: bool = True) -> dict[str,
             print(f"Warning: Cache lookup failed: {e}")
 
     try:
-        company = Company(ticker)
+        registry = get_filing_registry()
+        company = registry.company(ticker)
 
         # Extract 10-K risk factors (annual comprehensive list) - skip if cached
         if not cached_10k:
             try:
-                tenk_filings = company.get_filings(form="10-K")
-                if tenk_filings and len(tenk_filings) > 0:
-                    tenk = tenk_filings.latest(1)
-                    tenk_obj = tenk.obj()
+                tenk = registry.latest_filing(ticker, ["10-K"])
+                if tenk:
+                    tenk_obj = registry.filing_object(tenk)
 
                     # Prepare items for caching
                     tenk_items = {}
@@ -858,10 +979,9 @@ async def extract_risk_factors(ticker: str, use_cache: bool = True) -> dict[str,
         # Extract 10-Q risk factors and MD&A (quarterly updates) - skip if cached
         if not cached_10q:
             try:
-                tenq_filings = company.get_filings(form="10-Q")
-                if tenq_filings and len(tenq_filings) > 0:
-                    tenq = tenq_filings.latest(1)
-                    tenq_obj = tenq.obj()
+                tenq = registry.latest_filing(ticker, ["10-Q"])
+                if tenq:
+                    tenq_obj = registry.filing_object(tenq)
 
                     # Prepare items for caching
                     tenq_items = {}
@@ -976,7 +1096,16 @@ async def extract_risk_factors(ticker: str, use_cache: bool = True) -> dict[str,
     return result
 
 
-async def extract_financials_analysis_data(ticker: str) -> dict[str, Any]:
+async def extract_risk_factors(ticker: str, use_cache: bool = True) -> dict[str, Any]:
+    """
+    Extract risk factors, MD&A and recent 8-Ks without blocking the event loop.
+
+    Runs _extract_risk_factors_sync on the EDGAR I/O executor.
+    """
+    return await run_edgar_io(_extract_risk_factors_sync, ticker, use_cache)
+
+
+def _extract_financials_analysis_data_sync(ticker: str) -> dict[str, Any]:
     """
     Extract data needed for the financials agent analysis.
 
@@ -993,7 +1122,7 @@ async def extract_financials_analysis_data(ticker: str) -> dict[str, Any]:
         - segment_info: Segment reporting information
         - filing_references: List of filing references
     """
-    from edgar import Company, set_identity
+    from edgar import set_identity
 
     # Set SEC identity
     user_agent = os.getenv("SEC_EDGAR_USER_AGENT", "FinancialResearchAgent/1.0 (test@example.com)")
@@ -1013,15 +1142,15 @@ async def extract_financials_analysis_data(ticker: str) -> dict[str, Any]:
     }
 
     try:
-        company = Company(ticker)
+        registry = get_filing_registry()
+        registry.company(ticker)  # Unknown tickers fail here, not per section
 
         # Get MD&A from most recent 10-Q or 10-K
         try:
             # Try 10-Q first for most recent data
-            tenq_filings = company.get_filings(form="10-Q")
-            if tenq_filings and len(tenq_filings) > 0:
-                tenq = tenq_filings.latest(1)
-                tenq_obj = tenq.obj()
+            tenq = registry.latest_filing(ticker, ["10-Q"])
+            if tenq:
+                tenq_obj = registry.filing_object(tenq)
 
                 # Extract Item 2 - MD&A
                 try:
@@ -1046,10 +1175,9 @@ async def extract_financials_analysis_data(ticker: str) -> dict[str, Any]:
 
         # Get business description from 10-K
         try:
-            tenk_filings = company.get_filings(form="10-K")
-            if tenk_filings and len(tenk_filings) > 0:
-                tenk = tenk_filings.latest(1)
-                tenk_obj = tenk.obj()
+            tenk = registry.latest_filing(ticker, ["10-K"])
+            if tenk:
+                tenk_obj = registry.filing_object(tenk)
 
                 # Extract Item 1 - Business Description
                 try:
@@ -1095,6 +1223,15 @@ async def extract_financials_analysis_data(ticker: str) -> dict[str, Any]:
     return result
 
 
+async def extract_financials_analysis_data(ticker: str) -> dict[str, Any]:
+    """
+    Extract MD&A and business description without blocking the event loop.
+
+    Runs _extract_financials_analysis_data_sync on the EDGAR I/O executor.
+    """
+    return await run_edgar_io(_extract_financials_analysis_data_sync, ticker)
+
+
 def dataframes_to_dict_format(
     balance_sheet_df: Any,
     income_statement_df: Any,
@@ -8,7 +8,7 @@ Day 4 Implementation - SEC Cache Foundation
 import os
 import json
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Optional, Any, List, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -20,7 +20,14 @@ if not os.environ.get('EDGAR_IDENTITY'):
         'FinancialResearchAgent/1.0 (contact@example.com)'
     )
 
-from edgar import Company
+from financial_research_agent.cache.connection_pool import SQLiteConnectionPool
+from financial_research_agent.cache.filing_registry import get_filing_registry
+
+# Cached metrics/ratios older than this are refetched
+DEFAULT_CACHE_TTL_HOURS = 24
+
+# Forms whose newest filing stamps cached metrics (same registry key as edgar_tools)
+LATEST_FILING_FORMS = ["10-Q", "10-K", "20-F"]
 
 
 @dataclass
@@ -57,6 +64,7 @@ class FinancialMetrics:
     
     # Metadata
     retrieved_at: str = None
+    accession_number: Optional[str] = None  # Newest filing when the data was fetched
     
     def __post_init__(self):
         if self.retrieved_at is None:
@@ -233,14 +241,22 @@ class FinancialDataManager:
         ],
     }
     
-    def __init__(self, cache_db_path: Optional[str] = None):
+    def __init__(
+        self,
+        cache_db_path: Optional[str] = None,
+        cache_ttl_hours: float = DEFAULT_CACHE_TTL_HOURS
+    ):
         """
         Initialize the manager with optional cache database path.
         
         Args:
             cache_db_path: Path to SQLite cache database. If None, uses default location.
+            cache_ttl_hours: Age after which cached metrics and ratios are refetched
         """
         self.cache_db_path = cache_db_path or self._default_cache_path()
+        self.cache_ttl = timedelta(hours=cache_ttl_hours)
+        Path(self.cache_db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.cache_db_path)
         self._ensure_cache_tables()
     
     def _default_cache_path(self) -> str:
@@ -251,7 +267,7 @@ class FinancialDataManager:
     
     def _ensure_cache_tables(self):
         """Ensure cache tables exist"""
-        with sqlite3.connect(self.cache_db_path) as conn:
+        with self._pool.connection() as conn:
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS metrics_cache (
                     ticker TEXT,
@@ -259,6 +275,9 @@ class FinancialDataManager:
                     data JSON,
                     source TEXT,
                     cached_at TEXT,
+                    period_index INTEGER,
+                    accession_number TEXT,
+                    requested_periods INTEGER,
                     PRIMARY KEY (ticker, fiscal_year)
                 )
             ''')
@@ -268,10 +287,23 @@ class FinancialDataManager:
                     fiscal_year TEXT,
                     data JSON,
                     cached_at TEXT,
+                    period_index INTEGER,
+                    accession_number TEXT,
+                    requested_periods INTEGER,
                     PRIMARY KEY (ticker, fiscal_year)
                 )
             ''')
-            conn.commit()
+            
+            # Tables created before the read path existed lack these columns.
+            # Their rows were never read, so drop them rather than guess an order.
+            for table in ('metrics_cache', 'ratios_cache'):
+                columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if 'period_index' not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN period_index INTEGER")
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN accession_number TEXT")
+                    conn.execute(f"DELETE FROM {table}")
+                if 'requested_periods' not in columns:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN requested_periods INTEGER")
     
     def get_metrics(
         self, 
@@ -292,25 +324,18 @@ class FinancialDataManager:
         Returns:
             List of FinancialMetrics for each period
         """
-        results = []
+        # Try cache first
+        if use_cache and not force_refresh:
+            cached = self._get_cached_metrics(ticker, periods)
+            if cached:
+                return cached
         
-        for period_idx in range(periods):
-            # Try cache first
-            if use_cache and not force_refresh:
-                cached = self._get_cached_metrics(ticker, period_idx)
-                if cached:
-                    results.append(cached)
-                    continue
-            
-            # Fetch from source
-            metrics = self._fetch_metrics(ticker, periods)
-            if metrics:
-                for m in metrics:
-                    self._cache_metrics(m)
-                results.extend(metrics)
-                break  # Already got all periods
+        # Fetch from source
+        metrics = self._fetch_metrics(ticker, periods)
+        if metrics:
+            self._cache_metrics(ticker, metrics, periods)
         
-        return results[:periods]
+        return metrics[:periods]
     
     def _fetch_metrics(self, ticker: str, periods: int) -> List[FinancialMetrics]:
         """Fetch metrics using edgartools-first strategy with XBRL fallback"""
@@ -335,7 +360,8 @@ class FinancialDataManager:
     def _try_edgartools(self, ticker: str, periods: int) -> Optional[List[FinancialMetrics]]:
         """Try to get data from EdgarTools high-level API"""
         try:
-            company = Company(ticker)
+            company = get_filing_registry().company(ticker)
+            accession = self._resolve_latest_accession(ticker)
             
             # Get all three statements
             income = company.income_statement(periods=periods)
@@ -382,6 +408,7 @@ class FinancialDataManager:
                     profit_margin=income_ctx.get('key_metrics', {}).get(f'profit_margin_{period_key}'),
                     operating_margin=income_ctx.get('key_metrics', {}).get(f'operating_margin_{period_key}'),
                     revenue_growth=income_ctx.get('key_metrics', {}).get('revenue_growth_rate'),
+                    accession_number=accession,
                 )
                 
                 results.append(metrics)
@@ -500,30 +527,156 @@ class FinancialDataManager:
         
         return merged
     
-    def _get_cached_metrics(self, ticker: str, period_idx: int) -> Optional[FinancialMetrics]:
-        """Get cached metrics"""
-        # For now, simple implementation
-        return None
+    def _resolve_latest_accession(self, ticker: str) -> Optional[str]:
+        """
+        Accession number of the newest 10-Q/10-K/20-F for a ticker.
+        
+        Resolved through the filing registry, which shares the lookup with
+        edgar_tools and keeps it for its resolution TTL, so repeated calls
+        cost no SEC request.
+        """
+        try:
+            filing = get_filing_registry().latest_filing(ticker, LATEST_FILING_FORMS, amendments=False)
+        except Exception as e:
+            print(f"Could not resolve latest filing for {ticker}: {e}")
+            return None
+        if filing is None:
+            return None
+        return getattr(filing, 'accession_no', None) or getattr(filing, 'accession_number', None)
     
-    def _cache_metrics(self, metrics: FinancialMetrics):
-        """Cache metrics to database"""
-        with sqlite3.connect(self.cache_db_path) as conn:
-            conn.execute('''
-                INSERT OR REPLACE INTO metrics_cache (ticker, fiscal_year, data, source, cached_at)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                metrics.ticker,
-                metrics.fiscal_year,
-                json.dumps(asdict(metrics)),
-                metrics.source,
-                datetime.utcnow().isoformat()
-            ))
-            conn.commit()
-    
-    def get_ratios(self, ticker: str, periods: int = 1) -> List[CalculatedRatios]:
+    def _read_cache(self, table: str, ticker: str, periods: int) -> Optional[List[dict]]:
+        """
+        Read fresh cached rows for a ticker, newest period first.
+        
+        Returns None on a miss: fewer than `periods` rows (unless they were
+        written for a request of at least `periods`, i.e. the source has no
+        more), any row older than the TTL, or the rows were fetched from an
+        older filing than the newest one now on record.
+        """
+        with self._pool.connection() as conn:
+            rows = conn.execute(f'''
+                SELECT data, cached_at, accession_number, requested_periods
+                FROM {table}
+                WHERE ticker = ?
+                ORDER BY period_index
+                LIMIT ?
+            ''', (ticker.upper(), periods)).fetchall()
+        
+        if not rows:
+            return None
+        if len(rows) < periods and (rows[0]['requested_periods'] or 0) < periods:
+            return None
+        
+        oldest = min(datetime.fromisoformat(row['cached_at']) for row in rows)
+        if datetime.utcnow() - oldest > self.cache_ttl:
+            return None
+        
+        # Rows without a stamp (source had no filing to record) expire by TTL only
+        stamps = {row['accession_number'] for row in rows if row['accession_number']}
+        if stamps:
+            latest_accession = self._resolve_latest_accession(ticker)
+            if latest_accession and stamps != {latest_accession}:
+                return None
+        
+        try:
+            return [json.loads(row['data']) for row in rows]
+        except (json.JSONDecodeError, TypeError):
+            return None
+    
+    def _write_cache(
+        self,
+        table: str,
+        ticker: str,
+        records: List[Tuple[str, dict, Optional[str]]],
+        accession: Optional[str],
+        requested_periods: int,
+    ):
+        """Replace every cached row for a ticker with (fiscal_year, data, source) records."""
+        now = datetime.utcnow().isoformat()
+        
+        with self._pool.transaction() as conn:
+            conn.execute(f"DELETE FROM {table} WHERE ticker = ?", (ticker.upper(),))
+            
+            if table == 'metrics_cache':
+                conn.executemany('''
+                    INSERT OR REPLACE INTO metrics_cache
+                        (ticker, fiscal_year, data, source, cached_at, period_index, accession_number,
+                         requested_periods)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [
+                    (ticker.upper(), fiscal_year, json.dumps(data), source, now, i, accession, requested_periods)
+                    for i, (fiscal_year, data, source) in enumerate(records)
+                ])
+            else:
+                conn.executemany('''
+                    INSERT OR REPLACE INTO ratios_cache
+                        (ticker, fiscal_year, data, cached_at, period_index, accession_number, requested_periods)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', [
+                    (ticker.upper(), fiscal_year, json.dumps(data), now, i, accession, requested_periods)
+                    for i, (fiscal_year, data, _) in enumerate(records)
+                ])
+    
+    def _get_cached_metrics(self, ticker: str, periods: int) -> Optional[List[FinancialMetrics]]:
+        """Get cached metrics for the latest `periods` periods, or None on a miss"""
+        cached = self._read_cache('metrics_cache', ticker, periods)
+        return [FinancialMetrics(**data) for data in cached] if cached else None
+    
+    def _cache_metrics(self, ticker: str, metrics: List[FinancialMetrics], requested_periods: int):
+        """Cache metrics to database (newest period first), stamped with their filing"""
+        self._write_cache(
+            'metrics_cache',
+            ticker,
+            [(m.fiscal_year, asdict(m), m.source) for m in metrics],
+            metrics[0].accession_number,
+            requested_periods
+        )
+    
+    def _get_cached_ratios(self, ticker: str, periods: int) -> Optional[List[CalculatedRatios]]:
+        """Get cached ratios for the latest `periods` periods, or None on a miss"""
+        cached = self._read_cache('ratios_cache', ticker, periods)
+        return [CalculatedRatios(**data) for data in cached] if cached else None
+    
+    def _cache_ratios(
+        self,
+        ticker: str,
+        ratios: List[CalculatedRatios],
+        accession: Optional[str],
+        requested_periods: int,
+    ):
+        """Cache calculated ratios to database (newest period first)"""
+        self._write_cache(
+            'ratios_cache',
+            ticker,
+            [(r.fiscal_year, asdict(r), None) for r in ratios],
+            accession,
+            requested_periods
+        )
+    
+    def invalidate(self, ticker: str):
+        """Drop cached metrics and ratios for a ticker"""
+        with self._pool.transaction() as conn:
+            for table in ('metrics_cache', 'ratios_cache'):
+                conn.execute(f"DELETE FROM {table} WHERE ticker = ?", (ticker.upper(),))
+    
+    def get_ratios(
+        self,
+        ticker: str,
+        periods: int = 1,
+        use_cache: bool = True,
+        force_refresh: bool = False
+    ) -> List[CalculatedRatios]:
         """Get calculated ratios for a company"""
-        metrics_list = self.get_metrics(ticker, periods)
-        return [RatioCalculator.calculate_all(m) for m in metrics_list]
+        if use_cache and not force_refresh:
+            cached = self._get_cached_ratios(ticker, periods)
+            if cached:
+                return cached
+        
+        metrics_list = self.get_metrics(ticker, periods, use_cache=use_cache, force_refresh=force_refresh)
+        ratios = [RatioCalculator.calculate_all(m) for m in metrics_list]
+        if ratios:
+            self._cache_ratios(ticker, ratios, metrics_list[0].accession_number, periods)
+        return ratios
     
     def compare(
         self, 
@@ -5,7 +5,8 @@ import json
 import logging
 import shutil
 import time
-from collections.abc import Sequence
+from collections.abc import Awaitable, Sequence
+from contextlib import AsyncExitStack
 from datetime import datetime
 from pathlib import Path
 
@@ -31,7 +32,7 @@ from .agent_definitions.writer_agent_enhanced import ComprehensiveFinancialRepor
 from .agent_definitions.banking_ratios_agent import banking_ratios_agent
 from .models.banking_ratios import BankingRegulatoryRatios
 from .utils.sector_detection import detect_industry_sector, should_analyze_banking_ratios, get_peer_group
-from .config import AgentConfig, EdgarConfig
+from .config import AgentConfig
 from .formatters import format_financial_statements, format_financial_statements_gt, format_financial_metrics
 from .printer import Printer
 from .cache import FinancialDataCache
@@ -39,6 +40,10 @@ from .financial_data_manager import FinancialDataManager, RatioCalculator, Finan
 from .xbrl_calculation import get_calculation_parser_for_filing
 from .cost_tracker import CostTracker
 from .edgar_tools import extract_risk_factors, extract_financials_analysis_data
+from .utils.stage_graph import STAGE_TIMINGS_FILENAME, Stage, StageGraph
+from .utils.edgar_executor import run_edgar_io
+from .utils.event_loop import LoopLagMonitor
+from .utils.mcp_pool import MCPServerPool, get_edgar_server_pool
 
 
 async def _financials_extractor(run_result: RunResult) -> str:
@@ -141,8 +146,10 @@ class EnhancedFinancialResearchManager:
         # Create a timestamped session directory for this run
         self.session_dir: Path | None = None
 
-        # EDGAR MCP server (initialized in run())
+        # EDGAR MCP server (leased from the process-level pool in run())
         self.edgar_server: MCPServerStdio | None = None
+        self._edgar_pool: MCPServerPool | None = None
+        self._edgar_lease: AsyncExitStack | None = None
         self.edgar_enabled = AgentConfig.ENABLE_EDGAR_INTEGRATION
 
         # Progress callback for web interface (optional)
@@ -168,6 +175,9 @@ class EnhancedFinancialResearchManager:
         # XBRL validation warnings (populated during metrics gathering)
         self.xbrl_warnings: list[str] = []
 
+        # Extracted statements of the current run (reused by chart generation)
+        self.statements_data: dict | None = None
+
     def _report_progress(self, progress: float, description: str) -> None:
         """Report progress to callback if provided."""
         if self.progress_callback:
@@ -229,6 +239,7 @@ class EnhancedFinancialResearchManager:
         # Normalize ticker to ADR if applicable (e.g., NAB -> NABZY)
         from financial_research_agent.utils.sector_detection import normalize_ticker
         self.ticker = normalize_ticker(ticker) if ticker else None
+        self.statements_data = None
 
         # Create timestamped session directory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -271,105 +282,16 @@ class EnhancedFinancialResearchManager:
                 # Save the original query
                 self._save_output("00_query.md", f"# Original Query\n\n{query}\n")
 
-                self._report_progress(0.15, "Planning search strategy...")
-                search_plan = await self._plan_searches(query)
-
-                # PERFORMANCE OPTIMIZATION: Run web search and EDGAR queries in parallel
-                edgar_results = None
-                metrics_results = None
-
-                if self.edgar_enabled and self.edgar_server:
-                    self._report_progress(0.20, "Gathering data from web and SEC EDGAR in parallel...")
-
-                    # Run web search and EDGAR data gathering concurrently
-                    search_task = asyncio.create_task(self._perform_searches(search_plan))
-                    edgar_task = asyncio.create_task(self._gather_edgar_data(query, search_plan))
-
-                    # Wait for both to complete
-                    search_results, edgar_results = await asyncio.gather(search_task, edgar_task)
-
-                    self._report_progress(0.40, "Extracting financial statements (40+ line items)...")
-                    # Gather financial metrics and statements
-                    metrics_results = await self._gather_financial_metrics(query, ticker=self.ticker)
-
-                    # If banking sector, gather regulatory ratios (TIER 1)
-                    banking_ratios_result = None
-                    if self.ticker and metrics_results:
-                        # Get SIC code and company name for intelligent sector detection
-                        # metrics_results is a FinancialMetrics Pydantic model, not a dict
-                        sic_code = getattr(metrics_results, 'sic_code', None)
-                        company_name = getattr(metrics_results, 'company_name', None)
-                        sector = detect_industry_sector(self.ticker, sic_code=sic_code, company_name=company_name)
-                        if should_analyze_banking_ratios(sector):
-                            self._report_progress(0.48, "Extracting banking regulatory ratios...")
-                            banking_ratios_result = await self._gather_banking_ratios(self.ticker, sector)
-
-                    self._report_progress(0.55, "Running specialist financial analyses...")
-                    # Gather specialist analyses and save separately - pass metrics_results
-                    await self._gather_specialist_analyses(query, search_results, metrics_results)
-
-                    # Generate visualization charts (optional, non-blocking)
-                    if metrics_results and self.ticker:
-                        self._report_progress(0.65, "Generating interactive charts...")
-                        try:
-                            from financial_research_agent.visualization import generate_charts_for_analysis
-                            charts_count = generate_charts_for_analysis(
-                                self.session_dir,
-                                ticker=self.ticker,
-                                metrics_results=metrics_results
-                            )
-                            if charts_count > 0:
-                                logger.info(f"Generated {charts_count} visualization charts")
-                        except Exception as e:
-                            logger.warning(f"Failed to generate charts (non-critical): {e}")
-                            # Don't fail the analysis if charts fail
-
-                else:
-                    # EDGAR not enabled - just run web search
-                    self._report_progress(0.20, "Searching web sources...")
-                    search_results = await self._perform_searches(search_plan)
-
-                # Generate visualization charts (works with or without EDGAR MCP)
-                # Charts use edgartools directly, not MCP
-                if self.ticker:
-                    self._report_progress(0.60, "Generating interactive charts...")
-                    try:
-                        from financial_research_agent.visualization import generate_charts_for_analysis
-                        charts_count = generate_charts_for_analysis(
-                            self.session_dir,
-                            ticker=self.ticker,
-                            metrics_results=metrics_results  # May be None if EDGAR disabled
-                        )
-                        if charts_count > 0:
-                            logger.info(f"Generated {charts_count} visualization charts")
-                            # List chart files created for debugging (Railway file verification)
-                            chart_files = list(self.session_dir.glob("chart_*.json")) + list(self.session_dir.glob("chart_*.png"))
-                            logger.info(f"📊 Chart files in {self.session_dir.name}: {[f.name for f in chart_files]}")
-                    except Exception as e:
-                        logger.warning(f"Failed to generate charts (non-critical): {e}")
-                        # Don't fail the analysis if charts fail
-
-                self._report_progress(0.70, "Synthesizing comprehensive research report...")
-                report = await self._write_report(query, search_results, edgar_results, metrics_results)
-
-                # Run deterministic validation checks before LLM verification
-                self._report_progress(0.85, "Validating financial data quality...")
-                validation_errors = self._validate_financial_statements()
-                if validation_errors:
-                    error_msg = "\n\n".join(validation_errors)
-                    self.console.print(f"\n[red bold]⚠️  Data Quality Issues Detected:[/red bold]")
-                    self.console.print(f"[yellow]{error_msg}[/yellow]\n")
-
-                    # Append to error log
-                    if self.session_dir:
-                        error_file = self.session_dir / "error_log.txt"
-                        with open(error_file, 'a') as f:
-                            f.write(f"\n\n=== Validation Errors ({datetime.now().isoformat()}) ===\n")
-                            f.write(error_msg + "\n")
-
-                self._report_progress(0.90, "Verifying report accuracy...")
-                verification = await self._verify_report(report)
+                # Stages start as soon as their inputs resolve (see _build_stage_graph)
+                graph = self._build_stage_graph(query)
+                lag_monitor = LoopLagMonitor()
+                try:
+                    async with lag_monitor:
+                        results = await graph.run()
+                finally:
+                    self._save_stage_timings(graph, lag_monitor.stats())
 
+                report = results["report"]
                 final_summary = f"Report complete\n\n{report.executive_summary}"
                 self.printer.update_item("final_report", final_summary, is_done=True)
                 self._report_progress(0.95, "Finalizing reports...")
@@ -388,36 +310,185 @@ class EnhancedFinancialResearchManager:
             self.console.print(f"📁 [bold]All reports saved to:[/bold] [cyan]{self.session_dir.absolute()}[/cyan]\n")
 
         finally:
-            # Cleanup EDGAR server
-            if self.edgar_server:
-                await self.edgar_server.cleanup()
+            await self._release_edgar_server()
 
-    async def _initialize_edgar_server(self) -> None:
-        """Initialize and connect to the SEC EDGAR MCP server."""
+    def _build_stage_graph(self, query: str) -> StageGraph:
+        """
+        Declare the research stages and their inputs.
+
+        Deterministic XBRL extraction (metrics) only needs the ticker, so it
+        starts immediately and overlaps planning, web searches and the EDGAR
+        agent. EDGAR stages are only registered when the MCP server is up.
+        """
+        graph = StageGraph(on_stage_start=lambda stage: self._on_stage_start(graph, stage))
+        edgar_available = bool(self.edgar_enabled and self.edgar_server)
+
+        async def plan():
+            return await self._plan_searches(query)
+
+        async def search(plan):
+            return await self._perform_searches(plan)
+
+        graph.add_stage("plan", plan, description="Planning search strategy...")
+        graph.add_stage(
+            "search", search, inputs=("plan",),
+            description="Gathering data from web and SEC EDGAR in parallel..." if edgar_available else "Searching web sources..."
+        )
+
+        report_inputs = ["search"]
+        validation_inputs = []
+        chart_inputs = []
+
+        if edgar_available:
+            async def edgar(plan):
+                return await self._gather_edgar_data(query, plan)
+
+            async def metrics():
+                return await self._gather_financial_metrics(query, ticker=self.ticker)
+
+            async def banking_ratios(metrics):
+                # If banking sector, gather regulatory ratios (TIER 1)
+                if not (self.ticker and metrics):
+                    return None
+                # Get SIC code and company name for intelligent sector detection
+                # metrics is a FinancialMetrics Pydantic model, not a dict
+                sic_code = getattr(metrics, 'sic_code', None)
+                company_name = getattr(metrics, 'company_name', None)
+                sector = detect_industry_sector(self.ticker, sic_code=sic_code, company_name=company_name)
+                if not should_analyze_banking_ratios(sector):
+                    return None
+                return await self._gather_banking_ratios(self.ticker, sector)
+
+            # The specialists share no outputs, so each is its own stage: risk
+            # only needs the searches and starts before the statements are extracted
+            async def financials(search, metrics):
+                return await self._run_specialist(
+                    "financials", self._run_financials_analysis(query, search, metrics)
+                )
+
+            async def risk(search):
+                return await self._run_specialist("risk", self._run_risk_analysis(query, search))
+
+            self._specialist_outcomes = dict.fromkeys(("financials", "risk"))
+
+            graph.add_stage("edgar", edgar, inputs=("plan",))
+            graph.add_stage("metrics", metrics, description="Extracting financial statements (40+ line items)...")
+            graph.add_stage("banking_ratios", banking_ratios, inputs=("metrics",))
+            graph.add_stage(
+                "financials", financials, inputs=("search", "metrics"),
+                description="Running specialist financial analysis..."
+            )
+            graph.add_stage("risk", risk, inputs=("search",), description="Running specialist risk analysis...")
+
+            report_inputs += ["edgar", "metrics", "financials", "risk"]
+            validation_inputs = ["metrics"]
+            chart_inputs = ["metrics"]
+
+        if self.ticker:
+            # Charts run once, alongside the writer; with EDGAR they reuse the
+            # statements extracted by the metrics stage, without it they fetch
+            # the filing through edgartools. Nothing waits on them but the run itself.
+            async def charts(metrics=None):
+                await run_edgar_io(self._generate_charts, metrics, self.statements_data)
+
+            graph.add_stage("charts", charts, inputs=chart_inputs)
+
+        async def report(search, edgar=None, metrics=None, financials=None, risk=None):
+            return await self._write_report(query, search, edgar, metrics)
+
+        async def validation(metrics=None):
+            # Deterministic checks on the extracted statements (before LLM verification)
+            self._report_validation_errors(self._validate_financial_statements())
+
+        async def verification(report):
+            return await self._verify_report(report)
+
+        graph.add_stage(
+            "report", report, inputs=report_inputs,
+            description="Synthesizing comprehensive research report..."
+        )
+        graph.add_stage(
+            "validation", validation, inputs=validation_inputs,
+            description="Validating financial data quality..."
+        )
+        graph.add_stage("verification", verification, inputs=("report",), description="Verifying report accuracy...")
+
+        return graph
+
+    def _on_stage_start(self, graph: StageGraph, stage: Stage) -> None:
+        """Report progress as the share of finished stages."""
+        if not stage.description:
+            return
+        finished = sum(1 for record in graph.records.values() if record.status == "done")
+        self._report_progress(0.10 + 0.80 * finished / max(len(graph.records), 1), stage.description)
+
+    def _save_stage_timings(self, graph: StageGraph, loop_lag: dict | None = None) -> None:
+        """Save per-stage start/end times (and event loop lag) to the session directory."""
+        if self.session_dir is None or not graph.records:
+            return
         try:
-            self.printer.update_item("edgar_init", "Initializing SEC EDGAR connection (first run may take 30-60s to download)...")
+            graph.save_timings(self.session_dir / STAGE_TIMINGS_FILENAME, event_loop_lag=loop_lag)
+        except Exception as e:
+            logger.warning(f"Failed to save stage timings: {e}")
+            return
 
-            # Create MCP server for EDGAR
-            params = {
-                "command": EdgarConfig.MCP_SERVER_COMMAND,
-                "args": EdgarConfig.MCP_SERVER_ARGS,
-                "env": EdgarConfig.get_mcp_env(),
-            }
-            # Increase timeout for first run (uvx needs to download package)
-            # Default is 5 seconds, we increase to 60 seconds for first run
-            self.edgar_server = MCPServerStdio(
-                params=params,
-                client_session_timeout_seconds=60.0,  # Increased from default 5.0
+        summary = ", ".join(
+            f"{stage['name']} {stage['duration_s']:.1f}s"
+            for stage in graph.timings()["stages"]
+            if stage["duration_s"] is not None
+        )
+        self.console.print(f"[dim]⏱️  Stage timings ({graph.total_s:.1f}s total): {summary}[/dim]")
+        if loop_lag and loop_lag["samples"]:
+            self.console.print(
+                f"[dim]⏱️  Event loop lag: max {loop_lag['max_lag_ms']:.0f}ms, "
+                f"p95 {loop_lag['p95_lag_ms']:.0f}ms, {loop_lag['stalls']} stalls[/dim]"
+            )
+
+    def _generate_charts(self, metrics_results: FinancialMetrics | None, statements_data: dict | None = None) -> None:
+        """Generate visualization charts (optional, non-critical)."""
+        try:
+            from financial_research_agent.visualization import generate_charts_for_analysis
+            charts_count = generate_charts_for_analysis(
+                self.session_dir,
+                ticker=self.ticker,
+                metrics_results=metrics_results,  # May be None if EDGAR disabled
+                statements_data=statements_data,  # None: fetched from SEC
             )
+            if charts_count > 0:
+                logger.info(f"Generated {charts_count} visualization charts")
+                # List chart files created for debugging (Railway file verification)
+                chart_files = list(self.session_dir.glob("chart_*.json")) + list(self.session_dir.glob("chart_*.png"))
+                logger.info(f"📊 Chart files in {self.session_dir.name}: {[f.name for f in chart_files]}")
+        except Exception as e:
+            logger.warning(f"Failed to generate charts (non-critical): {e}")
+            # Don't fail the analysis if charts fail
+
+    def _report_validation_errors(self, validation_errors: list[str]) -> None:
+        """Print data quality issues and append them to the session error log."""
+        if not validation_errors:
+            return
 
-            # Connect to the server
-            await self.edgar_server.connect()
+        error_msg = "\n\n".join(validation_errors)
+        self.console.print(f"\n[red bold]⚠️  Data Quality Issues Detected:[/red bold]")
+        self.console.print(f"[yellow]{error_msg}[/yellow]\n")
 
-            # Optional: Apply tool filtering
-            if EdgarConfig.ALLOWED_EDGAR_TOOLS:
-                self.edgar_server.tool_filter = {
-                    "allowed_tool_names": EdgarConfig.ALLOWED_EDGAR_TOOLS
-                }
+        # Append to error log
+        if self.session_dir:
+            error_file = self.session_dir / "error_log.txt"
+            with open(error_file, 'a') as f:
+                f.write(f"\n\n=== Validation Errors ({datetime.now().isoformat()}) ===\n")
+                f.write(error_msg + "\n")
+
+    async def _initialize_edgar_server(self) -> None:
+        """Lease a connected SEC EDGAR MCP server from the process-level pool."""
+        try:
+            self.printer.update_item("edgar_init", "Initializing SEC EDGAR connection (first run may take 30-60s to download)...")
+
+            # Servers stay connected between runs (web app); the first lease
+            # starts the pool, which may take a while as uvx downloads the package
+            self._edgar_pool = get_edgar_server_pool()
+            self._edgar_lease = AsyncExitStack()
+            self.edgar_server = await self._edgar_lease.enter_async_context(self._edgar_pool.lease())
 
             self.printer.update_item("edgar_init", "SEC EDGAR connected", is_done=True)
 
@@ -426,13 +497,24 @@ class EnhancedFinancialResearchManager:
             self.console.print("[yellow]Continuing without EDGAR data...[/yellow]")
 
             # Provide helpful troubleshooting tips
-            if "Timed out" in str(e):
+            if "Timed out" in str(e) or isinstance(e, TimeoutError):
                 self.console.print("[yellow]Tip: First run may take longer as uvx downloads the package.[/yellow]")
                 self.console.print("[yellow]Try running again - subsequent runs will be faster.[/yellow]")
 
-            self.edgar_server = None
+            await self._release_edgar_server()
             self.edgar_enabled = False
 
+    async def _release_edgar_server(self) -> None:
+        """Return the leased EDGAR server; stop the pool unless it outlives runs (web app)."""
+        lease, self._edgar_lease = self._edgar_lease, None
+        pool, self._edgar_pool = self._edgar_pool, None
+        self.edgar_server = None
+
+        if lease:
+            await lease.aclose()
+        if pool and not pool.persistent and pool.active_leases == 0:
+            await pool.shutdown()
+
     def _save_output(self, filename: str, content: str) -> None:
         """Save output to a file in the session directory."""
         if self.session_dir is None:
@@ -782,7 +864,7 @@ class EnhancedFinancialResearchManager:
             if ticker:
                 try:
                     self.printer.update_item("metrics", "Pre-calculating financial ratios via unified manager...")
-                    unified_ratios = self._get_unified_ratios(ticker)
+                    unified_ratios = await run_edgar_io(self._get_unified_ratios, ticker)
                     if unified_ratios:
                         ratio_count = sum(1 for k, v in unified_ratios.items() 
                                          if v is not None and k not in ('source', 'fiscal_year'))
@@ -801,15 +883,18 @@ class EnhancedFinancialResearchManager:
                     lookup_key
                 )
 
-                    # Extract official company name from statements_data if available
-                    if statements_data and 'company_name' in statements_data:
-                        company_name = statements_data['company_name']
+                # Extract official company name from statements_data if available
+                if statements_data and 'company_name' in statements_data:
+                    company_name = statements_data['company_name']
 
-                except Exception as e:
-                    self.console.print(f"[yellow]Warning: Deterministic extraction failed: {e}[/yellow]")
-                    import traceback
-                    traceback.print_exc()
-                    self.console.print("[yellow]Falling back to LLM-based extraction...[/yellow]")
+                # Charts reuse the unfiltered statements instead of refetching the filing
+                self.statements_data = statements_data
+
+            except Exception as e:
+                self.console.print(f"[yellow]Warning: Deterministic extraction failed: {e}[/yellow]")
+                import traceback
+                traceback.print_exc()
+                self.console.print("[yellow]Falling back to LLM-based extraction...[/yellow]")
 
             # Continue with verification if we have data
             if statements_data:
@@ -856,7 +941,7 @@ class EnhancedFinancialResearchManager:
                     # Try to get filing URL from statements_data
                     filing_url = statements_data.get('filing_url')
                     if filing_url:
-                        self.xbrl_warnings = self._validate_xbrl_calculations(statements_data, filing_url)
+                        self.xbrl_warnings = await run_edgar_io(self._validate_xbrl_calculations, statements_data, filing_url)
                 except Exception as e:
                     self.console.print(f"[dim]XBRL validation skipped: {e}[/dim]")
 
@@ -916,11 +1001,6 @@ class EnhancedFinancialResearchManager:
                         self.console.print(f"[yellow]Warning: YoY table generation failed: {e}[/yellow]")
                         import traceback
                         traceback.print_exc()
-                
-                # PERFORMANCE: Cache the data NOW (after YoY generation) so cached data includes computed fields
-                if not cached_statements and statements_data:
-                    self.cache.set(lookup_key, "financial_statements", statements_data)
-                    self.console.print(f"[green bold]✓ Cached financial data with YoY tables for {lookup_key}[/green bold]")
 
             # Step 2: Clone metrics agent with MCP server attached
             metrics_with_mcp = financial_metrics_agent.clone(mcp_servers=[self.edgar_server])
@@ -1105,14 +1185,14 @@ Use get_company_facts to get ALL available XBRL data."""
                     json.dump(metadata, f, indent=2)
 
             # Copy raw XBRL CSV files to output folder for audit trail
-            self._copy_xbrl_audit_files(company_name)
+            await run_edgar_io(self._copy_xbrl_audit_files, company_name)
             
             # NEW: Merge pre-calculated ratios from unified manager into metrics
             # Uses ratios retrieved earlier in the method (avoids duplicate API call)
             if ticker:
                 if unified_ratios is None:
                     # Fetch if not already done earlier (fallback)
-                    unified_ratios = self._get_unified_ratios(ticker)
+                    unified_ratios = await run_edgar_io(self._get_unified_ratios, ticker)
                 
                 if unified_ratios:
                     supplemented = []
@@ -1375,22 +1455,62 @@ Extract the most recent period data and note the reporting period.
             self.printer.update_item("banking_ratios", "Banking ratios unavailable", is_done=True)
             return None
 
-    async def _gather_specialist_analyses(self, query: str, search_results: Sequence[str], metrics_results = None) -> None:
-        """Gather detailed financial and risk analyses and save separately."""
-        if not self.edgar_server:
+    async def _run_specialist(self, name: str, analysis: Awaitable[bool]) -> bool:
+        """
+        Run one specialist analysis and keep the shared progress line current.
+
+        Each specialist isolates its own failures, cost tracking and output file;
+        the line is finished once every registered specialist has reported.
+
+        Returns:
+            True if the analysis was saved
+        """
+        self._update_specialist_status()
+        self._specialist_outcomes[name] = await analysis
+        self._update_specialist_status()
+        return self._specialist_outcomes[name]
+
+    def _update_specialist_status(self) -> None:
+        """Show pending specialists, or the final outcome once all have finished."""
+        pending = [name for name, succeeded in self._specialist_outcomes.items() if succeeded is None]
+        if pending:
+            self.printer.update_item(
+                "specialist_analysis",
+                f"Running specialist analyses ({', '.join(pending)})..."
+            )
             return
 
-        self.printer.update_item("specialist_analysis", "Running specialist analyses...")
+        failed = [name for name, succeeded in self._specialist_outcomes.items() if not succeeded]
+        if not failed:
+            self.printer.mark_item_done("specialist_analysis")
+        elif len(failed) < len(self._specialist_outcomes):
+            self.printer.update_item(
+                "specialist_analysis",
+                f"Specialist analyses partially complete ({', '.join(failed)} unavailable)",
+                is_done=True
+            )
+        else:
+            self.printer.update_item("specialist_analysis", "Specialist analyses unavailable", is_done=True)
 
-        try:
-            # Pre-extract risk factors using edgartools (replacing MCP for massive cost savings)
-            risk_factors_data = None
-            try:
-                self.printer.update_item("specialist_analysis", "Extracting SEC risk factors...")
-                risk_factors_data = await extract_risk_factors(self.ticker)
-            except Exception as e:
-                logger.warning(f"Could not extract risk factors: {e}")
+    def _log_specialist_error(self, name: str, error: Exception) -> None:
+        """Report a failed specialist and save the traceback to the error log."""
+        import traceback
+        self.console.print(f"[yellow]Warning: {name.title()} specialist analysis failed: {error}[/yellow]")
+        # Save error details to file
+        if self.session_dir:
+            error_file = self.session_dir / "error_log.txt"
+            with open(error_file, 'a') as f:
+                f.write(f"\n\n=== {name.title()} Specialist Analysis Error ({datetime.now().isoformat()}) ===\n")
+                f.write(traceback.format_exc())
 
+    async def _run_financials_analysis(self, query: str, search_results: Sequence[str], metrics_results = None) -> bool:
+        """
+        Run the financials specialist and save 05_financial_analysis.md.
+
+        Returns:
+            True if the analysis was saved
+        """
+        try:
             # Clone financials agent with EDGAR MCP server access (still needs MCP for MD&A)
             financials_with_edgar = financials_agent_enhanced.clone(mcp_servers=[self.edgar_server])
 
@@ -1445,11 +1565,7 @@ Extract the most recent period data and note the reporting period.
                                 financials_input += "**CRITICAL:** For Section 8 (Year-over-Year Comparison Table), copy these exact values into your table.\n"
                                 financials_input += "Do NOT use placeholders like '[per 03_financial_statements.md]' - use the actual dollar amounts and percentages shown above.\n\n"
 
-            # Prepare input data for risk agent (simpler - just context)
-            risk_input = f"Query: {query}\n\nContext from research:\n{search_results[:3]}"
-
             # Run financial analysis with pre-extracted data
-            self.printer.update_item("specialist_analysis", "Running financial analysis...")
             financials_result = await Runner.run(financials_with_edgar, financials_input, max_turns=AgentConfig.MAX_AGENT_TURNS)
 
             # Track financials agent cost
@@ -1483,8 +1599,26 @@ Extract the most recent period data and note the reporting period.
 
             self._save_output("05_financial_analysis.md", financials_content)
 
-            # Run risk analysis with PRE-EXTRACTED data (no MCP - massive cost savings)
-            self.printer.update_item("specialist_analysis", "Running risk analysis...")
+            return True
+
+        except Exception as e:
+            self._log_specialist_error("financials", e)
+            return False
+
+    async def _run_risk_analysis(self, query: str, search_results: Sequence[str]) -> bool:
+        """
+        Run the risk specialist and save 06_risk_analysis.md.
+
+        Returns:
+            True if the analysis was saved
+        """
+        try:
+            # Pre-extract risk factors using edgartools (replacing MCP for massive cost savings)
+            risk_factors_data = None
+            try:
+                risk_factors_data = await extract_risk_factors(self.ticker)
+            except Exception as e:
+                logger.warning(f"Could not extract risk factors: {e}")
 
             # Build risk input with pre-extracted SEC data
             risk_input = f"Analyze the key risks and risk factors for {self.ticker}.\n\n"
@@ -1576,18 +1710,11 @@ Extract the most recent period data and note the reporting period.
 
             self._save_output("06_risk_analysis.md", risk_content)
 
-            self.printer.mark_item_done("specialist_analysis")
+            return True
 
         except Exception as e:
-            import traceback
-            self.console.print(f"[yellow]Warning: Specialist analyses failed: {e}[/yellow]")
-            # Save error details to file
-            if self.session_dir:
-                error_file = self.session_dir / "error_log.txt"
-                with open(error_file, 'a') as f:
-                    f.write(f"\n\n=== Specialist Analyses Error ({datetime.now().isoformat()}) ===\n")
-                    f.write(traceback.format_exc())
-            self.printer.update_item("specialist_analysis", "Specialist analyses unavailable", is_done=True)
+            self._log_specialist_error("risk", e)
+            return False
 
     async def _write_report(
         self, query: str, search_results: Sequence[str], edgar_results: str | None, metrics_results: FinancialMetrics | None
@@ -0,0 +1,250 @@
+"""
+Semantic answer cache for RAG synthesis.
+
+Synthesizing an answer runs an LLM agent, which costs seconds and tokens even
+when the same question was just answered from the same knowledge-base data.
+This cache stores synthesized answers keyed by:
+
+- the normalized query embedding (matched by cosine similarity),
+- the ticker / analysis-type filters (and embedding model),
+- the exact set of chunk IDs retrieved for the query.
+
+Because chunk IDs are content hashes, a re-indexed analysis retrieves a
+different chunk set and naturally misses. Entries that reference a chunk
+whose metadata was refreshed or that was deleted are also invalidated
+explicitly, and entries expire after `ttl_hours` (answers may include web
+search results); expired entries are purged whenever a new answer is stored.
+
+With the default threshold only (numerically) identical queries match; a
+lower threshold such as 0.95 also serves close paraphrases.
+
+The cache lives next to the Chroma files (`<persist_directory>/answer_cache.db`).
+"""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Union
+import logging
+
+import numpy as np
+
+from financial_research_agent.cache.connection_pool import SQLiteConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+ANSWER_CACHE_FILENAME = "answer_cache.db"
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.999
+DEFAULT_TTL_HOURS = 24
+
+ANSWER_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    filter_key TEXT NOT NULL,          -- model | ticker | analysis type
+    chunk_key TEXT NOT NULL,           -- sha256 of the sorted retrieved chunk IDs
+    query TEXT NOT NULL,
+    embedding BLOB NOT NULL,           -- unit-length float32 query vector
+    response TEXT NOT NULL,            -- serialized RAGResponse
+    created_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_answers_key ON answers(filter_key, chunk_key);
+CREATE INDEX IF NOT EXISTS idx_answers_created ON answers(created_at);
+
+CREATE TABLE IF NOT EXISTS answer_chunks (
+    answer_id INTEGER NOT NULL,
+    chunk_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_answer_chunks_chunk ON answer_chunks(chunk_id);
+CREATE INDEX IF NOT EXISTS idx_answer_chunks_answer ON answer_chunks(answer_id);
+"""
+
+
+def normalize_embedding(embedding: Sequence[float]) -> np.ndarray:
+    """Unit-length float32 copy of a vector (cosine similarity becomes a dot product)."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+def make_filter_key(model: str, ticker: Optional[str], analysis_type: Optional[str]) -> str:
+    return f"{model}|{(ticker or '').upper()}|{analysis_type or ''}"
+
+
+def make_chunk_key(chunk_ids: Iterable[str]) -> str:
+    return hashlib.sha256("\n".join(sorted(set(chunk_ids))).encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+    """
+    Persistent cache of synthesized RAG answers.
+
+    Features:
+    - Lookups narrowed by filters + retrieved chunk set, then matched by similarity
+    - Invalidation by chunk ID (re-indexed or removed chunks)
+    - Time-based expiry (expired rows are deleted on store)
+    - Hit/miss counters
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the cache SQLite file
+            similarity_threshold: Minimum cosine similarity between queries to reuse an answer
+            ttl_hours: Hours an answer stays valid
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_hours * 3600
+        self._pool = SQLiteConnectionPool(self.db_path)
+        self.stats = {"hits": 0, "misses": 0}
+
+        with self._pool.connection() as conn:
+            conn.executescript(ANSWER_CACHE_SCHEMA)
+
+    def lookup(
+        self,
+        embedding: Sequence[float],
+        filter_key: str,
+        chunk_ids: Sequence[str],
+    ) -> Optional[str]:
+        """
+        Find a cached answer for a query.
+
+        Args:
+            embedding: Query embedding
+            filter_key: Key from make_filter_key()
+            chunk_ids: IDs of the chunks retrieved for the query
+
+        Returns:
+            Serialized response of the most similar matching entry, or None
+        """
+        if not chunk_ids:
+            return None
+
+        cutoff = time.time() - self.ttl_seconds
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT id, embedding, response FROM answers "
+                "WHERE filter_key = ? AND chunk_key = ? AND created_at >= ?",
+                (filter_key, make_chunk_key(chunk_ids), cutoff)
+            ).fetchall()
+
+        query_vector = normalize_embedding(embedding)
+        best = None
+        best_similarity = self.similarity_threshold
+        for row in rows:
+            cached_vector = np.frombuffer(row["embedding"], dtype=np.float32)
+            if cached_vector.shape != query_vector.shape:
+                continue
+            similarity = float(np.dot(query_vector, cached_vector))
+            if similarity >= best_similarity:
+                best, best_similarity = row, similarity
+
+        if best is None:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        with self._pool.transaction() as conn:
+            conn.execute("UPDATE answers SET hits = hits + 1 WHERE id = ?", (best["id"],))
+        return best["response"]
+
+    def store(
+        self,
+        query: str,
+        embedding: Sequence[float],
+        filter_key: str,
+        chunk_ids: Sequence[str],
+        response: str,
+    ):
+        """Cache a synthesized answer (and purge expired ones)."""
+        if not chunk_ids:
+            return
+
+        with self._pool.transaction() as conn:
+            self._purge_expired(conn)
+            cursor = conn.execute(
+                "INSERT INTO answers (filter_key, chunk_key, query, embedding, response, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    filter_key,
+                    make_chunk_key(chunk_ids),
+                    query,
+                    normalize_embedding(embedding).tobytes(),
+                    response,
+                    time.time(),
+                )
+            )
+            conn.executemany(
+                "INSERT INTO answer_chunks (answer_id, chunk_id) VALUES (?, ?)",
+                [(cursor.lastrowid, chunk_id) for chunk_id in set(chunk_ids)]
+            )
+
+    def _purge_expired(self, conn) -> int:
+        cutoff = time.time() - self.ttl_seconds
+        conn.execute(
+            "DELETE FROM answer_chunks WHERE answer_id IN (SELECT id FROM answers WHERE created_at < ?)",
+            (cutoff,)
+        )
+        return conn.execute("DELETE FROM answers WHERE created_at < ?", (cutoff,)).rowcount
+
+    def purge_expired(self) -> int:
+        """
+        Delete answers older than the TTL.
+
+        Returns:
+            Number of answers removed
+        """
+        with self._pool.transaction() as conn:
+            return self._purge_expired(conn)
+
+    def invalidate_chunks(self, chunk_ids: Iterable[str]) -> int:
+        """
+        Drop every answer built from any of the given chunks.
+
+        Returns:
+            Number of answers removed
+        """
+        chunk_ids = list(chunk_ids)
+        if not chunk_ids:
+            return 0
+
+        with self._pool.transaction() as conn:
+            answer_ids = set()
+            for start in range(0, len(chunk_ids), 500):
+                batch = chunk_ids[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT DISTINCT answer_id FROM answer_chunks WHERE chunk_id IN ({','.join('?' * len(batch))})",
+                    batch
+                ).fetchall()
+                answer_ids.update(row["answer_id"] for row in rows)
+
+            for answer_id in answer_ids:
+                conn.execute("DELETE FROM answers WHERE id = ?", (answer_id,))
+                conn.execute("DELETE FROM answer_chunks WHERE answer_id = ?", (answer_id,))
+
+        if answer_ids:
+            logger.info(f"Invalidated {len(answer_ids)} cached answers")
+        return len(answer_ids)
+
+    def clear(self):
+        with self._pool.transaction() as conn:
+            conn.execute("DELETE FROM answers")
+            conn.execute("DELETE FROM answer_chunks")
+
+    def summary(self) -> Dict[str, Any]:
+        """Get entry count and hit/miss counters."""
+        with self._pool.connection() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+        return {"entries": entries, **self.stats}
@@ -0,0 +1,355 @@
+"""
+Knowledge-base company catalog.
+
+One row per ticker describing what is indexed in the `financial_analyses`
+collection (company, period, filing, last indexed date, chunk count). Status
+and listing APIs read this table instead of scanning every chunk in Chroma,
+so a status check is a primary-key lookup regardless of KB size.
+
+A second table, the filing manifest, does the same for the `sec_filings_cache`
+collection: one row per cached filing (ticker, form, date -> accession, item
+chunk counts). Cached filings are resolved here first, and only the chunks of
+the requested items are then fetched from Chroma by ID.
+
+The catalog lives next to the Chroma files (`<persist_directory>/kb_catalog.db`)
+and is written by FinancialRAGManager.index_analysis_from_directory and
+FinancialRAGManager.store_sec_filing.
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from financial_research_agent.cache.connection_pool import SQLiteConnectionPool
+
+
+CATALOG_FILENAME = "kb_catalog.db"
+
+CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS kb_companies (
+    ticker TEXT PRIMARY KEY,
+    company TEXT,
+    period TEXT,
+    filing TEXT,
+    last_indexed TEXT,                 -- YYYY-MM-DD (NULL if unknown)
+    chunk_count INTEGER NOT NULL DEFAULT 0,
+    analysis_types TEXT,               -- JSON list
+    output_dir TEXT,
+    updated_at TEXT NOT NULL
+)
+"""
+
+FILING_MANIFEST_SCHEMA = """
+CREATE TABLE IF NOT EXISTS filing_manifest (
+    ticker TEXT NOT NULL,
+    filing_type TEXT NOT NULL,
+    filing_date TEXT NOT NULL,         -- YYYY-MM-DD
+    accession TEXT NOT NULL,
+    items TEXT NOT NULL,               -- JSON: item name -> chunk count
+    chunk_count INTEGER NOT NULL,
+    stored_at TEXT NOT NULL,
+    PRIMARY KEY (ticker, filing_type, filing_date, accession)
+)
+"""
+
+
+class KBCatalog:
+    """Persistent one-row-per-ticker summary of the analysis collection."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize the catalog.
+
+        Args:
+            db_path: Path to the catalog SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
+
+        with self._pool.connection() as conn:
+            conn.execute(CATALOG_SCHEMA)
+            conn.execute(FILING_MANIFEST_SCHEMA)
+
+    def upsert(
+        self,
+        ticker: str,
+        chunk_count: int,
+        metadata: Optional[Dict[str, Any]] = None,
+        analysis_types: Iterable[str] = (),
+        output_dir: Optional[str] = None,
+        indexed_at: Optional[datetime] = None,
+    ):
+        """
+        Record a (re-)indexed company.
+
+        Args:
+            ticker: Stock ticker symbol
+            chunk_count: Chunks now stored for the ticker
+            metadata: Chunk metadata carrying company/period/filing
+            analysis_types: Analysis types present for the ticker
+            output_dir: Directory the analysis was indexed from
+            indexed_at: Index time (defaults to now)
+        """
+        indexed_at = indexed_at or datetime.now()
+        self._write(ticker, chunk_count, metadata, analysis_types, output_dir, indexed_at.strftime("%Y-%m-%d"))
+
+    def _write(
+        self,
+        ticker: str,
+        chunk_count: int,
+        metadata: Optional[Dict[str, Any]],
+        analysis_types: Iterable[str],
+        output_dir: Optional[str],
+        last_indexed: Optional[str],
+    ):
+        metadata = metadata or {}
+
+        with self._pool.transaction() as conn:
+            conn.execute("""
+                INSERT INTO kb_companies (
+                    ticker, company, period, filing, last_indexed,
+                    chunk_count, analysis_types, output_dir, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ticker) DO UPDATE SET
+                    company = COALESCE(excluded.company, kb_companies.company),
+                    period = COALESCE(excluded.period, kb_companies.period),
+                    filing = COALESCE(excluded.filing, kb_companies.filing),
+                    last_indexed = excluded.last_indexed,
+                    chunk_count = excluded.chunk_count,
+                    analysis_types = excluded.analysis_types,
+                    output_dir = COALESCE(excluded.output_dir, kb_companies.output_dir),
+                    updated_at = excluded.updated_at
+            """, (
+                ticker.upper(),
+                metadata.get("company"),
+                metadata.get("period"),
+                metadata.get("filing"),
+                last_indexed,
+                chunk_count,
+                json.dumps(sorted(set(analysis_types))),
+                output_dir,
+                datetime.now().isoformat(),
+            ))
+
+    def get(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Get one company's catalog row, or None if not indexed."""
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM kb_companies WHERE ticker = ?", (ticker.upper(),)
+            ).fetchone()
+        return self._row_to_dict(row) if row else None
+
+    def list_companies(self) -> List[Dict[str, Any]]:
+        """Get every company's catalog row, most recently indexed first."""
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM kb_companies ORDER BY last_indexed IS NULL, last_indexed DESC, ticker"
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def remove(self, ticker: str):
+        with self._pool.transaction() as conn:
+            conn.execute("DELETE FROM kb_companies WHERE ticker = ?", (ticker.upper(),))
+
+    def clear(self):
+        """Remove every company row (the filing manifest is kept)."""
+        with self._pool.transaction() as conn:
+            conn.execute("DELETE FROM kb_companies")
+
+    def is_empty(self) -> bool:
+        with self._pool.connection() as conn:
+            return conn.execute("SELECT 1 FROM kb_companies LIMIT 1").fetchone() is None
+
+    def rebuild_from_collection(self, collection: Any) -> int:
+        """
+        Rebuild the catalog from an existing analysis collection.
+
+        Used once for knowledge bases indexed before the catalog existed.
+        Reads metadata only (no documents or embeddings).
+
+        Returns:
+            Number of companies catalogued
+        """
+        all_docs = collection.get(include=["metadatas"])
+
+        companies: Dict[str, Dict[str, Any]] = {}
+        for chunk_id, metadata in zip(all_docs["ids"], all_docs["metadatas"]):
+            ticker = (metadata or {}).get("ticker")
+            if not ticker:
+                continue
+
+            entry = companies.setdefault(ticker, {
+                "metadata": metadata,
+                "chunks": 0,
+                "types": set(),
+                "indexed_at": None,
+            })
+            entry["chunks"] += 1
+            entry["types"].add(metadata.get("analysis_type", ""))
+
+            # Chunks carry their index date in metadata; legacy chunk IDs
+            # end in it instead (TICKER_type_s0_c0_YYYYMMDD)
+            indexed_at = None
+            date_match = re.search(r'_(\d{8})$', chunk_id)
+            if metadata.get("indexed_at"):
+                indexed_at = datetime.strptime(metadata["indexed_at"], "%Y-%m-%d")
+            elif date_match:
+                indexed_at = datetime.strptime(date_match.group(1), "%Y%m%d")
+
+            if indexed_at and (entry["indexed_at"] is None or indexed_at > entry["indexed_at"]):
+                entry["indexed_at"] = indexed_at
+                entry["metadata"] = metadata
+
+        for ticker, entry in companies.items():
+            self._write(
+                ticker,
+                chunk_count=entry["chunks"],
+                metadata=entry["metadata"],
+                analysis_types=entry["types"] - {""},
+                output_dir=None,
+                last_indexed=entry["indexed_at"].strftime("%Y-%m-%d") if entry["indexed_at"] else None,
+            )
+
+        return len(companies)
+
+    # ========================================
+    # FILING MANIFEST
+    # ========================================
+
+    def record_filing(
+        self,
+        ticker: str,
+        filing_type: str,
+        filing_date: str,
+        accession: str,
+        item_chunks: Dict[str, int],
+    ):
+        """
+        Record the items stored for one cached filing.
+
+        Items are merged into an existing row, so a filing can be cached in
+        several calls.
+
+        Args:
+            ticker: Stock ticker symbol
+            filing_type: Filing type (10-K, 10-Q, ...)
+            filing_date: Filing date (YYYY-MM-DD)
+            accession: SEC accession number
+            item_chunks: Item name -> number of chunks stored
+        """
+        key = (ticker.upper(), filing_type, filing_date, accession)
+
+        with self._pool.transaction() as conn:
+            row = conn.execute(
+                "SELECT items FROM filing_manifest "
+                "WHERE ticker = ? AND filing_type = ? AND filing_date = ? AND accession = ?",
+                key
+            ).fetchone()
+
+            items = json.loads(row["items"]) if row else {}
+            items.update(item_chunks)
+
+            conn.execute(
+                "INSERT OR REPLACE INTO filing_manifest "
+                "(ticker, filing_type, filing_date, accession, items, chunk_count, stored_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, json.dumps(items), sum(items.values()), datetime.now().isoformat())
+            )
+
+    def get_filing(
+        self,
+        ticker: str,
+        filing_type: str,
+        filing_date: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a cached filing.
+
+        Args:
+            ticker: Stock ticker symbol
+            filing_type: Filing type
+            filing_date: Specific filing date (default: most recent)
+
+        Returns:
+            Manifest row (items decoded to a dict), or None if not cached
+        """
+        query = "SELECT * FROM filing_manifest WHERE ticker = ? AND filing_type = ?"
+        params: List[Any] = [ticker.upper(), filing_type]
+        if filing_date:
+            query += " AND filing_date = ?"
+            params.append(filing_date)
+        query += " ORDER BY filing_date DESC, stored_at DESC LIMIT 1"
+
+        with self._pool.connection() as conn:
+            row = conn.execute(query, params).fetchone()
+        return self._manifest_row_to_dict(row) if row else None
+
+    def list_filings(self) -> List[Dict[str, Any]]:
+        """Get every cached filing, newest first within each ticker."""
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                "SELECT * FROM filing_manifest ORDER BY ticker DESC, filing_date DESC"
+            ).fetchall()
+        return [self._manifest_row_to_dict(row) for row in rows]
+
+    def clear_filings(self):
+        with self._pool.transaction() as conn:
+            conn.execute("DELETE FROM filing_manifest")
+
+    def has_filings(self) -> bool:
+        with self._pool.connection() as conn:
+            return conn.execute("SELECT 1 FROM filing_manifest LIMIT 1").fetchone() is not None
+
+    def rebuild_filings_from_collection(self, collection: Any) -> int:
+        """
+        Rebuild the filing manifest from an existing filings collection.
+
+        Used once for filing caches created before the manifest existed.
+        Reads metadata only (no documents or embeddings).
+
+        Returns:
+            Number of filings catalogued
+        """
+        all_docs = collection.get(include=["metadatas"])
+
+        # Filing key -> item name -> (stored_at, total_chunks) of its newest write
+        filings: Dict[tuple, Dict[str, tuple]] = {}
+        for metadata in all_docs["metadatas"]:
+            metadata = metadata or {}
+            key = (
+                metadata.get("ticker", ""),
+                metadata.get("filing_type", ""),
+                metadata.get("filing_date", ""),
+                metadata.get("accession", ""),
+            )
+            if not all(key):
+                continue
+
+            items = filings.setdefault(key, {})
+            item_name = metadata.get("item_name", "unknown")
+            latest = (metadata.get("stored_at", ""), metadata.get("total_chunks", 1))
+            if item_name not in items or latest > items[item_name]:
+                items[item_name] = latest
+
+        for (ticker, filing_type, filing_date, accession), items in filings.items():
+            self.record_filing(
+                ticker, filing_type, filing_date, accession,
+                {item_name: total_chunks for item_name, (_, total_chunks) in items.items()}
+            )
+
+        return len(filings)
+
+    @staticmethod
+    def _manifest_row_to_dict(row) -> Dict[str, Any]:
+        result = dict(row)
+        result["items"] = json.loads(result["items"])
+        return result
+
+    @staticmethod
+    def _row_to_dict(row) -> Dict[str, Any]:
+        result = dict(row)
+        result["analysis_types"] = json.loads(result["analysis_types"] or "[]")
+        return result
@@ -5,23 +5,61 @@ Handles indexing, querying, and managing financial analysis documents.
 """
 import chromadb
 from chromadb.config import Settings
+from chromadb.utils.embedding_functions import DefaultEmbeddingFunction
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterator
+import hashlib
 import re
+import time
+
+from financial_research_agent.config import AgentConfig
+
+from .answer_cache import ANSWER_CACHE_FILENAME, AnswerCache, make_filter_key, normalize_embedding
+from .catalog import CATALOG_FILENAME, KBCatalog
+from .embeddings import EMBEDDING_CACHE_FILENAME, EmbeddingCache, EmbeddingPipeline
+from .hybrid import LEXICAL_INDEX_FILENAME, LexicalIndex, create_reranker, reciprocal_rank_fusion
+
+
+# Analysis type -> markdown file in an analysis output directory
+ANALYSIS_FILES = {
+    "comprehensive": "07_comprehensive_report.md",
+    "financial_statements": "03_financial_statements.md",
+    "financial_metrics": "04_financial_metrics.md",
+    "financial_analysis": "05_financial_analysis.md",
+    "risk": "06_risk_analysis.md"
+}
+
+# Hybrid search retrieves this many candidates per requested result from each retriever
+HYBRID_CANDIDATE_MULTIPLIER = 4
+HYBRID_MIN_CANDIDATES = 20
+
+_UNSET = object()
 
 
 class FinancialRAGManager:
     """Manages ChromaDB for financial analysis RAG."""
 
-    def __init__(self, persist_directory: str = "./chroma_db"):
+    def __init__(
+        self,
+        persist_directory: str = "./chroma_db",
+        embedding_function: Any | None = None,
+        embedding_batch_size: int | None = None,
+        hybrid: bool | None = None
+    ):
         """
         Initialize ChromaDB client.
 
         Args:
             persist_directory: Directory for ChromaDB persistence
+            embedding_function: Chroma embedding function (default: Chroma's default model)
+            embedding_batch_size: Texts per embedding call when indexing
+                (default: AgentConfig.EMBEDDING_BATCH_SIZE)
+            hybrid: Use BM25 + vector retrieval (default: AgentConfig.RAG_HYBRID_RETRIEVAL)
         """
         self.persist_directory = persist_directory
+        self.embedding_function = embedding_function or DefaultEmbeddingFunction()
         Path(persist_directory).mkdir(parents=True, exist_ok=True)
 
         # Initialize ChromaDB with persistence
@@ -33,18 +71,54 @@ class FinancialRAGManager:
             )
         )
 
-        # Get or create collection with OpenAI embeddings
+        # Get or create collection (documents are embedded by self.embedder before upsert)
         self.collection = self.client.get_or_create_collection(
             name="financial_analyses",
+            embedding_function=self.embedding_function,
             metadata={"hnsw:space": "cosine"}
         )
 
         # Separate collection for SEC filing cache (raw filings for reuse)
         self.filings_collection = self.client.get_or_create_collection(
             name="sec_filings_cache",
+            embedding_function=self.embedding_function,
             metadata={"hnsw:space": "cosine"}
         )
 
+        # Batched, disk-cached embeddings for everything we index
+        self.embedder = EmbeddingPipeline(
+            self.embedding_function,
+            cache=EmbeddingCache(Path(persist_directory) / EMBEDDING_CACHE_FILENAME),
+            batch_size=embedding_batch_size or AgentConfig.EMBEDDING_BATCH_SIZE
+        )
+
+        # Synthesized answers keyed by query embedding + filters + retrieved chunks
+        self.answer_cache = None
+        if AgentConfig.RAG_ANSWER_CACHE:
+            self.answer_cache = AnswerCache(
+                Path(persist_directory) / ANSWER_CACHE_FILENAME,
+                similarity_threshold=AgentConfig.RAG_ANSWER_CACHE_SIMILARITY,
+                ttl_hours=AgentConfig.RAG_ANSWER_CACHE_TTL_HOURS
+            )
+
+        # BM25 index over the same chunks, for hybrid retrieval
+        self.hybrid = AgentConfig.RAG_HYBRID_RETRIEVAL if hybrid is None else hybrid
+        self._reranker = _UNSET
+        self.lexical_index = LexicalIndex(Path(persist_directory) / LEXICAL_INDEX_FILENAME)
+        if self.lexical_index.count() == 0 and self.collection.count() > 0:
+            count = self.lexical_index.rebuild_from_collection(self.collection)
+            print(f"✓ Built lexical index for {count} chunks")
+
+        # One row per ticker, so status checks never scan the collection
+        self.catalog = KBCatalog(Path(persist_directory) / CATALOG_FILENAME)
+        if self.catalog.is_empty() and self.collection.count() > 0:
+            # Knowledge base indexed before the catalog existed
+            count = self.catalog.rebuild_from_collection(self.collection)
+            print(f"✓ Built KB catalog for {count} companies")
+        if not self.catalog.has_filings() and self.filings_collection.count() > 0:
+            count = self.catalog.rebuild_filings_from_collection(self.filings_collection)
+            print(f"✓ Built filing manifest for {count} cached filings")
+
     def index_analysis_from_directory(
         self,
         output_dir: str | Path,
@@ -53,31 +127,106 @@ class FinancialRAGManager:
         """
         Parse and index all markdown analyses from an output directory.
 
+        Indexing is incremental: only new chunk texts are embedded, and chunks
+        left over from superseded analyses of the same ticker and analysis
+        type are deleted.
+
         Args:
             output_dir: Path to analysis output directory
             ticker: Stock ticker symbol
 
         Returns:
-            Metadata about indexing operation
+            Metadata about indexing operation, including inserted/unchanged/removed chunk counts
+        """
+        return self.index_analysis_directories([(output_dir, ticker)])[ticker.upper()]
+
+    def index_analysis_directories(
+        self,
+        entries: list[tuple[str | Path, str]]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Index several analysis output directories with one embedding pass.
+
+        New chunks from every directory are embedded together in
+        `embedding_batch_size` batches (cached vectors are reused), which makes
+        backfilling many historical directories much cheaper than indexing
+        them one at a time.
+
+        Args:
+            entries: (output_dir, ticker) pairs; if a ticker appears more
+                than once, its last directory wins
+
+        Returns:
+            Ticker -> indexing metadata (as returned by index_analysis_from_directory)
         """
-        output_dir = Path(output_dir)
+        # Plan every directory first (reads + diffs only, nothing embedded yet)
+        jobs = {}
+        for output_dir, ticker in entries:
+            output_dir = Path(output_dir)
 
-        if not output_dir.exists():
-            raise FileNotFoundError(f"Output directory not found: {output_dir}")
+            if not output_dir.exists():
+                raise FileNotFoundError(f"Output directory not found: {output_dir}")
 
-        # Map of analysis types to filenames (updated to match actual output)
-        analysis_files = {
-            "comprehensive": "07_comprehensive_report.md",
-            "financial_statements": "03_financial_statements.md",
-            "financial_metrics": "04_financial_metrics.md",
-            "financial_analysis": "05_financial_analysis.md",
-            "risk": "06_risk_analysis.md"
-        }
+            jobs[ticker.upper()] = {
+                "ticker": ticker,
+                "output_dir": output_dir,
+                "files": self._plan_directory(output_dir, ticker)
+            }
+
+        # One embedding pass for all new chunks across directories
+        to_insert = [
+            chunk
+            for job in jobs.values()
+            for planned in job["files"]
+            for chunk in planned["plan"]["insert"]
+        ]
+        embeddings = dict(zip(
+            [chunk["id"] for chunk in to_insert],
+            self.embedder.embed([chunk["text"] for chunk in to_insert])
+        ))
+
+        results = {}
+        for key, job in jobs.items():
+            totals = {"inserted": 0, "unchanged": 0, "removed": 0}
+            total_chunks = 0
+            indexed_files = []
+            indexed_types = []
+            catalog_metadata = {}
+
+            for planned in job["files"]:
+                counts = self._apply_chunk_sync(planned["plan"], embeddings)
+
+                total_chunks += planned["chunk_count"]
+                for count_key in totals:
+                    totals[count_key] += counts[count_key]
+                indexed_files.append(planned["filename"])
+                indexed_types.append(planned["analysis_type"])
+                # Later files only fill fields the earlier ones lacked
+                catalog_metadata = {**planned["metadata"], **catalog_metadata}
+                print(
+                    f"✓ Indexed {planned['filename']}: {planned['chunk_count']} chunks "
+                    f"({counts['inserted']} new, {counts['unchanged']} unchanged, {counts['removed']} removed)"
+                )
+
+            if indexed_files:
+                self._update_catalog(job["ticker"], catalog_metadata, indexed_types, job["output_dir"])
+
+            results[key] = {
+                "ticker": job["ticker"],
+                "total_chunks": total_chunks,
+                **totals,
+                "indexed_files": indexed_files,
+                "output_dir": str(job["output_dir"]),
+                "indexed_at": datetime.now().isoformat()
+            }
 
-        total_chunks = 0
-        indexed_files = []
+        return results
+
+    def _plan_directory(self, output_dir: Path, ticker: str) -> list[dict]:
+        """Read, chunk and diff every analysis file in one output directory."""
+        planned_files = []
 
-        for analysis_type, filename in analysis_files.items():
+        for analysis_type, filename in ANALYSIS_FILES.items():
             filepath = output_dir / filename
 
             if not filepath.exists():
@@ -94,24 +243,158 @@ class FinancialRAGManager:
             chunks = self._chunk_markdown(content, analysis_type, metadata)
 
             if chunks:
-                # Use upsert to handle duplicates (will update if ID exists, insert if new)
-                # This allows re-indexing the same ticker without creating duplicates
-                self.collection.upsert(
-                    documents=[chunk["text"] for chunk in chunks],
-                    metadatas=[chunk["metadata"] for chunk in chunks],
-                    ids=[chunk["id"] for chunk in chunks]
-                )
+                planned_files.append({
+                    "filename": filename,
+                    "analysis_type": analysis_type,
+                    "metadata": metadata,
+                    "chunk_count": len(chunks),
+                    "plan": self._plan_chunk_sync(metadata["ticker"], analysis_type, chunks)
+                })
+
+        return planned_files
+
+    def _plan_chunk_sync(
+        self,
+        ticker: str,
+        analysis_type: str,
+        chunks: list[dict]
+    ) -> dict[str, Any]:
+        """
+        Diff a new analysis against the stored chunks for one ticker/analysis type.
+
+        Chunks whose text is already stored are not re-embedded (only their
+        metadata is refreshed if it changed); stored chunks that no longer
+        appear in the analysis are deleted.
+
+        Args:
+            ticker: Stock ticker (upper case, as stored in metadata)
+            analysis_type: Type of analysis
+            chunks: Chunks from _chunk_markdown
 
-                total_chunks += len(chunks)
-                indexed_files.append(filename)
-                print(f"✓ Indexed {filename}: {len(chunks)} chunks")
+        Returns:
+            {"insert": [chunk], "remove": [id], "refresh": [(id, metadata)], "unchanged": int}
+        """
+        # Identical text twice in one analysis maps to one ID; keep the first
+        new_chunks = {}
+        for chunk in chunks:
+            new_chunks.setdefault(chunk["id"], chunk)
+
+        stored = self.collection.get(
+            where={"$and": [{"ticker": ticker}, {"analysis_type": analysis_type}]},
+            include=["metadatas"]
+        )
+        stored_metadata = dict(zip(stored["ids"], stored["metadatas"]))
+
+        to_insert = [chunk for chunk_id, chunk in new_chunks.items() if chunk_id not in stored_metadata]
+        to_remove = [chunk_id for chunk_id in stored_metadata if chunk_id not in new_chunks]
+
+        # Unchanged text whose position or filing metadata moved: metadata-only update, no embedding
+        to_refresh = []
+        for chunk_id, chunk in new_chunks.items():
+            previous = stored_metadata.get(chunk_id)
+            if previous is None:
+                continue
+            refreshed = dict(chunk["metadata"])
+            if "indexed_at" in previous:
+                refreshed["indexed_at"] = previous["indexed_at"]
+            if refreshed != previous:
+                to_refresh.append((chunk_id, refreshed))
 
         return {
-            "ticker": ticker,
-            "total_chunks": total_chunks,
-            "indexed_files": indexed_files,
-            "output_dir": str(output_dir),
-            "indexed_at": datetime.now().isoformat()
+            "insert": to_insert,
+            "remove": to_remove,
+            "refresh": to_refresh,
+            "unchanged": len(new_chunks) - len(to_insert)
+        }
+
+    def _apply_chunk_sync(
+        self,
+        plan: dict[str, Any],
+        embeddings: dict[str, list[float]]
+    ) -> dict[str, int]:
+        """
+        Apply a plan from _plan_chunk_sync.
+
+        Args:
+            plan: Planned inserts/removals/metadata refreshes
+            embeddings: Chunk ID -> precomputed vector for every planned insert
+
+        Returns:
+            {"inserted": int, "unchanged": int, "removed": int}
+        """
+        if plan["remove"]:
+            self.collection.delete(ids=plan["remove"])
+            self.lexical_index.delete(plan["remove"])
+
+        if plan["insert"]:
+            indexed_at = datetime.now().strftime("%Y-%m-%d")
+            self.collection.add(
+                documents=[chunk["text"] for chunk in plan["insert"]],
+                metadatas=[{**chunk["metadata"], "indexed_at": indexed_at} for chunk in plan["insert"]],
+                embeddings=[embeddings[chunk["id"]] for chunk in plan["insert"]],
+                ids=[chunk["id"] for chunk in plan["insert"]]
+            )
+            self.lexical_index.add(plan["insert"])
+
+        if plan["refresh"]:
+            self.collection.update(
+                ids=[chunk_id for chunk_id, _ in plan["refresh"]],
+                metadatas=[meta for _, meta in plan["refresh"]]
+            )
+
+        # Cached answers built from removed or re-labelled chunks are stale
+        if self.answer_cache:
+            self.answer_cache.invalidate_chunks(
+                plan["remove"] + [chunk_id for chunk_id, _ in plan["refresh"]]
+            )
+
+        return {
+            "inserted": len(plan["insert"]),
+            "unchanged": plan["unchanged"],
+            "removed": len(plan["remove"])
+        }
+
+    def _update_catalog(
+        self,
+        ticker: str,
+        metadata: dict[str, str],
+        analysis_types: list[str],
+        output_dir: Path
+    ) -> None:
+        """Refresh the ticker's catalog row after indexing (ids-only count, no documents)."""
+        stored = self.collection.get(where={"ticker": ticker.upper()}, include=[])
+
+        previous = self.catalog.get(ticker)
+        if previous:
+            analysis_types = set(analysis_types) | set(previous["analysis_types"])
+
+        self.catalog.upsert(
+            ticker,
+            chunk_count=len(stored["ids"]),
+            metadata=metadata,
+            analysis_types=analysis_types,
+            output_dir=str(output_dir)
+        )
+
+    def _catalog_entry_status(self, entry: dict) -> dict:
+        """Convert a catalog row to the status dict used by the web app."""
+        if entry.get("last_indexed"):
+            analysis_date = datetime.strptime(entry["last_indexed"], "%Y-%m-%d")
+            days_old = (datetime.now() - analysis_date).days
+            last_updated = entry["last_indexed"]
+        else:
+            days_old = 999  # Unknown age
+            last_updated = "Unknown"
+
+        return {
+            "ticker": entry["ticker"],
+            "company": entry.get("company") or "",
+            "period": entry.get("period") or "",
+            "filing": entry["filing"].split()[0] if entry.get("filing") else "",
+            "days_old": days_old,
+            "status": self._get_staleness_status(days_old, entry["ticker"]),
+            "last_updated": last_updated,
+            "chunk_count": entry.get("chunk_count", 0)
         }
 
     def _extract_metadata(
@@ -215,20 +498,9 @@ class FinancialRAGManager:
                 # If adding this paragraph exceeds chunk size and we already have content
                 if current_size + para_size > chunk_size and current_chunk:
                     # Save current chunk
-                    chunk_text = '\n\n'.join(current_chunk)
-                    chunk_metadata = {
-                        **metadata,
-                        "section": section_title,
-                        "chunk_num": chunk_num,
-                        "section_num": i
-                    }
-                    chunk_id = f"{metadata['ticker']}_{analysis_type}_s{i}_c{chunk_num}_{datetime.now().strftime('%Y%m%d')}"
-
-                    chunks.append({
-                        "text": f"### {section_title}\n\n{chunk_text}",
-                        "metadata": chunk_metadata,
-                        "id": chunk_id
-                    })
+                    chunks.append(self._make_chunk(
+                        '\n\n'.join(current_chunk), section_title, i, chunk_num, analysis_type, metadata
+                    ))
 
                     # Start new chunk with overlap (keep last paragraph for context)
                     if len(current_chunk) > 1:
@@ -246,23 +518,42 @@ class FinancialRAGManager:
 
             # Save final chunk if it has content
             if current_chunk:
-                chunk_text = '\n\n'.join(current_chunk)
-                chunk_metadata = {
-                    **metadata,
-                    "section": section_title,
-                    "chunk_num": chunk_num,
-                    "section_num": i
-                }
-                chunk_id = f"{metadata['ticker']}_{analysis_type}_s{i}_c{chunk_num}_{datetime.now().strftime('%Y%m%d')}"
-
-                chunks.append({
-                    "text": f"### {section_title}\n\n{chunk_text}",
-                    "metadata": chunk_metadata,
-                    "id": chunk_id
-                })
+                chunks.append(self._make_chunk(
+                    '\n\n'.join(current_chunk), section_title, i, chunk_num, analysis_type, metadata
+                ))
 
         return chunks
 
+    def _make_chunk(
+        self,
+        chunk_text: str,
+        section_title: str,
+        section_num: int,
+        chunk_num: int,
+        analysis_type: str,
+        metadata: dict[str, str]
+    ) -> dict:
+        """
+        Build one chunk with a content-addressed ID.
+
+        The ID is derived from the chunk text, so re-indexing unchanged text
+        yields the same ID no matter when it runs.
+        """
+        text = f"### {section_title}\n\n{chunk_text}"
+        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        return {
+            "text": text,
+            "metadata": {
+                **metadata,
+                "section": section_title,
+                "chunk_num": chunk_num,
+                "section_num": section_num,
+                "content_hash": content_hash
+            },
+            "id": f"{metadata['ticker']}_{analysis_type}_{content_hash[:24]}"
+        }
+
     def query(
         self,
         query: str,
@@ -273,6 +564,9 @@ class FinancialRAGManager:
         """
         Query ChromaDB for relevant analysis chunks.
 
+        Uses hybrid BM25 + vector retrieval with reranking when enabled
+        (AgentConfig.RAG_HYBRID_RETRIEVAL), plain vector search otherwise.
+
         Args:
             query: Natural language query
             ticker: Optional ticker filter
@@ -280,31 +574,176 @@ class FinancialRAGManager:
             n_results: Number of results to return
 
         Returns:
-            Query results with documents, metadatas, and distances
+            Query results with ids, documents, metadatas, and distances
         """
-        # Build where filter - use $and when multiple conditions
-        where_filter = None
+        query_embedding = self.embedding_function.embed_query([query])[0]
+        return self._search(query, query_embedding, ticker, analysis_type, n_results)
+
+    def _search(
+        self,
+        query: str,
+        query_embedding: list[float],
+        ticker: str | None,
+        analysis_type: str | None,
+        n_results: int
+    ) -> dict[str, Any]:
+        """Retrieve chunks with hybrid search when enabled, vector search otherwise."""
+        if self.hybrid:
+            return self._hybrid_search(query, query_embedding, ticker, analysis_type, n_results)
+
+        return self.collection.query(
+            query_embeddings=[query_embedding],
+            n_results=n_results,
+            where=self._where_filter(ticker, analysis_type)
+        )
+
+    def _hybrid_search(
+        self,
+        query: str,
+        query_embedding: list[float],
+        ticker: str | None,
+        analysis_type: str | None,
+        n_results: int
+    ) -> dict[str, Any]:
+        """
+        BM25 + vector retrieval fused with reciprocal rank fusion, then reranked.
+
+        Both retrievers return a candidate pool larger than `n_results`; the
+        fused pool is reranked and cut to `n_results`. Distances are cosine
+        distances to the query for every returned chunk, including chunks
+        found only lexically.
+
+        Returns:
+            Chroma-shaped results (ids, documents, metadatas, distances)
+        """
+        pool_size = max(n_results * HYBRID_CANDIDATE_MULTIPLIER, HYBRID_MIN_CANDIDATES)
+
+        vector = self.collection.query(
+            query_embeddings=[query_embedding],
+            n_results=pool_size,
+            where=self._where_filter(ticker, analysis_type)
+        )
+        vector_ids = vector["ids"][0]
+        lexical_ids = [chunk_id for chunk_id, _ in self.lexical_index.search(query, ticker, analysis_type, pool_size)]
+
+        fused = reciprocal_rank_fusion([vector_ids, lexical_ids])
+        candidate_ids = list(fused)[:pool_size]
+
+        # Vector hits already carry documents; fetch the lexical-only ones
+        found = {
+            chunk_id: (document, metadata, distance)
+            for chunk_id, document, metadata, distance in zip(
+                vector_ids, vector["documents"][0], vector["metadatas"][0], vector["distances"][0]
+            )
+        }
+        missing = [chunk_id for chunk_id in candidate_ids if chunk_id not in found]
+        if missing:
+            extra = self.collection.get(ids=missing, include=["documents", "metadatas", "embeddings"])
+            query_vector = normalize_embedding(query_embedding)
+            for chunk_id, document, metadata, embedding in zip(
+                extra["ids"], extra["documents"], extra["metadatas"], extra["embeddings"]
+            ):
+                distance = 1.0 - float(query_vector @ normalize_embedding(embedding))
+                found[chunk_id] = (document, metadata, distance)
+        candidate_ids = [chunk_id for chunk_id in candidate_ids if chunk_id in found]
+
+        if self.reranker is not None and candidate_ids:
+            scores = self.reranker.rerank(
+                query,
+                [found[chunk_id][0] for chunk_id in candidate_ids],
+                [fused[chunk_id] for chunk_id in candidate_ids]
+            )
+            ranked = sorted(zip(candidate_ids, scores), key=lambda item: item[1], reverse=True)
+            candidate_ids = [chunk_id for chunk_id, _ in ranked]
+
+        top = candidate_ids[:n_results]
+        return {
+            "ids": [top],
+            "documents": [[found[chunk_id][0] for chunk_id in top]],
+            "metadatas": [[found[chunk_id][1] for chunk_id in top]],
+            "distances": [[found[chunk_id][2] for chunk_id in top]]
+        }
+
+    @property
+    def reranker(self):
+        """Reranker for hybrid search (built on first use; a cross-encoder loads a model)."""
+        if self._reranker is _UNSET:
+            self._reranker = create_reranker(AgentConfig.RAG_RERANKER, AgentConfig.RAG_CROSS_ENCODER_MODEL)
+        return self._reranker
+
+    @staticmethod
+    def _where_filter(ticker: str | None, analysis_type: str | None) -> dict | None:
+        """Build a Chroma where filter - use $and when multiple conditions."""
         if ticker and analysis_type:
             # Multiple conditions - use $and operator
-            where_filter = {
+            return {
                 "$and": [
                     {"ticker": ticker.upper()},
                     {"analysis_type": analysis_type}
                 ]
             }
         elif ticker:
-            where_filter = {"ticker": ticker.upper()}
+            return {"ticker": ticker.upper()}
         elif analysis_type:
-            where_filter = {"analysis_type": analysis_type}
+            return {"analysis_type": analysis_type}
+        return None
 
-        # Query ChromaDB
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where_filter
-        )
+    def batch_query(
+        self,
+        query: str,
+        specs: list[tuple[str | None, str | None, int]],
+        max_workers: int = 8
+    ) -> dict[str, Any]:
+        """
+        Run several filtered searches for one query text.
 
-        return results
+        The query is embedded once and the filtered searches run
+        concurrently, so an N-company comparison costs one embedding and
+        roughly one search round trip instead of N of each.
+
+        Args:
+            query: Natural language query
+            specs: (ticker, analysis_type, n_results) per search; None filters are omitted
+            max_workers: Maximum concurrent searches
+
+        Returns:
+            {
+                "results": [Chroma query result per spec, in spec order],
+                "timings": {
+                    "embed_ms": float,
+                    "search_ms": float,       # wall time of all searches
+                    "total_ms": float,
+                    "per_query_ms": [float per spec]
+                }
+            }
+        """
+        start = time.perf_counter()
+        query_embedding = self.embedding_function.embed_query([query])[0]
+        embed_ms = (time.perf_counter() - start) * 1000
+
+        def run(spec: tuple[str | None, str | None, int]) -> tuple[dict, float]:
+            ticker, analysis_type, n_results = spec
+            search_start = time.perf_counter()
+            result = self._search(query, query_embedding, ticker, analysis_type, n_results)
+            return result, (time.perf_counter() - search_start) * 1000
+
+        search_start = time.perf_counter()
+        if len(specs) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+                outcomes = list(executor.map(run, specs))
+        else:
+            outcomes = [run(spec) for spec in specs]
+        search_ms = (time.perf_counter() - search_start) * 1000
+
+        return {
+            "results": [result for result, _ in outcomes],
+            "timings": {
+                "embed_ms": round(embed_ms, 2),
+                "search_ms": round(search_ms, 2),
+                "total_ms": round((time.perf_counter() - start) * 1000, 2),
+                "per_query_ms": [round(elapsed, 2) for _, elapsed in outcomes]
+            }
+        }
 
     def query_with_synthesis(
         self,
@@ -317,7 +756,7 @@ class FinancialRAGManager:
         Query ChromaDB and synthesize results into a coherent answer.
 
         This is the recommended method for user-facing Q&A, as it:
-        - Retrieves relevant chunks via semantic search
+        - Retrieves relevant chunks via hybrid (BM25 + semantic) search
         - Synthesizes them into a cohesive, well-cited answer
         - Provides confidence assessment and limitations
 
@@ -340,19 +779,65 @@ class FinancialRAGManager:
             >>> print(f"Confidence: {response.confidence}")
             >>> print(f"Sources: {', '.join(response.sources_cited)}")
         """
-        from .synthesis_agent import synthesize_rag_results
+        # Embed once: used for both retrieval and the answer cache key
+        query_embedding = self.embedding_function.embed_query([query])[0]
 
         # Get raw search results from ChromaDB
-        search_results = self.query(
-            query=query,
+        search_results = self._search(query, query_embedding, ticker, analysis_type, n_results)
+
+        # Synthesize into coherent response (or reuse a cached answer)
+        return self.synthesize_with_cache(
+            query,
+            search_results,
             ticker=ticker,
             analysis_type=analysis_type,
-            n_results=n_results
+            query_embedding=query_embedding
         )
 
-        # Synthesize into coherent response
-        response = synthesize_rag_results(query, search_results)
+    def synthesize_with_cache(
+        self,
+        query: str,
+        search_results: dict[str, Any],
+        ticker: str | None = None,
+        analysis_type: str | None = None,
+        query_embedding: list[float] | None = None,
+        max_turns: int = 3
+    ) -> 'RAGResponse':
+        """
+        Synthesize search results, reusing a cached answer when possible.
+
+        An answer is reused when the filters and the retrieved chunk IDs are
+        identical and the query embedding is within the configured similarity
+        threshold of a cached question.
 
+        Args:
+            query: Natural language query
+            search_results: Chroma query results (must include "ids")
+            ticker: Ticker filter used for retrieval (or a comma-joined list for comparisons)
+            analysis_type: Analysis type filter used for retrieval
+            query_embedding: Query vector if already computed
+            max_turns: Maximum agent turns for synthesis
+
+        Returns:
+            RAGResponse
+        """
+        from .synthesis_agent import RAGResponse, synthesize_rag_results
+
+        chunk_ids = (search_results.get("ids") or [[]])[0]
+        if not self.answer_cache or not chunk_ids:
+            return synthesize_rag_results(query, search_results, max_turns=max_turns)
+
+        if query_embedding is None:
+            query_embedding = self.embedding_function.embed_query([query])[0]
+        filter_key = make_filter_key(self.embedder.model, ticker, analysis_type)
+
+        cached = self.answer_cache.lookup(query_embedding, filter_key, chunk_ids)
+        if cached is not None:
+            print("✓ Answer served from cache")
+            return RAGResponse.model_validate_json(cached)
+
+        response = synthesize_rag_results(query, search_results, max_turns=max_turns)
+        self.answer_cache.store(query, query_embedding, filter_key, chunk_ids, response.model_dump_json())
         return response
 
     def compare_peers(
@@ -372,17 +857,12 @@ class FinancialRAGManager:
         Returns:
             Dictionary mapping tickers to their results
         """
-        comparison = {}
-
-        for ticker in tickers:
-            results = self.query(
-                query=query,
-                ticker=ticker,
-                n_results=n_results_per_company
-            )
-            comparison[ticker] = results
+        batch = self.batch_query(
+            query,
+            [(ticker, None, n_results_per_company) for ticker in tickers]
+        )
 
-        return comparison
+        return dict(zip(tickers, batch["results"]))
 
     def list_companies(self) -> list[dict[str, str]]:
         """
@@ -391,22 +871,15 @@ class FinancialRAGManager:
         Returns:
             List of company metadata dictionaries
         """
-        # Get all documents (limit to metadata only)
-        all_docs = self.collection.get()
-
-        # Extract unique companies
-        companies = {}
-        for metadata in all_docs["metadatas"]:
-            ticker = metadata.get("ticker")
-            if ticker and ticker not in companies:
-                companies[ticker] = {
-                    "ticker": ticker,
-                    "company": metadata.get("company", ""),
-                    "latest_period": metadata.get("period", ""),
-                    "filing_type": metadata.get("filing", "").split()[0] if metadata.get("filing") else ""
-                }
-
-        return list(companies.values())
+        return [
+            {
+                "ticker": entry["ticker"],
+                "company": entry.get("company") or "",
+                "latest_period": entry.get("period") or "",
+                "filing_type": entry["filing"].split()[0] if entry.get("filing") else ""
+            }
+            for entry in self.catalog.list_companies()
+        ]
 
     def get_latest_analysis(self, ticker: str) -> dict[str, Any] | None:
         """
@@ -418,31 +891,16 @@ class FinancialRAGManager:
         Returns:
             Analysis metadata or None if not found
         """
-        results = self.collection.get(
-            where={"ticker": ticker.upper()},
-            limit=1
-        )
-
-        if not results["metadatas"]:
+        entry = self.catalog.get(ticker)
+        if entry is None:
             return None
 
-        metadata = results["metadatas"][0]
-
-        # Extract date from chunk_id (format: TICKER_type_s0_c0_YYYYMMDD)
-        chunk_id = results.get("ids", [[]])[0][0] if results.get("ids") else ""
-        date_match = re.search(r'_(\d{8})$', chunk_id)
-
-        if date_match:
-            date_str = date_match.group(1)
-            analysis_date = datetime.strptime(date_str, "%Y%m%d")
-            days_old = (datetime.now() - analysis_date).days
-        else:
-            days_old = 999  # Unknown age
+        status = self._catalog_entry_status(entry)
 
         return {
             "ticker": ticker,
-            "analysis_date": metadata.get("period", "Unknown"),
-            "days_old": days_old
+            "analysis_date": status["period"] or "Unknown",
+            "days_old": status["days_old"]
         }
 
     def get_companies_with_status(self) -> list[dict]:
@@ -463,38 +921,8 @@ class FinancialRAGManager:
                 ...
             ]
         """
-        all_docs = self.collection.get()
-
-        companies_map = {}
-        for i, metadata in enumerate(all_docs["metadatas"]):
-            ticker = metadata.get("ticker")
-            if not ticker or ticker in companies_map:
-                continue
-
-            # Extract date from chunk_id (format: TICKER_type_s0_c0_YYYYMMDD)
-            chunk_id = all_docs["ids"][i] if i < len(all_docs["ids"]) else ""
-            date_match = re.search(r'_(\d{8})$', chunk_id)
-
-            if date_match:
-                date_str = date_match.group(1)
-                analysis_date = datetime.strptime(date_str, "%Y%m%d")
-                days_old = (datetime.now() - analysis_date).days
-                last_updated = analysis_date.strftime("%Y-%m-%d")
-            else:
-                days_old = 999  # Unknown age
-                last_updated = "Unknown"
-
-            companies_map[ticker] = {
-                "ticker": ticker,
-                "company": metadata.get("company", ""),
-                "period": metadata.get("period", ""),
-                "filing": metadata.get("filing", "").split()[0] if metadata.get("filing") else "",
-                "days_old": days_old,
-                "status": self._get_staleness_status(days_old, ticker),
-                "last_updated": last_updated
-            }
-
-        return sorted(companies_map.values(), key=lambda x: x["days_old"])
+        companies = [self._catalog_entry_status(entry) for entry in self.catalog.list_companies()]
+        return sorted(companies, key=lambda x: x["days_old"])
 
     def check_company_status(self, ticker: str) -> dict:
         """
@@ -512,17 +940,17 @@ class FinancialRAGManager:
                 "metadata": dict | None
             }
         """
-        all_companies = self.get_companies_with_status()
-
-        for company in all_companies:
-            if company["ticker"] == ticker.upper():
-                return {
-                    "in_kb": True,
-                    "ticker": ticker.upper(),
-                    "status": company["status"],
-                    "days_old": company["days_old"],
-                    "metadata": company
-                }
+        entry = self.catalog.get(ticker)
+
+        if entry is not None:
+            company = self._catalog_entry_status(entry)
+            return {
+                "in_kb": True,
+                "ticker": ticker.upper(),
+                "status": company["status"],
+                "days_old": company["days_old"],
+                "metadata": company
+            }
 
         # Not found
         return {
@@ -592,6 +1020,7 @@ class FinancialRAGManager:
         documents = []
         metadatas = []
         ids = []
+        item_chunks = {}
 
         for item_name, content in items.items():
             if not content or len(content) < 100:
@@ -599,6 +1028,7 @@ class FinancialRAGManager:
 
             # Chunk large items
             chunks = self._chunk_filing_content(content, chunk_size=8000)
+            item_chunks[item_name] = len(chunks)
 
             for i, chunk in enumerate(chunks):
                 doc_id = f"{filing_id}_{item_name}_c{i}"
@@ -619,8 +1049,10 @@ class FinancialRAGManager:
             self.filings_collection.upsert(
                 documents=documents,
                 metadatas=metadatas,
+                embeddings=self.embedder.embed(documents),
                 ids=ids
             )
+            self.catalog.record_filing(ticker, filing_type, filing_date, accession, item_chunks)
             print(f"✓ Cached {len(documents)} chunks from {filing_type} ({filing_date}) for {ticker}")
 
         return filing_id
@@ -650,90 +1082,104 @@ class FinancialRAGManager:
 
         return chunks
 
+    def _filing_chunk_ids(self, entry: dict, items: list[str]) -> list[tuple[str, int, str]]:
+        """Deterministic chunk IDs for the given items of a manifest entry."""
+        filing_id = f"{entry['ticker']}_{entry['filing_type']}_{entry['filing_date']}_{entry['accession']}"
+        return [
+            (item_name, i, f"{filing_id}_{item_name}_c{i}")
+            for item_name in items
+            for i in range(entry["items"][item_name])
+        ]
+
+    def iter_cached_filing_chunks(
+        self,
+        ticker: str,
+        filing_type: str,
+        filing_date: str | None = None,
+        items: list[str] | None = None,
+        batch_size: int = 4
+    ) -> Iterator[tuple[str, int, str]]:
+        """
+        Stream the chunks of a cached SEC filing, a few at a time.
+
+        The filing is resolved in the manifest, then chunks are fetched by ID
+        in batches of `batch_size`, so at most one batch of (up to 8000
+        character) chunks is held in memory.
+
+        Args:
+            ticker: Stock ticker symbol
+            filing_type: Filing type (10-K, 10-Q)
+            filing_date: Optional specific date (defaults to most recent)
+            items: Item names to read (default: all cached items)
+            batch_size: Chunks per Chroma round trip
+
+        Yields:
+            (item_name, chunk_num, text) in item order, then chunk order
+        """
+        entry = self.catalog.get_filing(ticker, filing_type, filing_date)
+        if entry is None:
+            return
+
+        wanted = [name for name in (items or entry["items"]) if name in entry["items"]]
+        chunk_ids = self._filing_chunk_ids(entry, wanted)
+
+        for start in range(0, len(chunk_ids), batch_size):
+            batch = chunk_ids[start:start + batch_size]
+            results = self.filings_collection.get(
+                ids=[chunk_id for _, _, chunk_id in batch],
+                include=["documents"]
+            )
+            documents = dict(zip(results["ids"], results["documents"]))
+
+            for item_name, chunk_num, chunk_id in batch:
+                if chunk_id in documents:
+                    yield item_name, chunk_num, documents[chunk_id]
+
     def get_cached_filing(
         self,
         ticker: str,
         filing_type: str,
-        filing_date: str | None = None
+        filing_date: str | None = None,
+        items: list[str] | None = None
     ) -> dict[str, str] | None:
         """
         Retrieve a cached SEC filing from ChromaDB.
 
+        The latest filing is resolved from the manifest and only the chunks of
+        the requested items are fetched.
+
         Args:
             ticker: Stock ticker symbol
             filing_type: Filing type (10-K, 10-Q)
             filing_date: Optional specific date (defaults to most recent)
+            items: Item names to load, e.g. ["item1a"] (default: all cached items)
 
         Returns:
             Dictionary with item names as keys and content as values,
             or None if not found
         """
-        # Build filter
-        if filing_date:
-            where_filter = {
-                "$and": [
-                    {"ticker": ticker.upper()},
-                    {"filing_type": filing_type},
-                    {"filing_date": filing_date}
-                ]
-            }
-        else:
-            where_filter = {
-                "$and": [
-                    {"ticker": ticker.upper()},
-                    {"filing_type": filing_type}
-                ]
-            }
+        entry = self.catalog.get_filing(ticker, filing_type, filing_date)
+        if entry is None:
+            return None
 
-        # Get all matching documents
-        results = self.filings_collection.get(
-            where=where_filter,
-            include=["documents", "metadatas"]
-        )
+        # Chunks arrive in item, then chunk order
+        item_chunks: dict[str, list[str]] = {}
+        for item_name, _, text in self.iter_cached_filing_chunks(
+            ticker, filing_type, entry["filing_date"], items=items, batch_size=16
+        ):
+            item_chunks.setdefault(item_name, []).append(text)
 
-        if not results["documents"]:
+        if not item_chunks:
             return None
 
-        # Find the most recent filing if no specific date
-        if not filing_date:
-            # Group by filing_date and get the most recent
-            dates = set(m.get("filing_date", "") for m in results["metadatas"])
-            if dates:
-                filing_date = max(dates)
-                # Re-filter for just that date
-                filtered_docs = []
-                filtered_metas = []
-                for doc, meta in zip(results["documents"], results["metadatas"]):
-                    if meta.get("filing_date") == filing_date:
-                        filtered_docs.append(doc)
-                        filtered_metas.append(meta)
-                results["documents"] = filtered_docs
-                results["metadatas"] = filtered_metas
-
-        # Reconstruct items from chunks
-        items = {}
-        item_chunks = {}  # {item_name: [(chunk_num, content), ...]}
-
-        for doc, meta in zip(results["documents"], results["metadatas"]):
-            item_name = meta.get("item_name", "unknown")
-            chunk_num = meta.get("chunk_num", 0)
-
-            if item_name not in item_chunks:
-                item_chunks[item_name] = []
-            item_chunks[item_name].append((chunk_num, doc))
-
-        # Sort chunks and join
-        for item_name, chunks in item_chunks.items():
-            sorted_chunks = sorted(chunks, key=lambda x: x[0])
-            items[item_name] = '\n\n'.join(chunk[1] for chunk in sorted_chunks)
+        result = {item_name: '\n\n'.join(chunks) for item_name, chunks in item_chunks.items()}
 
         # Add metadata
-        if results["metadatas"]:
-            items["_filing_date"] = results["metadatas"][0].get("filing_date", "")
-            items["_accession"] = results["metadatas"][0].get("accession", "")
-            items["_filing_type"] = results["metadatas"][0].get("filing_type", "")
+        result["_filing_date"] = entry["filing_date"]
+        result["_accession"] = entry["accession"]
+        result["_filing_type"] = entry["filing_type"]
 
-        return items
+        return result
 
     def check_filing_cached(
         self,
@@ -752,28 +1198,7 @@ class FinancialRAGManager:
         Returns:
             True if cached, False otherwise
         """
-        if filing_date:
-            where_filter = {
-                "$and": [
-                    {"ticker": ticker.upper()},
-                    {"filing_type": filing_type},
-                    {"filing_date": filing_date}
-                ]
-            }
-        else:
-            where_filter = {
-                "$and": [
-                    {"ticker": ticker.upper()},
-                    {"filing_type": filing_type}
-                ]
-            }
-
-        results = self.filings_collection.get(
-            where=where_filter,
-            limit=1
-        )
-
-        return len(results["ids"]) > 0
+        return self.catalog.get_filing(ticker, filing_type, filing_date) is not None
 
     def search_filings(
         self,
@@ -820,48 +1245,37 @@ class FinancialRAGManager:
         Returns:
             List of filing summaries
         """
-        all_docs = self.filings_collection.get(include=["metadatas"])
-
-        # Group by ticker, filing_type, filing_date
-        filings = {}
-        for meta in all_docs["metadatas"]:
-            key = (
-                meta.get("ticker", ""),
-                meta.get("filing_type", ""),
-                meta.get("filing_date", "")
-            )
-            if key not in filings:
-                filings[key] = {
-                    "ticker": key[0],
-                    "filing_type": key[1],
-                    "filing_date": key[2],
-                    "accession": meta.get("accession", ""),
-                    "items": set(),
-                    "chunks": 0
-                }
-            filings[key]["items"].add(meta.get("item_name", ""))
-            filings[key]["chunks"] += 1
-
-        # Convert to list
-        result = []
-        for filing in filings.values():
-            filing["items"] = list(filing["items"])
-            result.append(filing)
-
-        return sorted(result, key=lambda x: (x["ticker"], x["filing_date"]), reverse=True)
+        return [
+            {
+                "ticker": entry["ticker"],
+                "filing_type": entry["filing_type"],
+                "filing_date": entry["filing_date"],
+                "accession": entry["accession"],
+                "items": list(entry["items"]),
+                "chunks": entry["chunk_count"]
+            }
+            for entry in self.catalog.list_filings()
+        ]
 
     def reset(self):
         """Reset/clear the entire collection (use with caution)."""
         self.client.delete_collection("financial_analyses")
         self.collection = self.client.get_or_create_collection(
             name="financial_analyses",
+            embedding_function=self.embedding_function,
             metadata={"hnsw:space": "cosine"}
         )
+        self.catalog.clear()
+        self.lexical_index.clear()
+        if self.answer_cache:
+            self.answer_cache.clear()
 
     def reset_filings_cache(self):
         """Reset/clear the SEC filings cache (use with caution)."""
         self.client.delete_collection("sec_filings_cache")
         self.filings_collection = self.client.get_or_create_collection(
             name="sec_filings_cache",
+            embedding_function=self.embedding_function,
             metadata={"hnsw:space": "cosine"}
         )
+        self.catalog.clear_filings()
@@ -0,0 +1,279 @@
+"""
+Token-aware context packing for the RAG synthesis prompt.
+
+Retrieved chunks used to be pasted into the prompt verbatim. Chunks from
+`_chunk_markdown` overlap by one paragraph and every chunk repeats its
+section heading, so neighbouring hits from the same section repeat text.
+Packing turns the hits into a smaller context:
+
+1. Adjacent chunks (consecutive `chunk_num`) of the same section of the same
+   analysis are merged into one excerpt, dropping the overlap paragraph.
+2. Paragraphs already included by a higher-ranked excerpt are dropped.
+3. Excerpts are added in retrieval order (the order the hybrid reranker or
+   the vector search returned) until the token budget is spent; an excerpt
+   that does not fit is cut at a paragraph boundary. Results of several
+   batched searches concatenated into one (marked `"merged": True`) have no
+   common rank, but share one query embedding, so they are ordered by
+   distance instead.
+
+Token counts are estimated at ~4 characters per token, which is close enough
+for budgeting and needs no tokenizer download.
+
+Usage:
+    packed = pack_context(search_results, token_budget=8000)
+    prompt = f"...{packed.text}..."
+    print(f"saved {packed.tokens_saved} tokens")
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+CHARS_PER_TOKEN = 4
+
+# Shorter paragraphs (table rules, bold labels, "---") legitimately repeat
+MIN_DEDUP_CHARS = 40
+
+EXCERPT_SEPARATOR = "\n\n---\n\n"
+
+NO_RESULTS_TEXT = "No relevant excerpts found."
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a text."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class PackedContext:
+    """Packed prompt context plus packing statistics."""
+
+    text: str
+    chunks: int = 0             # Retrieved chunks given to the packer
+    excerpts: int = 0           # Excerpts in the packed text
+    dropped: int = 0            # Excerpts left out to stay within budget
+    tokens_before: int = 0      # Estimated tokens of the verbatim excerpts
+    tokens_after: int = 0       # Estimated tokens of the packed text
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.tokens_before - self.tokens_after)
+
+
+@dataclass
+class _Excerpt:
+    rank: int                   # Best retrieval rank among merged chunks
+    distance: float             # Best (lowest) distance among merged chunks
+    metadata: Dict[str, Any]
+    paragraphs: List[str]
+    last_chunk_num: Optional[int]
+
+
+def _normalize(paragraph: str) -> str:
+    return " ".join(paragraph.split()).lower()
+
+
+def _split_paragraphs(document: str, section: str) -> List[str]:
+    """Paragraphs of a chunk, without the "### Section" heading it starts with."""
+    text = document.strip()
+    heading = f"### {section}" if section else None
+    if heading and text.startswith(heading):
+        text = text[len(heading):]
+    return [paragraph.strip() for paragraph in text.split("\n\n") if paragraph.strip()]
+
+
+def _section_key(metadata: Dict[str, Any]) -> Optional[Tuple]:
+    """Chunks sharing this key come from the same section of the same analysis."""
+    if metadata.get("chunk_num") is None or not metadata.get("section"):
+        return None
+    return (
+        metadata.get("ticker"),
+        metadata.get("analysis_type"),
+        metadata.get("period"),
+        metadata.get("filing"),
+        metadata.get("section_num"),
+        metadata.get("section"),
+    )
+
+
+def _merge_adjacent(
+    hits: List[Tuple[int, str, Dict[str, Any], float]],
+    by_distance: bool = False,
+) -> List[_Excerpt]:
+    """Group hits into excerpts, merging consecutive chunks of one section, best first."""
+    by_section: Dict[Tuple, List[Tuple[int, str, Dict[str, Any], float]]] = {}
+    excerpts: List[_Excerpt] = []
+
+    for hit in hits:
+        key = _section_key(hit[2])
+        if key is None:
+            rank, document, metadata, distance = hit
+            excerpts.append(_Excerpt(rank, distance, metadata, _split_paragraphs(document, ""), None))
+        else:
+            by_section.setdefault(key, []).append(hit)
+
+    for section_hits in by_section.values():
+        section_hits.sort(key=lambda hit: int(hit[2]["chunk_num"]))
+        current: Optional[_Excerpt] = None
+
+        for rank, document, metadata, distance in section_hits:
+            chunk_num = int(metadata["chunk_num"])
+            paragraphs = _split_paragraphs(document, metadata.get("section", ""))
+
+            if current is not None and current.last_chunk_num is not None and chunk_num == current.last_chunk_num + 1:
+                # _chunk_markdown repeats the previous chunk's last paragraph
+                if paragraphs and current.paragraphs and _normalize(paragraphs[0]) == _normalize(current.paragraphs[-1]):
+                    paragraphs = paragraphs[1:]
+                current.paragraphs.extend(paragraphs)
+                current.rank = min(current.rank, rank)
+                current.distance = min(current.distance, distance)
+                current.last_chunk_num = chunk_num
+            elif current is not None and current.last_chunk_num == chunk_num:
+                # Same chunk retrieved twice (e.g. by two batched searches)
+                current.rank = min(current.rank, rank)
+                current.distance = min(current.distance, distance)
+            else:
+                current = _Excerpt(rank, distance, metadata, paragraphs, chunk_num)
+                excerpts.append(current)
+
+    if by_distance:
+        excerpts.sort(key=lambda excerpt: (excerpt.distance, excerpt.rank))
+    else:
+        excerpts.sort(key=lambda excerpt: excerpt.rank)
+    return excerpts
+
+
+def _render_header(number: int, metadata: Dict[str, Any], distance: float) -> str:
+    ticker = metadata.get('ticker', 'Unknown')
+    analysis_type = metadata.get('analysis_type', 'Unknown').replace('_', ' ').title()
+    period = metadata.get('period', 'Unknown')
+    company = metadata.get('company', '')
+    section = metadata.get('section', '')
+
+    # ChromaDB cosine distance: 0 = identical, 2 = opposite
+    relevance_pct = max(0, (1 - distance / 2) * 100)
+
+    header = f"**Excerpt {number}** [{ticker}"
+    if company:
+        header += f" - {company}"
+    header += "]"
+
+    details = f"- **Source**: {analysis_type}"
+    if period:
+        details += f"\n- **Period**: {period}"
+    if section:
+        details += f"\n- **Section**: {section}"
+    details += f"\n- **Relevance**: {relevance_pct:.1f}%"
+
+    return f"{header}\n{details}"
+
+
+def render_excerpt(number: int, metadata: Dict[str, Any], distance: float, body: str) -> str:
+    """Format one excerpt (header, metadata details, fenced content)."""
+    return f"{_render_header(number, metadata, distance)}\n\n```\n{body.strip()}\n```"
+
+
+def _flatten(search_results: Dict[str, Any]) -> List[Tuple[int, str, Dict[str, Any], float]]:
+    if not search_results or 'documents' not in search_results:
+        return []
+
+    documents = search_results['documents'][0] if search_results['documents'] else []
+    metadatas = search_results['metadatas'][0] if search_results.get('metadatas') else []
+    distances = search_results['distances'][0] if search_results.get('distances') else []
+
+    return [
+        (rank, document or "", metadata or {}, distance)
+        for rank, (document, metadata, distance) in enumerate(zip(documents, metadatas, distances))
+    ]
+
+
+def format_verbatim(search_results: Dict[str, Any]) -> str:
+    """Format every hit as-is (the unpacked context, used as the savings baseline)."""
+    hits = _flatten(search_results)
+    if not hits:
+        return NO_RESULTS_TEXT
+    return EXCERPT_SEPARATOR.join(
+        render_excerpt(number, metadata, distance, document)
+        for number, (_, document, metadata, distance) in enumerate(hits, 1)
+    )
+
+
+def pack_context(search_results: Dict[str, Any], token_budget: Optional[int] = None) -> PackedContext:
+    """
+    Pack retrieved chunks into a deduplicated, budgeted prompt context.
+
+    Args:
+        search_results: Chroma-style results ('documents', 'metadatas', 'distances'),
+            best first; 'merged': True if several searches were concatenated
+        token_budget: Maximum estimated tokens of the packed text (None or 0 = no limit).
+            The top excerpt is always included, cut down if necessary.
+
+    Returns:
+        PackedContext with the text and token statistics
+    """
+    hits = _flatten(search_results)
+    if not hits:
+        return PackedContext(text=NO_RESULTS_TEXT)
+
+    tokens_before = estimate_tokens(format_verbatim(search_results))
+
+    seen = set()
+    rendered: List[str] = []
+    used_tokens = 0
+    dropped = 0
+    separator_tokens = estimate_tokens(EXCERPT_SEPARATOR)
+
+    for excerpt in _merge_adjacent(hits, by_distance=bool(search_results.get('merged'))):
+        paragraphs = []
+        excerpt_seen = set()
+        for paragraph in excerpt.paragraphs:
+            normalized = _normalize(paragraph)
+            if len(normalized) >= MIN_DEDUP_CHARS:
+                if normalized in seen or normalized in excerpt_seen:
+                    continue
+                excerpt_seen.add(normalized)
+            paragraphs.append(paragraph)
+
+        if not paragraphs:
+            continue
+
+        number = len(rendered) + 1
+        if token_budget:
+            overhead = estimate_tokens(render_excerpt(number, excerpt.metadata, excerpt.distance, ""))
+            if rendered:
+                overhead += separator_tokens
+            available = token_budget - used_tokens - overhead
+
+            kept, kept_tokens = [], 0
+            for paragraph in paragraphs:
+                cost = estimate_tokens(paragraph + "\n\n")
+                if kept_tokens + cost > available:
+                    break
+                kept.append(paragraph)
+                kept_tokens += cost
+
+            if not kept:
+                if rendered:
+                    dropped += 1
+                    continue
+                # Always give the agent something: the start of the best excerpt
+                kept = [paragraphs[0][:max(available, 100) * CHARS_PER_TOKEN]]
+            paragraphs = kept
+
+        seen.update(_normalize(paragraph) for paragraph in paragraphs)
+        excerpt_text = render_excerpt(number, excerpt.metadata, excerpt.distance, "\n\n".join(paragraphs))
+        used_tokens += estimate_tokens(excerpt_text) + (separator_tokens if rendered else 0)
+        rendered.append(excerpt_text)
+
+    text = EXCERPT_SEPARATOR.join(rendered) if rendered else NO_RESULTS_TEXT
+    return PackedContext(
+        text=text,
+        chunks=len(hits),
+        excerpts=len(rendered),
+        dropped=dropped,
+        tokens_before=tokens_before,
+        tokens_after=estimate_tokens(text),
+    )
@@ -0,0 +1,208 @@
+"""
+Batched embedding stage for knowledge-base indexing.
+
+Chroma embeds documents itself when they are passed without vectors, one
+upsert call at a time, and re-embeds identical text on every re-index or
+Modal sync. This module computes embeddings before the upsert instead:
+
+- Texts from many files and tickers are embedded in fixed-size batches.
+- Vectors are cached on disk, keyed by (sha256 of text, model), so text that
+  was ever embedded with the same model is never embedded again.
+
+The cache lives next to the Chroma files (`<persist_directory>/embedding_cache.db`).
+
+Usage:
+    pipeline = EmbeddingPipeline(embedding_function, EmbeddingCache(path), batch_size=64)
+    vectors = pipeline.embed(texts)
+    collection.add(ids=ids, documents=texts, embeddings=vectors)
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+import logging
+
+import numpy as np
+
+from financial_research_agent.cache.connection_pool import SQLiteConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+EMBEDDING_CACHE_FILENAME = "embedding_cache.db"
+
+DEFAULT_BATCH_SIZE = 64
+
+# SQLite's default limit on bound parameters is 999 on older builds
+LOOKUP_CHUNK_SIZE = 500
+
+EMBEDDING_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    text_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,              -- float32 bytes
+    PRIMARY KEY (text_hash, model)
+)
+"""
+
+
+def text_hash(text: str) -> str:
+    """Cache key for one text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def embedding_model_key(embedding_function: Any) -> str:
+    """
+    Identify the model behind a Chroma embedding function.
+
+    Combines the function's registered name with its configured model
+    (e.g. "openai:text-embedding-3-small"), so switching models never
+    returns vectors from another model.
+    """
+    try:
+        name = embedding_function.name()
+    except Exception:
+        name = type(embedding_function).__name__
+
+    try:
+        config = embedding_function.get_config() or {}
+    except Exception:
+        config = {}
+
+    model = config.get("model_name") or config.get("model")
+    return f"{name}:{model}" if model else name
+
+
+class EmbeddingCache:
+    """Persistent (text hash, model) -> vector store."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path to the cache SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
+
+        with self._pool.connection() as conn:
+            conn.execute(EMBEDDING_CACHE_SCHEMA)
+
+    def get_many(self, hashes: Sequence[str], model: str) -> Dict[str, np.ndarray]:
+        """
+        Look up cached vectors.
+
+        Returns:
+            Text hash -> vector for every hash found
+        """
+        found = {}
+        unique = list(dict.fromkeys(hashes))
+
+        with self._pool.connection() as conn:
+            for start in range(0, len(unique), LOOKUP_CHUNK_SIZE):
+                batch = unique[start:start + LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings WHERE model = ? AND text_hash IN ({placeholders})",
+                    (model, *batch)
+                ).fetchall()
+                for row in rows:
+                    found[row["text_hash"]] = np.frombuffer(row["vector"], dtype=np.float32)
+
+        return found
+
+    def put_many(self, vectors: Dict[str, Sequence[float]], model: str):
+        """Store vectors keyed by text hash."""
+        rows = []
+        for key, vector in vectors.items():
+            array = np.asarray(vector, dtype=np.float32)
+            rows.append((key, model, int(array.shape[0]), array.tobytes()))
+
+        with self._pool.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (text_hash, model, dim, vector) VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cached vector counts per model."""
+        with self._pool.connection() as conn:
+            rows = conn.execute("SELECT model, COUNT(*) AS n FROM embeddings GROUP BY model").fetchall()
+        return {row["model"]: row["n"] for row in rows}
+
+
+class EmbeddingPipeline:
+    """
+    Cache-first, batched embedding of document texts.
+
+    Features:
+    - One cache lookup for all texts, then only misses are embedded
+    - Misses embedded in `batch_size` batches (duplicates embedded once)
+    - Hit/miss counters for the last and all calls
+    """
+
+    def __init__(
+        self,
+        embedding_function: Any,
+        cache: Optional[EmbeddingCache] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            embedding_function: Chroma embedding function (callable on a list of texts)
+            cache: Persistent vector cache (None = no caching)
+            batch_size: Texts per embedding call
+        """
+        self.embedding_function = embedding_function
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
+        self.model = embedding_model_key(embedding_function)
+        self.stats = {"cached": 0, "embedded": 0, "batches": 0}
+
+    def embed(self, texts: Sequence[str]) -> List[List[float]]:
+        """
+        Embed texts, reusing cached vectors.
+
+        Args:
+            texts: Document texts
+
+        Returns:
+            One vector per text, in input order
+        """
+        if not texts:
+            return []
+
+        hashes = [text_hash(text) for text in texts]
+        vectors = self.cache.get_many(hashes, self.model) if self.cache else {}
+
+        # Unique misses only: identical chunks across files are embedded once
+        missing = {}
+        for key, text in zip(hashes, texts):
+            if key not in vectors:
+                missing.setdefault(key, text)
+
+        cached_count = len(texts) - sum(1 for key in hashes if key in missing)
+        self.stats["cached"] += cached_count
+
+        if missing:
+            keys = list(missing)
+            computed = {}
+            for start in range(0, len(keys), self.batch_size):
+                batch_keys = keys[start:start + self.batch_size]
+                batch_vectors = self.embedding_function([missing[key] for key in batch_keys])
+                computed.update(zip(batch_keys, batch_vectors))
+                self.stats["batches"] += 1
+
+            self.stats["embedded"] += len(computed)
+            if self.cache:
+                self.cache.put_many(computed, self.model)
+            vectors.update({key: np.asarray(vector, dtype=np.float32) for key, vector in computed.items()})
+
+            logger.info(f"Embedded {len(computed)} texts ({cached_count} from cache) with {self.model}")
+
+        return [vectors[key].tolist() for key in hashes]
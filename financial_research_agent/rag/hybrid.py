@@ -0,0 +1,249 @@
+"""
+Hybrid lexical + vector retrieval for the analysis knowledge base.
+
+Cosine ANN search alone misses exact figures and line-item names ("Total
+current liabilities", "CET1"). This module adds:
+
+- LexicalIndex: a BM25 index (SQLite FTS5) over the same chunks as the
+  `financial_analyses` collection, maintained at index time.
+- reciprocal_rank_fusion: merges the vector and BM25 rankings.
+- Rerankers: a dependency-free heuristic (query-term coverage, exact phrase
+  and figure matches) and an optional local cross-encoder
+  (sentence-transformers, if installed).
+
+The index lives next to the Chroma files (`<persist_directory>/lexical_index.db`).
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import logging
+
+from financial_research_agent.cache.connection_pool import SQLiteConnectionPool
+
+logger = logging.getLogger(__name__)
+
+
+LEXICAL_INDEX_FILENAME = "lexical_index.db"
+
+# Standard RRF constant (Cormack et al.); dampens the weight of top ranks
+RRF_K = 60
+
+LEXICAL_INDEX_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+    text,
+    chunk_id UNINDEXED,
+    ticker UNINDEXED,
+    analysis_type UNINDEXED,
+    tokenize = 'porter unicode61'
+)
+"""
+
+# Words that carry no lexical signal in financial questions
+STOPWORDS = frozenset("""
+a an and are as at be by did do does for from had has have how in is it its of on or
+the their there these this those to was were what when where which who why will with
+""".split())
+
+
+def query_terms(text: str) -> List[str]:
+    """Lower-cased word tokens of a query, stopwords removed, order kept."""
+    return [term for term in re.findall(r"\w+", text.lower()) if term not in STOPWORDS]
+
+
+class LexicalIndex:
+    """BM25 (SQLite FTS5) index of knowledge-base chunks."""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Initialize the index.
+
+        Args:
+            db_path: Path to the index SQLite file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = SQLiteConnectionPool(self.db_path)
+
+        with self._pool.connection() as conn:
+            conn.execute(LEXICAL_INDEX_SCHEMA)
+
+    def add(self, chunks: Iterable[Dict[str, Any]]):
+        """
+        Index chunks.
+
+        Args:
+            chunks: Dicts with "id", "text" and "metadata" (ticker, analysis_type)
+        """
+        rows = [
+            (chunk["text"], chunk["id"], chunk["metadata"].get("ticker", ""), chunk["metadata"].get("analysis_type", ""))
+            for chunk in chunks
+        ]
+        if not rows:
+            return
+
+        with self._pool.transaction() as conn:
+            # FTS5 has no primary key: drop any previous copy first
+            conn.executemany("DELETE FROM chunks_fts WHERE chunk_id = ?", [(row[1],) for row in rows])
+            conn.executemany(
+                "INSERT INTO chunks_fts (text, chunk_id, ticker, analysis_type) VALUES (?, ?, ?, ?)",
+                rows
+            )
+
+    def delete(self, chunk_ids: Iterable[str]):
+        chunk_ids = [(chunk_id,) for chunk_id in chunk_ids]
+        if chunk_ids:
+            with self._pool.transaction() as conn:
+                conn.executemany("DELETE FROM chunks_fts WHERE chunk_id = ?", chunk_ids)
+
+    def search(
+        self,
+        query: str,
+        ticker: Optional[str] = None,
+        analysis_type: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Tuple[str, float]]:
+        """
+        BM25 search.
+
+        Args:
+            query: Natural language query (any query term may match)
+            ticker: Optional ticker filter
+            analysis_type: Optional analysis type filter
+            limit: Maximum hits
+
+        Returns:
+            (chunk_id, bm25 score) best first; lower scores are better in FTS5
+        """
+        terms = list(dict.fromkeys(query_terms(query)))
+        if not terms:
+            return []
+
+        sql = "SELECT chunk_id, bm25(chunks_fts) AS score FROM chunks_fts WHERE chunks_fts MATCH ?"
+        params: List[Any] = [" OR ".join(f'"{term}"' for term in terms)]
+        if ticker:
+            sql += " AND ticker = ?"
+            params.append(ticker.upper())
+        if analysis_type:
+            sql += " AND analysis_type = ?"
+            params.append(analysis_type)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        with self._pool.connection() as conn:
+            return [(row["chunk_id"], row["score"]) for row in conn.execute(sql, params).fetchall()]
+
+    def count(self) -> int:
+        with self._pool.connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM chunks_fts").fetchone()[0]
+
+    def clear(self):
+        with self._pool.transaction() as conn:
+            conn.execute("DELETE FROM chunks_fts")
+
+    def rebuild_from_collection(self, collection: Any) -> int:
+        """
+        Index every chunk of an existing collection.
+
+        Used once for knowledge bases indexed before the lexical index existed.
+
+        Returns:
+            Number of chunks indexed
+        """
+        all_docs = collection.get(include=["documents", "metadatas"])
+        self.add(
+            {"id": chunk_id, "text": document or "", "metadata": metadata or {}}
+            for chunk_id, document, metadata in zip(all_docs["ids"], all_docs["documents"], all_docs["metadatas"])
+        )
+        return len(all_docs["ids"])
+
+
+def reciprocal_rank_fusion(rankings: Sequence[Sequence[str]], k: int = RRF_K) -> Dict[str, float]:
+    """
+    Fuse several best-first rankings of IDs.
+
+    Returns:
+        ID -> fused score (higher is better), in descending score order
+    """
+    scores: Dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank + 1)
+    return dict(sorted(scores.items(), key=lambda item: item[1], reverse=True))
+
+
+class HeuristicReranker:
+    """
+    Dependency-free reranker for financial questions.
+
+    Adds to the fused retrieval score:
+    - coverage: share of distinct query terms present in the chunk
+    - phrase: the chunk contains an adjacent query term pair verbatim
+      (line items such as "current liabilities")
+    - figures: share of numeric query terms present in the chunk
+    """
+
+    COVERAGE_WEIGHT = 0.5
+    PHRASE_WEIGHT = 0.3
+    FIGURE_WEIGHT = 0.3
+
+    def rerank(self, query: str, documents: Sequence[str], base_scores: Sequence[float]) -> List[float]:
+        terms = list(dict.fromkeys(query_terms(query)))
+        bigrams = [f"{a} {b}" for a, b in zip(terms, terms[1:])]
+        figures = [term for term in terms if any(ch.isdigit() for ch in term)]
+        top = max(base_scores, default=0.0) or 1.0
+
+        scores = []
+        for document, base in zip(documents, base_scores):
+            text = " ".join(re.findall(r"\w+", document.lower()))
+            words = set(text.split())
+
+            coverage = sum(term in words for term in terms) / len(terms) if terms else 0.0
+            phrase = 1.0 if any(f" {bigram} " in f" {text} " for bigram in bigrams) else 0.0
+            figure = sum(term in words for term in figures) / len(figures) if figures else 0.0
+
+            scores.append(
+                base / top
+                + self.COVERAGE_WEIGHT * coverage
+                + self.PHRASE_WEIGHT * phrase
+                + self.FIGURE_WEIGHT * figure
+            )
+        return scores
+
+
+class CrossEncoderReranker:
+    """Local cross-encoder reranker (requires sentence-transformers)."""
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import CrossEncoder
+
+        self.model = CrossEncoder(model_name)
+
+    def rerank(self, query: str, documents: Sequence[str], base_scores: Sequence[float]) -> List[float]:
+        return [float(score) for score in self.model.predict([(query, document) for document in documents])]
+
+
+def create_reranker(name: str, cross_encoder_model: Optional[str] = None) -> Optional[Any]:
+    """
+    Build a reranker by name.
+
+    Args:
+        name: "heuristic", "cross-encoder" or "none"
+        cross_encoder_model: Model for the cross-encoder reranker
+
+    Returns:
+        Reranker, or None if reranking is disabled
+    """
+    name = (name or "none").lower()
+    if name == "none":
+        return None
+
+    if name == "cross-encoder":
+        try:
+            return CrossEncoderReranker(cross_encoder_model)
+        except ImportError:
+            logger.warning("sentence-transformers not installed; falling back to heuristic reranker")
+        except Exception as e:
+            logger.warning(f"Could not load cross-encoder {cross_encoder_model}: {e}; falling back to heuristic reranker")
+
+    return HeuristicReranker()
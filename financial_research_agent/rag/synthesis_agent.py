@@ -4,6 +4,8 @@ RAG Synthesis Agent for synthesizing ChromaDB query results into coherent respon
 This lightweight agent is optimized for conversational Q&A over the indexed financial analyses.
 """
 
+import logging
+import threading
 from pydantic import BaseModel, Field
 from datetime import datetime
 from agents.agent import Agent
@@ -12,6 +14,10 @@ from agents.agent_output import AgentOutputSchema
 
 # Import config to ensure .env is loaded
 from financial_research_agent import config  # noqa: F401
+from financial_research_agent.utils.event_loop import run_coroutine
+from financial_research_agent.rag.context_packing import pack_context
+
+logger = logging.getLogger(__name__)
 
 
 RAG_SYNTHESIS_PROMPT = """You are a financial research assistant specializing in synthesizing
@@ -209,6 +215,14 @@ class RAGResponse(BaseModel):
     )
 
 
+def _synthesis_instructions(context, agent) -> str:
+    """Render the prompt at run time, so cached agents always see the current time."""
+    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    # Don't use .format() to avoid errors with curly braces in user queries/context
+    return RAG_SYNTHESIS_PROMPT.replace('{current_time}', current_time)
+
+
 def create_rag_synthesis_agent(enable_web_search: bool = True) -> Agent:
     """
     Create a RAG synthesis agent configured for financial Q&A.
@@ -222,18 +236,12 @@ def create_rag_synthesis_agent(enable_web_search: bool = True) -> Agent:
     from financial_research_agent.tools.brave_search import brave_search
     from financial_research_agent.config import AgentConfig
 
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-
-    # Build instructions by replacing current_time placeholder
-    # Don't use .format() to avoid errors with curly braces in user queries/context
-    instructions = RAG_SYNTHESIS_PROMPT.replace('{current_time}', current_time)
-
     # Build agent configuration
     # Use WRITER_MODEL from config (gpt-5 for quality synthesis)
     # Wrap output type to disable strict JSON schema (dict types not supported in strict mode)
     agent_config = {
         "name": "RAG Synthesis Agent",
-        "instructions": instructions,
+        "instructions": _synthesis_instructions,
         "model": AgentConfig.WRITER_MODEL,  # Use configured model (gpt-5 for OpenAI)
         "output_type": AgentOutputSchema(RAGResponse, strict_json_schema=False)
     }
@@ -253,29 +261,70 @@ def create_rag_synthesis_agent(enable_web_search: bool = True) -> Agent:
     return Agent(**agent_config)
 
 
+_agent_cache: dict[tuple, Agent] = {}
+_agent_cache_lock = threading.Lock()
+
+
+def get_rag_synthesis_agent(enable_web_search: bool = True) -> Agent:
+    """
+    Get a shared RAG synthesis agent (built once per configuration).
+
+    Agents are stateless between runs, so one instance serves every query.
+
+    Args:
+        enable_web_search: Whether to enable Brave Search fallback (default: True)
+
+    Returns:
+        Cached Agent
+    """
+    from financial_research_agent.config import AgentConfig
+
+    key = (enable_web_search, AgentConfig.WRITER_MODEL, AgentConfig.WRITER_REASONING_EFFORT)
+    with _agent_cache_lock:
+        agent = _agent_cache.get(key)
+        if agent is None:
+            agent = _agent_cache[key] = create_rag_synthesis_agent(enable_web_search)
+        return agent
+
+
 def synthesize_rag_results(
     query: str,
     search_results: dict,
-    max_turns: int = 3
+    max_turns: int = 3,
+    token_budget: int | None = None
 ) -> RAGResponse:
     """
     Synthesize RAG search results into a coherent answer.
 
+    The agent runs on the shared background event loop, so this works from
+    any thread (command line, Gradio workers, Jupyter) without creating a
+    new thread or event loop per call.
+
     Args:
         query: The user's question
         search_results: Raw results from ChromaDB query (documents, metadatas, distances)
         max_turns: Maximum agent turns (default: 3 for quick responses)
+        token_budget: Maximum estimated context tokens (default: AgentConfig.RAG_CONTEXT_TOKEN_BUDGET)
 
     Returns:
         RAGResponse with synthesized answer, sources, confidence, and limitations
     """
-    import asyncio
+    from financial_research_agent.config import AgentConfig
 
-    # Format the context for the synthesis agent
-    context = _format_search_results(search_results)
+    if token_budget is None:
+        token_budget = AgentConfig.RAG_CONTEXT_TOKEN_BUDGET
 
-    # Create the agent
-    agent = create_rag_synthesis_agent()
+    # Pack the context for the synthesis agent (dedupe, merge, fit the budget)
+    packed = pack_context(search_results, token_budget)
+    context = packed.text
+    if packed.chunks:
+        logger.info(
+            f"Context packed: {packed.chunks} chunks → {packed.excerpts} excerpts, "
+            f"{packed.tokens_before} → {packed.tokens_after} tokens (saved {packed.tokens_saved})"
+        )
+
+    # Reuse the shared agent
+    agent = get_rag_synthesis_agent()
 
     # Build the prompt
     prompt = f"""## User's Question
@@ -291,108 +340,24 @@ def synthesize_rag_results(
 Please synthesize these excerpts into a clear, well-cited answer to the user's question.
 """
 
-    # Run the agent - handle event loop properly for Gradio worker threads
-    # Always run in a separate thread to avoid event loop conflicts
-    # This works in all contexts: command-line, Gradio, Jupyter, etc.
-    import concurrent.futures
-    import threading
-
-    # Check if we're in the main thread
-    is_main_thread = threading.current_thread() is threading.main_thread()
-
-    if not is_main_thread:
-        # We're in a worker thread (like Gradio's AnyIO worker thread)
-        # Run the agent in a separate thread with its own event loop
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(_run_agent_sync, agent, prompt, max_turns)
-            result = future.result()
-    else:
-        # We're in the main thread - check if there's a running loop
-        try:
-            asyncio.get_running_loop()
-            # There's a running loop, use a separate thread
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(_run_agent_sync, agent, prompt, max_turns)
-                result = future.result()
-        except RuntimeError:
-            # No running loop in main thread - safe to run directly
-            result = Runner.run_sync(agent, prompt, max_turns=max_turns)
+    result = run_coroutine(Runner.run(agent, prompt, max_turns=max_turns))
 
     # Extract the structured response
     return result.final_output_as(RAGResponse)
 
 
-def _run_agent_sync(agent, prompt, max_turns):
-    """Helper to run agent in a new event loop."""
-    import asyncio
-
-    # Create a new event loop for this thread
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    try:
-        # Run the agent using the new loop
-        return Runner.run_sync(agent, prompt, max_turns=max_turns)
-    finally:
-        # Clean up the loop
-        loop.close()
-        asyncio.set_event_loop(None)
-
-
-def _format_search_results(search_results: dict) -> str:
+def _format_search_results(search_results: dict, token_budget: int | None = None) -> str:
     """
     Format ChromaDB search results for the synthesis agent.
 
     Args:
         search_results: Dictionary with 'documents', 'metadatas', 'distances' keys
+        token_budget: Maximum estimated context tokens (None or 0 = no limit)
 
     Returns:
-        Formatted string with excerpts and metadata
+        Formatted string with packed excerpts and metadata
     """
-    if not search_results or 'documents' not in search_results:
-        return "No relevant excerpts found."
-
-    documents = search_results['documents'][0] if search_results['documents'] else []
-    metadatas = search_results['metadatas'][0] if search_results.get('metadatas') else []
-    distances = search_results['distances'][0] if search_results.get('distances') else []
-
-    if not documents:
-        return "No relevant excerpts found."
-
-    formatted_excerpts = []
-
-    for i, (doc, metadata, distance) in enumerate(zip(documents, metadatas, distances), 1):
-        # Extract metadata fields
-        ticker = metadata.get('ticker', 'Unknown')
-        analysis_type = metadata.get('analysis_type', 'Unknown').replace('_', ' ').title()
-        period = metadata.get('period', 'Unknown')
-        company = metadata.get('company', '')
-        section = metadata.get('section', '')
-
-        # Format relevance score (lower distance = higher relevance)
-        # ChromaDB cosine distance: 0 = identical, 2 = opposite
-        relevance_pct = max(0, (1 - distance/2) * 100)
-
-        # Build excerpt header
-        header = f"**Excerpt {i}** [{ticker}"
-        if company:
-            header += f" - {company}"
-        header += f"]"
-
-        # Add metadata details
-        details = f"- **Source**: {analysis_type}"
-        if period:
-            details += f"\n- **Period**: {period}"
-        if section:
-            details += f"\n- **Section**: {section}"
-        details += f"\n- **Relevance**: {relevance_pct:.1f}%"
-
-        # Add the excerpt content
-        excerpt_text = f"\n\n```\n{doc.strip()}\n```"
-
-        formatted_excerpts.append(f"{header}\n{details}{excerpt_text}")
-
-    return "\n\n---\n\n".join(formatted_excerpts)
+    return pack_context(search_results, token_budget).text
 
 
 # Convenience function for backward compatibility
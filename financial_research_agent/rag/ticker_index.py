@@ -0,0 +1,374 @@
+"""
+Local ticker / company-name index for query parsing.
+
+Ticker extraction used to confirm every unknown 3-5 letter token with a live
+edgartools Company lookup. This index answers the same question from memory:
+
+- SEC's company tickers file (https://www.sec.gov/files/company_tickers.json)
+  is kept on disk and refreshed in a background thread once it is older than
+  `refresh_hours`, so the query path never waits on the network.
+- Company names are matched with a word-level trie (longest match first).
+  Curated aliases ("apple", "jp morgan") always match; SEC names only match
+  as multi-word phrases, since single words ("target", "block") are too
+  ambiguous to trust without curation.
+
+Usage:
+    index = get_ticker_index()
+    index.is_ticker("AAPL")                       # True
+    index.match_names("bank of america vs citi")  # ["BAC"]
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+SEC_COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+
+DEFAULT_INDEX_PATH = "data/sec_company_tickers.json"
+DEFAULT_REFRESH_HOURS = 24
+
+# How long a cold-start lookup waits for the first download before falling back
+DEFAULT_COLD_START_WAIT_SECONDS = 2.0
+
+# Curated company name -> ticker aliases (always trusted, single words included)
+COMPANY_ALIASES = {
+    "apple": "AAPL",
+    "microsoft": "MSFT",
+    "msft": "MSFT",
+    "tesla": "TSLA",
+    "google": "GOOGL",
+    "alphabet": "GOOGL",
+    "amazon": "AMZN",
+    "meta": "META",
+    "facebook": "META",
+    "nvidia": "NVDA",
+    "amd": "AMD",
+    "intel": "INTC",
+    "netflix": "NFLX",
+    "disney": "DIS",
+    "berkshire": "BRK.B",
+    "berkshire hathaway": "BRK.B",
+    "jpmorgan": "JPM",
+    "jp morgan": "JPM",
+    "bank of america": "BAC",
+    "wells fargo": "WFC",
+    "goldman sachs": "GS",
+    "morgan stanley": "MS",
+    "citigroup": "C",
+    "visa": "V",
+    "mastercard": "MA",
+    "paypal": "PYPL",
+    "salesforce": "CRM",
+    "oracle": "ORCL",
+    "ibm": "IBM",
+    "cisco": "CSCO",
+    "walmart": "WMT",
+    "costco": "COST",
+    "target": "TGT",
+    "home depot": "HD",
+    "lowes": "LOW",
+    "nike": "NKE",
+    "adidas": "ADDYY",
+    "starbucks": "SBUX",
+    "mcdonald": "MCD",
+    "mcdonalds": "MCD",
+    "coca cola": "KO",
+    "pepsi": "PEP",
+    "pepsico": "PEP",
+    "procter": "PG",
+    "johnson": "JNJ",
+    "pfizer": "PFE",
+    "merck": "MRK",
+    "abbvie": "ABBV",
+    "eli lilly": "LLY",
+    "exxon": "XOM",
+    "chevron": "CVX",
+    "conocophillips": "COP",
+    "boeing": "BA",
+    "lockheed": "LMT",
+    "raytheon": "RTX",
+    "ge": "GE",
+    "general electric": "GE",
+    "ford": "F",
+    "gm": "GM",
+    "general motors": "GM",
+    "rivian": "RIVN",
+    "lucid": "LCID",
+    "palantir": "PLTR",
+    "snowflake": "SNOW",
+    "datadog": "DDOG",
+    "mongodb": "MDB",
+    "crowdstrike": "CRWD",
+    "zoom": "ZM",
+    "slack": "WORK",
+    "docusign": "DOCU",
+    "shopify": "SHOP",
+    "square": "SQ",
+    "block": "SQ",
+    "coinbase": "COIN",
+    "robinhood": "HOOD",
+    "airbnb": "ABNB",
+    "uber": "UBER",
+    "lyft": "LYFT",
+    "doordash": "DASH",
+    "spotify": "SPOT",
+    # Australian Banks (map to ADR tickers for SEC filings)
+    "national australia bank": "NABZY",
+    "nab": "NABZY",
+    "anz": "ANZLY",
+    "anz bank": "ANZLY",
+    "westpac": "WBKCY",
+    "commonwealth bank": "CMWAY",
+    "cba": "CMWAY",
+}
+
+# Legal-form words dropped from the end of SEC company titles
+NAME_SUFFIXES = frozenset({
+    "inc", "incorporated", "corp", "corporation", "co", "company", "ltd", "limited",
+    "plc", "llc", "lp", "sa", "ag", "nv", "se", "holdings", "holding", "group",
+    "the", "de", "class", "a", "b", "new",
+})
+
+_TERMINAL = "$"
+
+
+def name_tokens(text: str) -> List[str]:
+    """Lower-cased word tokens ("Coca-Cola Co." -> ["coca", "cola", "co"])."""
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def _strip_suffixes(tokens: List[str]) -> List[str]:
+    tokens = list(tokens)
+    while tokens and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return tokens
+
+
+class TickerIndex:
+    """
+    In-memory ticker set and company-name trie built from SEC's tickers file.
+
+    Features:
+    - O(1) ticker validation, no network on lookups
+    - Longest-match word trie over curated aliases and multi-word SEC names
+    - Background refresh when the on-disk copy is older than `refresh_hours`
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_INDEX_PATH,
+        refresh_hours: float = DEFAULT_REFRESH_HOURS,
+        aliases: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the index (aliases only until load() or refresh() succeeds).
+
+        Args:
+            path: On-disk copy of SEC's company tickers file
+            refresh_hours: Age after which ensure_fresh() re-downloads the file
+            aliases: Curated name -> ticker aliases (default: COMPANY_ALIASES)
+        """
+        self.path = Path(path)
+        self.refresh_hours = refresh_hours
+        self.aliases = COMPANY_ALIASES if aliases is None else aliases
+
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._tickers: Dict[str, Dict[str, Any]] = {}
+        self._trie: Dict[str, Any] = {}
+        self._build({})
+
+    # ========================================
+    # BUILD / LOAD / REFRESH
+    # ========================================
+
+    @staticmethod
+    def _trie_insert(trie: Dict[str, Any], tokens: List[str], ticker: str, overwrite: bool):
+        node = trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if overwrite or _TERMINAL not in node:
+            node[_TERMINAL] = ticker
+
+    def _build(self, sec_data: Dict[str, Any]):
+        """Swap in a new ticker map and trie built from SEC data + aliases."""
+        tickers: Dict[str, Dict[str, Any]] = {}
+        trie: Dict[str, Any] = {}
+
+        # SEC lists the primary share class first for each company
+        for entry in sec_data.values():
+            ticker = str(entry.get("ticker", "")).upper().replace("-", ".")
+            if not ticker:
+                continue
+            tickers.setdefault(ticker, {"cik": entry.get("cik_str"), "name": entry.get("title", "")})
+
+            tokens = _strip_suffixes(name_tokens(entry.get("title", "")))
+            if len(tokens) >= 2:
+                self._trie_insert(trie, tokens, ticker, overwrite=False)
+
+        for alias, ticker in self.aliases.items():
+            self._trie_insert(trie, name_tokens(alias), ticker, overwrite=True)
+
+        with self._lock:
+            self._tickers = tickers
+            self._trie = trie
+
+    def load(self) -> bool:
+        """
+        Load the on-disk tickers file.
+
+        Returns:
+            True if the file was loaded
+        """
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return False
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable ticker index {self.path}: {e}")
+            return False
+
+        self._build(data)
+        logger.info(f"Loaded ticker index: {len(self._tickers)} tickers")
+        return True
+
+    def refresh(self) -> bool:
+        """
+        Download SEC's tickers file, save it, and rebuild the index.
+
+        Returns:
+            True on success (failures keep the current index)
+        """
+        from financial_research_agent.cache.http_cache import get_http_client
+
+        try:
+            response = get_http_client().get(SEC_COMPANY_TICKERS_URL, timeout=30.0)
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            logger.warning(f"Could not refresh ticker index: {e}")
+            return False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, self.path)
+
+        self._build(data)
+        logger.info(f"Refreshed ticker index: {len(self._tickers)} tickers")
+        return True
+
+    def is_stale(self) -> bool:
+        try:
+            age_hours = (time.time() - self.path.stat().st_mtime) / 3600
+        except FileNotFoundError:
+            return True
+        return age_hours > self.refresh_hours
+
+    def ensure_fresh(self) -> Optional[threading.Thread]:
+        """
+        Start a background refresh if the on-disk copy is missing or stale.
+
+        Returns:
+            The refresh thread, or None if no refresh was needed or one is running
+        """
+        with self._lock:
+            if not self.is_stale():
+                return None
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return None
+            self._refresh_thread = threading.Thread(target=self.refresh, name="ticker-index-refresh", daemon=True)
+            self._refresh_thread.start()
+            return self._refresh_thread
+
+    def wait_until_loaded(self, timeout: float = DEFAULT_COLD_START_WAIT_SECONDS) -> bool:
+        """
+        Briefly wait for a running refresh when no SEC data is loaded yet.
+
+        Args:
+            timeout: Maximum seconds to wait for the refresh thread
+
+        Returns:
+            True if SEC data is loaded
+        """
+        thread = self._refresh_thread
+        if not self.is_loaded and thread is not None and thread.is_alive():
+            thread.join(timeout)
+        return self.is_loaded
+
+    # ========================================
+    # LOOKUPS (memory only)
+    # ========================================
+
+    @property
+    def is_loaded(self) -> bool:
+        """True once SEC data is available (aliases alone do not count)."""
+        return bool(self._tickers)
+
+    def is_ticker(self, ticker: str) -> bool:
+        """Check whether a symbol is an SEC-registered ticker."""
+        return ticker.upper().replace("-", ".") in self._tickers
+
+    def company(self, ticker: str) -> Optional[Dict[str, Any]]:
+        """Get {"cik", "name"} for a ticker, or None."""
+        return self._tickers.get(ticker.upper().replace("-", "."))
+
+    def match_names(self, text: str) -> List[str]:
+        """
+        Find company names in text (longest match wins, non-overlapping).
+
+        Returns:
+            Tickers in order of appearance (deduplicated)
+        """
+        tokens = name_tokens(text)
+        trie = self._trie
+        found: List[str] = []
+
+        i = 0
+        while i < len(tokens):
+            node = trie
+            match_ticker, match_end = None, i
+            j = i
+            while j < len(tokens) and tokens[j] in node:
+                node = node[tokens[j]]
+                j += 1
+                if _TERMINAL in node:
+                    match_ticker, match_end = node[_TERMINAL], j
+
+            if match_ticker:
+                if match_ticker not in found:
+                    found.append(match_ticker)
+                i = match_end
+            else:
+                i += 1
+
+        return found
+
+
+_default_index: Optional[TickerIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_ticker_index() -> TickerIndex:
+    """
+    Get the process-wide ticker index.
+
+    Loads the on-disk copy on first use and starts a background refresh if it
+    is missing or stale; lookups never wait for the download.
+    """
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = TickerIndex()
+            _default_index.load()
+            _default_index.ensure_fresh()
+        return _default_index
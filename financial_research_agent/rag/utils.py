@@ -8,11 +8,16 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+from financial_research_agent.rag.ticker_index import COMPANY_ALIASES, get_ticker_index
+
 
 def _validate_ticker_with_edgar(ticker: str) -> bool:
     """
     Validate if a ticker is real using edgartools Company lookup.
 
+    Only used while the local ticker index has no SEC data yet (first start,
+    or SEC unreachable), so explicit tickers are not dropped.
+
     Args:
         ticker: Potential ticker symbol to validate
 
@@ -54,117 +59,13 @@ def extract_tickers_from_query(query: str) -> list[str]:
     explicit_tickers = re.findall(r'\b([A-Za-z]{1,5}(?:\.[A-Za-z])?)\b', query)
     explicit_tickers = [t.upper() for t in explicit_tickers]
 
-    # Company name to ticker mapping
-    company_map = {
-        "apple": "AAPL",
-        "microsoft": "MSFT",
-        "msft": "MSFT",
-        "tesla": "TSLA",
-        "google": "GOOGL",
-        "alphabet": "GOOGL",
-        "amazon": "AMZN",
-        "meta": "META",
-        "facebook": "META",
-        "nvidia": "NVDA",
-        "amd": "AMD",
-        "intel": "INTC",
-        "netflix": "NFLX",
-        "disney": "DIS",
-        "berkshire": "BRK.B",
-        "berkshire hathaway": "BRK.B",
-        "jpmorgan": "JPM",
-        "jp morgan": "JPM",
-        "bank of america": "BAC",
-        "wells fargo": "WFC",
-        "goldman sachs": "GS",
-        "morgan stanley": "MS",
-        "citigroup": "C",
-        "visa": "V",
-        "mastercard": "MA",
-        "paypal": "PYPL",
-        "salesforce": "CRM",
-        "oracle": "ORCL",
-        "ibm": "IBM",
-        "cisco": "CSCO",
-        "walmart": "WMT",
-        "costco": "COST",
-        "target": "TGT",
-        "home depot": "HD",
-        "lowes": "LOW",
-        "nike": "NKE",
-        "adidas": "ADDYY",
-        "starbucks": "SBUX",
-        "mcdonald": "MCD",
-        "mcdonalds": "MCD",
-        "coca cola": "KO",
-        "pepsi": "PEP",
-        "pepsico": "PEP",
-        "procter": "PG",
-        "johnson": "JNJ",
-        "pfizer": "PFE",
-        "merck": "MRK",
-        "abbvie": "ABBV",
-        "eli lilly": "LLY",
-        "exxon": "XOM",
-        "chevron": "CVX",
-        "conocophillips": "COP",
-        "boeing": "BA",
-        "lockheed": "LMT",
-        "raytheon": "RTX",
-        "ge": "GE",
-        "general electric": "GE",
-        "ford": "F",
-        "gm": "GM",
-        "general motors": "GM",
-        "rivian": "RIVN",
-        "lucid": "LCID",
-        "palantir": "PLTR",
-        "snowflake": "SNOW",
-        "datadog": "DDOG",
-        "mongodb": "MDB",
-        "crowdstrike": "CRWD",
-        "zoom": "ZM",
-        "slack": "WORK",
-        "docusign": "DOCU",
-        "shopify": "SHOP",
-        "square": "SQ",
-        "block": "SQ",
-        "coinbase": "COIN",
-        "robinhood": "HOOD",
-        "airbnb": "ABNB",
-        "uber": "UBER",
-        "lyft": "LYFT",
-        "doordash": "DASH",
-        "spotify": "SPOT",
-        # Australian Banks (map to ADR tickers for SEC filings)
-        "national australia bank": "NABZY",
-        "nab": "NABZY",
-        "anz": "ANZLY",
-        "anz bank": "ANZLY",
-        "westpac": "WBKCY",
-        "commonwealth bank": "CMWAY",
-        "cba": "CMWAY",
-    }
-
-    query_lower = query.lower()
-    name_tickers = []
+    # Company names (curated aliases + multi-word SEC names), longest match first
+    ticker_index = get_ticker_index()
+    name_tickers = ticker_index.match_names(query)
 
-    # Check for multi-word company names first
-    multi_word_companies = {k: v for k, v in company_map.items() if " " in k}
-    for name, ticker in multi_word_companies.items():
-        if name in query_lower:
-            name_tickers.append(ticker)
+    # Strategy: Combine company name matches + explicit ticker matches
 
-    # Then check single-word company names
-    single_word_companies = {k: v for k, v in company_map.items() if " " not in k}
-    for name, ticker in single_word_companies.items():
-        # Use word boundaries to avoid partial matches
-        if re.search(rf'\b{re.escape(name)}\b', query_lower):
-            name_tickers.append(ticker)
-
-    # Strategy: Combine company_map matches + explicit ticker matches
-
-    # Common English words that will NEVER be tickers (fast filter before edgartools check)
+    # Common English words that will NEVER be tickers (fast filter before index lookup)
     # IMPORTANT: Keep this list MINIMAL - only words guaranteed to never be ticker symbols
     # The smart filter below handles context-based filtering (e.g., "main" in "main revenue")
     common_words = {
@@ -195,6 +96,7 @@ def extract_tickers_from_query(query: str) -> list[str]:
 
     # Process explicit tickers - filter false positives
     validated_explicit_tickers = []
+    index_loaded = None  # Checked lazily: only unknown-looking tokens need it
     # Build set of already-matched tickers from company names to avoid duplicates
     matched_from_names = set(name_tickers)
 
@@ -219,9 +121,9 @@ def extract_tickers_from_query(query: str) -> list[str]:
 
         # Check if this might be a company name written in various cases
         # (e.g., "Apple", "apple", or even "APPLE" for the company)
-        if ticker.lower() in company_map:
+        if ticker.lower() in COMPANY_ALIASES:
             # This word matches a known company name
-            mapped_ticker = company_map[ticker.lower()]
+            mapped_ticker = COMPANY_ALIASES[ticker.lower()]
             if mapped_ticker not in matched_from_names:
                 # We haven't already added this ticker via company name matching
                 validated_explicit_tickers.append(mapped_ticker)
@@ -235,11 +137,17 @@ def extract_tickers_from_query(query: str) -> list[str]:
             # Skip it to avoid false positives
             continue
 
-        # Final validation: Check with edgartools if this is a real SEC-registered ticker
-        # This catches edge cases that aren't in our common_words list
-        if _validate_ticker_with_edgar(ticker):
+        # Final validation: Check the local SEC ticker index (no network call)
+        # This catches edge cases that aren't in our common_words list.
+        # Until the index has been downloaded once, fall back to edgartools.
+        if index_loaded is None:
+            index_loaded = ticker_index.wait_until_loaded()
+        if index_loaded:
+            is_valid = ticker_index.is_ticker(ticker)
+        else:
+            is_valid = _validate_ticker_with_edgar(ticker)
+        if is_valid:
             validated_explicit_tickers.append(ticker)
-        # If edgartools says it's invalid, skip it (silently filtered)
 
     # Combine name matches + explicit ticker matches (deduplicate)
     all_tickers = list(set(name_tickers + validated_explicit_tickers))
@@ -247,7 +155,7 @@ def extract_tickers_from_query(query: str) -> list[str]:
     # Smart filter: If we found explicit company mentions (Apple, Microsoft, etc.),
     # filter out weak ticker matches that are likely common words
     if name_tickers:
-        # We have strong company matches from company_map
+        # We have strong company name matches
         # Filter out any ticker that appears as lowercase in the original query
         # (likely a common word, not a ticker reference)
         filtered_tickers = []
@@ -1,11 +1,13 @@
 # EdgarTools Integration Wrapper
 # Uses Entity Facts API for reliable, pre-aggregated financial data
 
-from edgar import Company, set_identity
+from edgar import set_identity
 import pandas as pd
 from typing import Dict, Optional, Any
 import os
 
+from financial_research_agent.cache.filing_registry import get_filing_registry
+
 class EdgarToolsWrapper:
     """
     Wrapper around edgartools using Entity Facts API.
@@ -132,7 +134,7 @@ class EdgarToolsWrapper:
 
         Automatically handles segmented presentations.
         """
-        company = Company(ticker)
+        company = get_filing_registry().company(ticker)
 
         # Get balance sheet - periods=2 for current + prior
         balance_sheet = company.balance_sheet(periods=2)
@@ -267,7 +269,7 @@ class EdgarToolsWrapper:
 
         Automatically handles segmented presentations (e.g., Disney's segment revenue).
         """
-        company = Company(ticker)
+        company = get_filing_registry().company(ticker)
 
         # Get income statement - periods=2 for current + prior
         income_statement = company.income_statement(periods=2)
@@ -368,7 +370,7 @@ class EdgarToolsWrapper:
         """
         Extract key cash flow items using Entity Facts API.
         """
-        company = Company(ticker)
+        company = get_filing_registry().company(ticker)
 
         # Get cash flow statement - periods=2 for current + prior
         cash_flow = company.cash_flow(periods=2)
@@ -439,7 +441,7 @@ class EdgarToolsWrapper:
 
         Uses Entity Facts API for pre-aggregated, reliable data.
         """
-        company = Company(ticker)
+        company = get_filing_registry().company(ticker)
 
         # Get income statement data (includes filing_form metadata)
         income_data = self.get_income_statement_data(ticker)
@@ -519,7 +521,7 @@ class EdgarToolsWrapper:
         """
         try:
             logger.info(f"Starting segment extraction for {ticker}")
-            company = Company(ticker)
+            company = get_filing_registry().company(ticker)
 
             # Default forms to try (in priority order: quarterly, annual, foreign)
             if forms is None:
@@ -0,0 +1,80 @@
+"""
+Bounded thread pool for blocking EDGAR I/O.
+
+edgartools (Company, get_filings, xbrl(), obj()), the requests-based XBRL
+calculation linkbase fetch and pandas CSV exports are all synchronous.
+Called directly from a coroutine they stall the whole event loop: concurrent
+web searches, agent runs and Gradio progress updates all wait for them.
+
+Coroutines hand such work to a dedicated pool instead. The pool is small on
+purpose: SEC allows roughly 10 requests per second per client, and each
+extraction issues several requests.
+
+Usage:
+    from financial_research_agent.utils.edgar_executor import run_edgar_io
+
+    filings = await run_edgar_io(company.get_filings, form="10-K")
+    data = await run_edgar_io(extract_sync, ticker, use_cache=True)
+"""
+
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_EDGAR_IO_WORKERS = 4
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_edgar_executor() -> ThreadPoolExecutor:
+    """Get the process-wide EDGAR I/O pool (created on first use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            try:
+                from financial_research_agent.config import AgentConfig
+                max_workers = AgentConfig.EDGAR_IO_WORKERS
+            except Exception:
+                max_workers = DEFAULT_EDGAR_IO_WORKERS
+            _executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="edgar-io")
+            logger.debug(f"Started EDGAR I/O executor with {max_workers} workers")
+        return _executor
+
+
+async def run_edgar_io(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking call on the EDGAR I/O pool without blocking the event loop.
+
+    Context variables (e.g. the active agents trace) are carried into the
+    worker thread.
+
+    Args:
+        func: Blocking callable
+        *args, **kwargs: Arguments for func
+
+    Returns:
+        func's result (exceptions propagate to the awaiting coroutine)
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(get_edgar_executor(), call)
+
+
+def shutdown_edgar_executor(wait: bool = True) -> None:
+    """Stop the pool (a new one is created on next use)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
@@ -0,0 +1,195 @@
+"""
+Long-lived background event loop for calling async code from sync code.
+
+Gradio runs handlers in worker threads, and several sync code paths need to
+await agents or async HTTP clients. Creating a thread pool and a fresh event
+loop per call (and tearing it down afterwards) adds startup cost to every
+request and throws away every connection the async clients opened.
+
+This module runs one event loop forever in a daemon thread. Sync callers
+submit coroutines to it and get concurrent.futures.Future objects back, so
+loop-bound resources (agents, httpx.AsyncClient pools) live across requests.
+
+LoopLagMonitor measures how responsive a running loop stays, to catch
+blocking calls made on the loop thread.
+
+Usage:
+    from financial_research_agent.utils.event_loop import run_coroutine, submit_coroutine
+
+    result = run_coroutine(Runner.run(agent, prompt))     # block for the result
+    future = submit_coroutine(fetch_all())                # or keep working
+    ...
+    data = future.result(timeout=30)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Optional, TypeVar
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """An asyncio event loop running forever in a daemon thread."""
+
+    def __init__(self, name: str = "background-event-loop"):
+        """
+        Start the loop thread.
+
+        Args:
+            name: Thread name (shows up in thread dumps)
+        """
+        self.loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        self._started.wait()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.call_soon(self._started.set)
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread.is_alive() and not self.loop.is_closed()
+
+    def in_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable[T]) -> "Future[T]":
+        """
+        Schedule a coroutine on the loop.
+
+        Returns:
+            concurrent.futures.Future resolving to the coroutine's result
+        """
+        if not self.is_running:
+            raise RuntimeError("Background event loop is not running")
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and block until it finishes.
+
+        Must not be called from the loop thread itself (it would deadlock);
+        code running on the loop should simply await the coroutine.
+        """
+        if self.in_loop_thread():
+            raise RuntimeError("run() called from the background loop thread; await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    def stop(self):
+        """Stop the loop and wait for its thread to exit."""
+        if self.is_running:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the running event loop wakes up.
+
+    A coroutine repeatedly sleeps for `interval` and records how much later
+    than requested it resumed. Blocking calls made on the loop thread show up
+    directly as lag; a loop whose blocking work is offloaded stays near zero.
+
+    Usage:
+        async with LoopLagMonitor() as monitor:
+            await do_work()
+        print(monitor.stats())
+    """
+
+    def __init__(self, interval: float = 0.05, stall_threshold: float = 0.25):
+        """
+        Initialize the monitor.
+
+        Args:
+            interval: Seconds between samples
+            stall_threshold: Lag (seconds) counted as a stall
+        """
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.samples: list[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    async def _sample(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start - self.interval))
+
+    def start(self):
+        """Start sampling on the running loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._sample(), name="loop-lag-monitor")
+
+    async def stop(self) -> dict:
+        """Stop sampling and return stats()."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        stats = self.stats()
+        if stats["stalls"]:
+            logger.warning(
+                f"Event loop stalled {stats['stalls']} times (max lag {stats['max_lag_ms']:.0f}ms)"
+            )
+        return stats
+
+    def stats(self) -> dict:
+        """Get lag statistics in milliseconds."""
+        if not self.samples:
+            return {"samples": 0, "max_lag_ms": 0.0, "mean_lag_ms": 0.0, "p95_lag_ms": 0.0, "stalls": 0}
+
+        ordered = sorted(self.samples)
+        return {
+            "samples": len(ordered),
+            "max_lag_ms": round(ordered[-1] * 1000, 1),
+            "mean_lag_ms": round(sum(ordered) / len(ordered) * 1000, 1),
+            "p95_lag_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+            "stalls": sum(1 for lag in ordered if lag >= self.stall_threshold),
+        }
+
+    async def __aenter__(self) -> "LoopLagMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+
+_default_loop: Optional[BackgroundEventLoop] = None
+_default_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundEventLoop:
+    """Get the process-wide background loop (started on first use)."""
+    global _default_loop
+    with _default_loop_lock:
+        if _default_loop is None or not _default_loop.is_running:
+            _default_loop = BackgroundEventLoop()
+            logger.debug("Started background event loop thread")
+        return _default_loop
+
+
+def submit_coroutine(coro: Awaitable[T]) -> "Future[T]":
+    """Schedule a coroutine on the process-wide background loop."""
+    return get_background_loop().submit(coro)
+
+
+def run_coroutine(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Run a coroutine on the process-wide background loop and wait for its result."""
+    return get_background_loop().run(coro, timeout)
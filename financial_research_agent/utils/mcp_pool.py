@@ -0,0 +1,350 @@
+"""
+Long-lived pool of MCP servers shared by concurrent analyses.
+
+Starting the SEC EDGAR MCP server means spawning a subprocess through uvx,
+which takes seconds (30-60s on a cold cache). Starting and tearing one down
+inside every research run made every web analysis pay that cost.
+
+The pool keeps servers connected for the life of the process:
+
+- Each server is owned by a supervisor task that connects it, health-checks
+  it periodically (list_tools), restarts it if it crashes, and cleans it up
+  on shutdown. MCP stdio clients must be entered and exited in the same
+  task, which is why one task owns each server's whole life.
+- Analyses take a lease (`async with pool.lease() as server`) and get the
+  healthy server with the fewest active leases. MCP sessions multiplex
+  requests, so one server can serve several leases at once.
+- Servers are bound to the event loop they were started on, so there is one
+  pool per loop (get_edgar_server_pool). The web app marks its pool
+  persistent and shuts it down at exit; one-off runs (CLI) shut theirs down
+  after the run.
+
+Usage:
+    pool = get_edgar_server_pool()
+    async with pool.lease() as server:
+        agent = edgar_agent.clone(mcp_servers=[server])
+"""
+
+import asyncio
+import atexit
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CONNECT_TIMEOUT = 90.0       # First uvx run downloads the package
+DEFAULT_HEALTH_CHECK_INTERVAL = 60.0
+DEFAULT_HEALTH_CHECK_TIMEOUT = 15.0
+MAX_RESTART_BACKOFF = 60.0
+
+
+class _PooledServer:
+    """One pool slot: a server plus the supervisor task that owns it."""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.server: Optional[Any] = None
+        self.leases = 0
+        self.restarts = 0
+        self.last_error: Optional[str] = None
+        self.ready = asyncio.Event()         # Connected and healthy
+        self.attempted = asyncio.Event()     # First connection attempt finished (either way)
+        self.wake = asyncio.Event()          # Stop requested or failure reported
+        self.stopping = False
+        self.task: Optional[asyncio.Task] = None
+
+
+class MCPServerPool:
+    """
+    Process-level pool of connected MCP servers.
+
+    Features:
+    - Supervised servers: health checks, restart with backoff, clean shutdown
+    - Least-loaded leases shared by concurrent analyses
+    - Failed leases trigger an immediate health check of their server
+    """
+
+    def __init__(
+        self,
+        server_factory: Callable[[], Any],
+        size: int = 1,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL,
+        health_check_timeout: float = DEFAULT_HEALTH_CHECK_TIMEOUT,
+        name: str = "mcp",
+    ):
+        """
+        Initialize the pool (servers start on start() or the first lease).
+
+        Args:
+            server_factory: Creates a new, unconnected MCP server
+            size: Number of servers to keep connected
+            connect_timeout: Seconds allowed for one connection attempt
+            health_check_interval: Seconds between health checks of an idle server
+            health_check_timeout: Seconds allowed for one health check
+            name: Name used in logs
+        """
+        self.server_factory = server_factory
+        self.size = max(1, size)
+        self.connect_timeout = connect_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.name = name
+        self.persistent = False
+
+        self._slots: list[_PooledServer] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._start_lock: Optional[asyncio.Lock] = None
+
+    # ========================================
+    # LIFECYCLE
+    # ========================================
+
+    @property
+    def is_started(self) -> bool:
+        return bool(self._slots)
+
+    @property
+    def active_leases(self) -> int:
+        return sum(slot.leases for slot in self._slots)
+
+    async def start(self, persistent: bool = False) -> int:
+        """
+        Start the servers and wait for each first connection attempt.
+
+        Idempotent; later calls only update `persistent`.
+
+        Args:
+            persistent: Keep the servers across runs (shut down at process exit)
+
+        Returns:
+            Number of healthy servers
+        """
+        if persistent and not self.persistent:
+            self.persistent = True
+            atexit.register(self.shutdown_threadsafe)
+
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+
+        async with self._start_lock:
+            if not self._slots:
+                self._loop = asyncio.get_running_loop()
+                self._slots = [_PooledServer(i) for i in range(self.size)]
+                for slot in self._slots:
+                    slot.task = asyncio.create_task(self._supervise(slot), name=f"{self.name}-server-{slot.index}")
+                logger.info(f"Starting {self.size} {self.name} server(s)")
+
+        await asyncio.gather(*(slot.attempted.wait() for slot in self._slots))
+        return sum(1 for slot in self._slots if slot.ready.is_set())
+
+    async def shutdown(self, timeout: float = 10.0):
+        """
+        Stop every server and wait for their cleanup.
+
+        Args:
+            timeout: Seconds to wait before cancelling supervisors still connecting
+        """
+        slots, self._slots = self._slots, []
+        for slot in slots:
+            slot.stopping = True
+            slot.wake.set()
+
+        tasks = [slot.task for slot in slots if slot.task]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if slots:
+            logger.info(f"Stopped {len(slots)} {self.name} server(s)")
+
+    def shutdown_threadsafe(self, timeout: float = 10.0):
+        """Shut down from another thread (atexit); a no-op if the pool's loop has stopped."""
+        loop = self._loop
+        if not self._slots or loop is None or loop.is_closed() or not loop.is_running():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.shutdown(timeout), loop).result(timeout + 5)
+        except Exception as e:
+            logger.warning(f"{self.name} pool shutdown did not complete: {e}")
+
+    async def _supervise(self, slot: _PooledServer):
+        """Own one server: connect, health-check, restart on failure, clean up on stop."""
+        backoff = 1.0
+
+        while not slot.stopping:
+            server = self.server_factory()
+            try:
+                async with asyncio.timeout(self.connect_timeout):
+                    await server.connect()
+            except Exception as e:
+                slot.last_error = f"{type(e).__name__}: {e}"
+                logger.warning(f"{self.name} server {slot.index} failed to connect: {slot.last_error}")
+                await self._cleanup(server)
+                slot.attempted.set()
+                await self._sleep_unless_woken(slot, backoff)
+                backoff = min(backoff * 2, MAX_RESTART_BACKOFF)
+                slot.restarts += 1
+                continue
+
+            backoff = 1.0
+            slot.server = server
+            slot.last_error = None
+            slot.ready.set()
+            slot.attempted.set()
+
+            # Idle until the next health check, a reported failure, or shutdown
+            while not slot.stopping:
+                await self._sleep_unless_woken(slot, self.health_check_interval)
+                if slot.stopping:
+                    break
+                slot.wake.clear()
+                if not await self._is_healthy(server):
+                    slot.last_error = slot.last_error or "health check failed"
+                    logger.warning(f"{self.name} server {slot.index} unhealthy, restarting")
+                    slot.restarts += 1
+                    break
+
+            slot.ready.clear()
+            slot.server = None
+            await self._cleanup(server)
+
+    async def _sleep_unless_woken(self, slot: _PooledServer, seconds: float):
+        try:
+            await asyncio.wait_for(slot.wake.wait(), timeout=seconds)
+        except TimeoutError:
+            pass
+
+    async def _is_healthy(self, server: Any) -> bool:
+        try:
+            async with asyncio.timeout(self.health_check_timeout):
+                await server.list_tools()
+            return True
+        except Exception:
+            return False
+
+    async def _cleanup(self, server: Any):
+        try:
+            await server.cleanup()
+        except Exception as e:
+            logger.debug(f"{self.name} server cleanup error: {e}")
+
+    # ========================================
+    # LEASES
+    # ========================================
+
+    @asynccontextmanager
+    async def lease(self, timeout: Optional[float] = None) -> AsyncIterator[Any]:
+        """
+        Borrow a connected server.
+
+        Args:
+            timeout: Seconds to wait for a healthy server (default: connect_timeout)
+
+        Yields:
+            Connected MCP server (shared with other leases; do not clean it up)
+
+        Raises:
+            TimeoutError: No server became healthy in time
+        """
+        await self.start()
+        slot = await self._acquire(self.connect_timeout if timeout is None else timeout)
+
+        slot.leases += 1
+        try:
+            yield slot.server
+        except Exception:
+            # Let the supervisor check the server now rather than at the next interval
+            slot.wake.set()
+            raise
+        finally:
+            slot.leases -= 1
+
+    async def _acquire(self, timeout: float) -> _PooledServer:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        while True:
+            ready = [slot for slot in self._slots if slot.ready.is_set() and slot.server is not None]
+            if ready:
+                return min(ready, key=lambda slot: slot.leases)
+
+            remaining = deadline - loop.time()
+            if remaining <= 0 or not self._slots:
+                errors = "; ".join(slot.last_error for slot in self._slots if slot.last_error)
+                raise TimeoutError(f"No healthy {self.name} server available" + (f" ({errors})" if errors else ""))
+
+            waiters = [asyncio.create_task(slot.ready.wait()) for slot in self._slots]
+            try:
+                await asyncio.wait(waiters, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+    def stats(self) -> dict[str, Any]:
+        """Get per-server status (healthy, leases, restarts, last error)."""
+        return {
+            "size": self.size,
+            "persistent": self.persistent,
+            "servers": [
+                {
+                    "index": slot.index,
+                    "healthy": slot.ready.is_set(),
+                    "leases": slot.leases,
+                    "restarts": slot.restarts,
+                    "last_error": slot.last_error,
+                }
+                for slot in self._slots
+            ],
+        }
+
+
+def create_edgar_server() -> Any:
+    """Create an (unconnected) SEC EDGAR MCP server from EdgarConfig."""
+    from agents.mcp import MCPServerStdio
+    from financial_research_agent.config import EdgarConfig
+
+    params = {
+        "command": EdgarConfig.MCP_SERVER_COMMAND,
+        "args": EdgarConfig.MCP_SERVER_ARGS,
+        "env": EdgarConfig.get_mcp_env(),
+    }
+    tool_filter = None
+    if EdgarConfig.ALLOWED_EDGAR_TOOLS:
+        tool_filter = {"allowed_tool_names": EdgarConfig.ALLOWED_EDGAR_TOOLS}
+
+    return MCPServerStdio(
+        params=params,
+        client_session_timeout_seconds=60.0,  # Increased from default 5.0 (first uvx run)
+        tool_filter=tool_filter,
+    )
+
+
+_edgar_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, MCPServerPool]" = weakref.WeakKeyDictionary()
+_edgar_pools_lock = threading.Lock()
+
+
+def get_edgar_server_pool() -> MCPServerPool:
+    """
+    Get the SEC EDGAR MCP server pool of the running event loop.
+
+    Must be called from a coroutine (servers are bound to their loop).
+    """
+    from financial_research_agent.config import EdgarConfig
+
+    loop = asyncio.get_running_loop()
+    with _edgar_pools_lock:
+        pool = _edgar_pools.get(loop)
+        if pool is None:
+            pool = _edgar_pools[loop] = MCPServerPool(
+                create_edgar_server,
+                size=EdgarConfig.MCP_POOL_SIZE,
+                health_check_interval=EdgarConfig.MCP_HEALTH_CHECK_SECONDS,
+                name="SEC EDGAR MCP",
+            )
+        return pool
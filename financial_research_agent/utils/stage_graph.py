@@ -0,0 +1,225 @@
+"""
+Dependency-graph executor for the stages of a research run.
+
+Each stage is an async function that declares the stages whose results it
+needs. A stage starts as soon as all of its inputs have resolved, so
+independent work (e.g. deterministic XBRL extraction and the web searches)
+overlaps instead of running in a hard-coded sequence.
+
+Per-stage start/end times are recorded and can be written to the session
+directory for profiling.
+
+Usage:
+    graph = StageGraph()
+    graph.add_stage("plan", plan_searches)
+    graph.add_stage("search", lambda plan: perform_searches(plan), inputs=("plan",))
+    graph.add_stage("metrics", gather_metrics)              # no inputs: starts at once
+    results = await graph.run()
+    graph.save_timings(session_dir / "stage_timings.json")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+STAGE_TIMINGS_FILENAME = "stage_timings.json"
+
+
+@dataclass
+class Stage:
+    """One unit of work; called with the results of `inputs` as keyword arguments."""
+
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    inputs: tuple[str, ...] = ()
+    description: str | None = None
+
+
+@dataclass
+class StageRecord:
+    """Execution record of one stage (times in seconds since the run started)."""
+
+    name: str
+    inputs: tuple[str, ...] = ()
+    status: str = "pending"  # pending | running | done | failed | cancelled
+    start_s: float | None = None
+    end_s: float | None = None
+    error: str | None = None
+
+    @property
+    def duration_s(self) -> float | None:
+        if self.start_s is None or self.end_s is None:
+            return None
+        return self.end_s - self.start_s
+
+
+class StageGraph:
+    """
+    Runs async stages as soon as their inputs are available.
+
+    Features:
+    - Stages declare inputs by name; results are passed as keyword arguments
+    - Cycle and unknown-input detection before anything starts
+    - A failing stage cancels the rest of the run and re-raises
+    - Per-stage timing records (records, save_timings)
+    """
+
+    def __init__(self, on_stage_start: Callable[[Stage], None] | None = None) -> None:
+        """
+        Initialize an empty graph.
+
+        Args:
+            on_stage_start: Called with each stage as it starts (e.g. progress reporting)
+        """
+        self.on_stage_start = on_stage_start
+        self.stages: dict[str, Stage] = {}
+        self.records: dict[str, StageRecord] = {}
+        self.started_at: datetime | None = None
+        self.total_s: float | None = None
+
+    def add_stage(
+        self,
+        name: str,
+        func: Callable[..., Awaitable[Any]],
+        inputs: Sequence[str] = (),
+        description: str | None = None,
+    ) -> None:
+        """
+        Register a stage.
+
+        Args:
+            name: Stage name (also the keyword its result is passed as)
+            func: Async function taking one keyword argument per input
+            inputs: Names of the stages whose results this stage needs
+            description: Progress message shown when the stage starts
+        """
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        self.stages[name] = Stage(name, func, tuple(inputs), description)
+
+    def _topological_order(self) -> list[str]:
+        for stage in self.stages.values():
+            unknown = [name for name in stage.inputs if name not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage(s): {', '.join(unknown)}")
+
+        order: list[str] = []
+        state: dict[str, str] = {}
+
+        def visit(name: str, path: list[str]):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Stage dependency cycle: {' -> '.join(path + [name])}")
+            state[name] = "visiting"
+            for dependency in self.stages[name].inputs:
+                visit(dependency, path + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [])
+        return order
+
+    async def run(self) -> dict[str, Any]:
+        """
+        Run every stage.
+
+        Returns:
+            Stage name -> result
+        """
+        order = self._topological_order()
+        self.records = {name: StageRecord(name, self.stages[name].inputs) for name in order}
+        self.started_at = datetime.now()
+        t0 = time.perf_counter()
+
+        tasks: dict[str, asyncio.Task] = {}
+        results: dict[str, Any] = {}
+
+        async def run_stage(stage: Stage) -> Any:
+            kwargs = {name: await tasks[name] for name in stage.inputs}
+
+            record = self.records[stage.name]
+            record.status = "running"
+            record.start_s = time.perf_counter() - t0
+            if self.on_stage_start:
+                self.on_stage_start(stage)
+
+            try:
+                result = await stage.func(**kwargs)
+            except asyncio.CancelledError:
+                record.status = "cancelled"
+                raise
+            except Exception as e:
+                record.status = "failed"
+                record.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                record.end_s = time.perf_counter() - t0
+
+            record.status = "done"
+            results[stage.name] = result
+            return result
+
+        # Tasks only start running at the first await, so every dependency's
+        # task exists before any stage looks it up
+        for name in order:
+            tasks[name] = asyncio.create_task(run_stage(self.stages[name]), name=f"stage:{name}")
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for name, task in tasks.items():
+                if not task.done():
+                    task.cancel()
+                    self.records[name].status = "cancelled"
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            for record in self.records.values():
+                if record.status == "pending":
+                    # An input failed before this stage could start
+                    record.status = "cancelled"
+            raise
+        finally:
+            self.total_s = time.perf_counter() - t0
+
+        return results
+
+    def timings(self) -> dict[str, Any]:
+        """Get the run's timing report (stages sorted by start time)."""
+        records = sorted(
+            self.records.values(),
+            key=lambda record: (record.start_s is None, record.start_s or 0.0)
+        )
+        return {
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "total_s": round(self.total_s, 3) if self.total_s is not None else None,
+            "stages": [
+                {
+                    "name": record.name,
+                    "inputs": list(record.inputs),
+                    "status": record.status,
+                    "start_s": round(record.start_s, 3) if record.start_s is not None else None,
+                    "end_s": round(record.end_s, 3) if record.end_s is not None else None,
+                    "duration_s": round(record.duration_s, 3) if record.duration_s is not None else None,
+                    **({"error": record.error} if record.error else {}),
+                }
+                for record in records
+            ],
+        }
+
+    def save_timings(self, path: str | Path, **extra: Any) -> None:
+        """Write the timing report as JSON (extra keyword arguments are added as top-level keys)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({**self.timings(), **extra}, indent=2))
@@ -4,7 +4,7 @@ Financial Chart Generator using edgartools and plotly.
 Generates interactive visualizations from SEC EDGAR financial statements.
 """
 
-from edgar import Company, set_identity
+from edgar import set_identity
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
@@ -13,24 +13,35 @@ from typing import Dict, Optional, List
 import json
 import logging
 
+from financial_research_agent.cache.filing_registry import get_filing_registry
+
 logger = logging.getLogger(__name__)
 
 
 class FinancialChartGenerator:
     """Generate interactive financial charts from edgartools data."""
 
-    def __init__(self, ticker: str, identity: str):
+    def __init__(self, ticker: str, identity: str, statements: Optional[Dict[str, pd.DataFrame]] = None):
         """
         Initialize chart generator.
 
         Args:
             ticker: Stock ticker symbol
             identity: SEC EDGAR identity string
+            statements: Optional statement DataFrames already extracted for this
+                analysis ('balance_sheet', 'income_statement'); when given, no
+                filing data is fetched from SEC
         """
         self.ticker = ticker
+        self.statements = statements or {}
+        self.company = None
+        self.financials = None
+        if self.statements:
+            return
+
         set_identity(identity)
         try:
-            self.company = Company(ticker)
+            self.company = get_filing_registry().company(ticker)
             # Get financials from the most recent NON-AMENDED filing
             # to ensure complete XBRL data is available
             self.financials = self._get_financials_from_original_filing()
@@ -48,32 +59,37 @@ class FinancialChartGenerator:
         Returns:
             Financials object or None
         """
-        filing = None
-        latest_date = None
-        
-        # Try each form type and find the most recent original filing
-        for form in ["10-Q", "10-K", "20-F"]:
-            try:
-                # Use amendments=False to exclude amended filings
-                filings = self.company.get_filings(form=form, amendments=False)
-                if filings and len(filings) > 0:
-                    candidate = filings.latest(1)
-                    candidate_date = candidate.filing_date if hasattr(candidate, 'filing_date') else None
-                    if candidate_date and (latest_date is None or candidate_date > latest_date):
-                        filing = candidate
-                        latest_date = candidate_date
-            except Exception as e:
-                logger.debug(f"No {form} filings found: {e}")
-                continue
+        registry = get_filing_registry()
+
+        # Find the most recent original filing across form types
+        # (amendments=False excludes amended filings)
+        filing = registry.latest_filing(self.ticker, ["10-Q", "10-K", "20-F"], amendments=False)
         
         if filing:
             logger.info(f"Using {filing.form} filed {filing.filing_date} for charts (amendments excluded)")
-            return filing.obj().financials
+            return registry.financials(filing)
         else:
             # Fallback to get_financials() if no filings found
             logger.warning(f"No original filings found, falling back to get_financials()")
             return self.company.get_financials()
 
+    def _statement_df(self, name: str) -> Optional[pd.DataFrame]:
+        """
+        Get a statement DataFrame, preferring the DataFrames passed in.
+
+        Args:
+            name: 'balance_sheet' or 'income_statement'
+
+        Returns:
+            Statement DataFrame or None if unavailable
+        """
+        df = self.statements.get(name)
+        if df is not None:
+            return df
+        if not self.financials:
+            return None
+        return getattr(self.financials, name)().to_dataframe()
+
     def _find_line_item(self, df: pd.DataFrame, search_terms: List[str]) -> Optional[pd.Series]:
         """
         Find a line item in DataFrame by searching for terms in label column.
@@ -118,11 +134,10 @@ class FinancialChartGenerator:
         Returns:
             Plotly Figure or None if data unavailable
         """
-        if not self.financials:
-            return None
-
         try:
-            income_df = self.financials.income_statement().to_dataframe()
+            income_df = self._statement_df('income_statement')
+            if income_df is None:
+                return None
             date_cols = self._get_date_columns(income_df)
 
             if len(date_cols) < 2:
@@ -281,11 +296,10 @@ class FinancialChartGenerator:
         Returns:
             Plotly Figure or None if data unavailable
         """
-        if not self.financials:
-            return None
-
         try:
-            bs_df = self.financials.balance_sheet().to_dataframe()
+            bs_df = self._statement_df('balance_sheet')
+            if bs_df is None:
+                return None
             date_cols = self._get_date_columns(bs_df)
 
             if len(date_cols) < 1:
@@ -451,7 +465,12 @@ class FinancialChartGenerator:
         return charts
 
 
-def generate_charts_for_analysis(session_dir: Path, ticker: str, metrics_results=None) -> int:
+def generate_charts_for_analysis(
+    session_dir: Path,
+    ticker: str,
+    metrics_results=None,
+    statements_data: Optional[dict] = None,
+) -> int:
     """
     Generate charts for an analysis session.
 
@@ -459,6 +478,10 @@ def generate_charts_for_analysis(session_dir: Path, ticker: str, metrics_results
         session_dir: Output directory for the analysis
         ticker: Stock ticker symbol
         metrics_results: Optional FinancialMetrics object
+        statements_data: Optional extracted financial data; its unfiltered
+            statements (raw_balance_sheet_df, raw_income_statement_df, falling
+            back to balance_sheet_df, income_statement_df) are reused instead
+            of refetching the filing
 
     Returns:
         Number of charts successfully generated
@@ -467,8 +490,21 @@ def generate_charts_for_analysis(session_dir: Path, ticker: str, metrics_results
 
     identity = os.getenv("SEC_EDGAR_USER_AGENT", "FinancialResearchAgent/1.0 (user@example.com)")
 
+    statements = None
+    if statements_data:
+        # Prefer every period of the filing; the *_df frames are cut to two
+        statements = {}
+        for name in ('balance_sheet', 'income_statement'):
+            df = statements_data.get(f'raw_{name}_df')
+            if df is None:
+                df = statements_data.get(f'{name}_df')
+            if df is not None:
+                statements[name] = df
+        if 'income_statement' not in statements:
+            statements = None
+
     try:
-        generator = FinancialChartGenerator(ticker, identity)
+        generator = FinancialChartGenerator(ticker, identity, statements=statements)
         charts = generator.generate_all_charts(session_dir, metrics_results)
         return len(charts)
     except Exception as e:
@@ -18,6 +18,7 @@ print(f"🔧 Gradio version: {gr.__version__}")
 
 from financial_research_agent.manager_enhanced import EnhancedFinancialResearchManager
 from financial_research_agent.config import AgentConfig
+from financial_research_agent.utils.event_loop import run_coroutine
 
 
 # Morningstar-inspired theme
@@ -95,6 +96,7 @@ class WebApp:
         self.analysis_map = {}  # Map labels to directory paths
         self.session_id = None  # For API key management
         self.llm_provider = "openai"  # Only provider supported after simplification
+        self._web_search_client = None  # Lives on the background event loop
 
     def get_existing_analyses(self):
         """Get list of existing analysis directories with company names."""
@@ -419,9 +421,12 @@ class WebApp:
                 # Query each ticker separately with fewer results per company
                 results_per_company = max(3, num_results // len(detected_tickers))
                 combined_results = {
+                    'ids': [[]],
                     'documents': [[]],
                     'metadatas': [[]],
-                    'distances': [[]]
+                    'distances': [[]],
+                    # Per-company rankings are concatenated: pack by distance
+                    'merged': True
                 }
 
                 # For numerical comparison queries, prioritize financial_metrics
@@ -430,46 +435,29 @@ class WebApp:
                                      'cash', 'debt', 'equity', 'assets', 'compare']
                 prefer_metrics = any(keyword in query_lower for keyword in numerical_keywords)
 
+                # One embedding + concurrent filtered searches for every company
+                specs = []
                 for ticker_symbol in detected_tickers:
-                    # If this is a numerical comparison, first try to get financial_metrics
                     if prefer_metrics and not analysis_type_val:
-                        metrics_results = rag.query(
-                            query=query,
-                            ticker=ticker_symbol,
-                            analysis_type='financial_metrics',
-                            n_results=2
-                        )
-                        # Get one more general result for context
-                        general_results = rag.query(
-                            query=query,
-                            ticker=ticker_symbol,
-                            analysis_type=None,
-                            n_results=1
-                        )
-
-                        # Combine metrics + general
-                        if metrics_results and 'documents' in metrics_results:
-                            combined_results['documents'][0].extend(metrics_results['documents'][0])
-                            combined_results['metadatas'][0].extend(metrics_results['metadatas'][0])
-                            combined_results['distances'][0].extend(metrics_results['distances'][0])
-                        if general_results and 'documents' in general_results:
-                            combined_results['documents'][0].extend(general_results['documents'][0])
-                            combined_results['metadatas'][0].extend(general_results['metadatas'][0])
-                            combined_results['distances'][0].extend(general_results['distances'][0])
+                        # Numerical comparison: 2 financial_metrics chunks + 1 general chunk for context
+                        specs.append((ticker_symbol, 'financial_metrics', 2))
+                        specs.append((ticker_symbol, None, 1))
                     else:
-                        # Standard query
-                        company_results = rag.query(
-                            query=query,
-                            ticker=ticker_symbol,
-                            analysis_type=analysis_type_val,
-                            n_results=results_per_company
-                        )
-
-                        # Combine results
-                        if company_results and 'documents' in company_results:
-                            combined_results['documents'][0].extend(company_results['documents'][0])
-                            combined_results['metadatas'][0].extend(company_results['metadatas'][0])
-                            combined_results['distances'][0].extend(company_results['distances'][0])
+                        specs.append((ticker_symbol, analysis_type_val, results_per_company))
+
+                batch = rag.batch_query(query, specs)
+                for company_results in batch['results']:
+                    if company_results and 'documents' in company_results:
+                        combined_results['ids'][0].extend(company_results['ids'][0])
+                        combined_results['documents'][0].extend(company_results['documents'][0])
+                        combined_results['metadatas'][0].extend(company_results['metadatas'][0])
+                        combined_results['distances'][0].extend(company_results['distances'][0])
+
+                timings = batch['timings']
+                print(
+                    f"KB retrieval for {len(detected_tickers)} companies: {timings['total_ms']:.0f}ms "
+                    f"(embed {timings['embed_ms']:.0f}ms, {len(specs)} searches {timings['search_ms']:.0f}ms)"
+                )
 
                 # Check if we need to supplement with web search
                 web_search_used = []
@@ -485,7 +473,17 @@ class WebApp:
                 yield "🤖 Synthesizing answer from sources..."
                 # Use higher max_turns (10) when web search is enabled to allow for tool calls
                 # Standard synthesis (3 turns) is too low when agent needs to call web search
-                response = synthesize_rag_results(query, combined_results, max_turns=10)
+                if web_search_used:
+                    # Web results change independently of the KB - never serve them from cache
+                    response = synthesize_rag_results(query, combined_results, max_turns=10)
+                else:
+                    response = rag.synthesize_with_cache(
+                        query,
+                        combined_results,
+                        ticker=",".join(detected_tickers),
+                        analysis_type=analysis_type_val,
+                        max_turns=10
+                    )
             else:
                 # Single company or explicit filter - use standard query
                 yield "🤖 Synthesizing answer from sources..."
@@ -596,6 +594,19 @@ class WebApp:
         # Use web search if query is time-sensitive OR results are sparse
         return is_time_sensitive or is_sparse
 
+    async def _get_web_search_client(self):
+        """
+        Shared Brave Search client (keeps connections alive between queries).
+
+        Only used from coroutines on the background event loop, so the
+        client is always bound to that one loop.
+        """
+        import httpx
+
+        if self._web_search_client is None:
+            self._web_search_client = httpx.AsyncClient(timeout=30.0)
+        return self._web_search_client
+
     def _supplement_with_web_search(
         self,
         query: str,
@@ -663,27 +674,27 @@ class WebApp:
                             "result_filter": "web"
                         }
 
-                        async with httpx.AsyncClient(timeout=30.0) as client:
-                            response = await client.get(
-                                "https://api.search.brave.com/res/v1/web/search",
-                                headers=headers,
-                                params=params,
-                                follow_redirects=True
-                            )
-                            response.raise_for_status()
-                            data = response.json()
+                        client = await self._get_web_search_client()
+                        response = await client.get(
+                            "https://api.search.brave.com/res/v1/web/search",
+                            headers=headers,
+                            params=params,
+                            follow_redirects=True
+                        )
+                        response.raise_for_status()
+                        data = response.json()
 
-                            # Extract results
-                            web_results = data.get("web", {}).get("results", [])
+                        # Extract results
+                        web_results = data.get("web", {}).get("results", [])
 
-                            if not web_results:
-                                error_msg = f"{ticker}: No web results found for '{search_query}'"
-                                error_messages.append(error_msg)
-                                return ("error", ticker, error_msg)
+                        if not web_results:
+                            error_msg = f"{ticker}: No web results found for '{search_query}'"
+                            error_messages.append(error_msg)
+                            return ("error", ticker, error_msg)
 
-                            # Add small delay between successful requests to avoid rate limits
-                            await asyncio.sleep(0.5)
-                            return ("success", ticker, web_results[:2])
+                        # Add small delay between successful requests to avoid rate limits
+                        await asyncio.sleep(0.5)
+                        return ("success", ticker, web_results[:2])
 
                     except httpx.HTTPStatusError as e:
                         if e.response.status_code == 429:
@@ -724,7 +735,7 @@ class WebApp:
 
         # Execute searches
         try:
-            results = asyncio.run(search_all())
+            results = run_coroutine(search_all())
 
             for result in results:
                 # Handle exceptions caught by gather
@@ -771,7 +782,7 @@ class WebApp:
                 # Errors already recorded in error_messages
 
         except Exception as e:
-            # Catch-all for asyncio.run failures
+            # Catch-all for background-loop failures
             error_msg = f"Web search system error: {type(e).__name__}: {str(e)}\n{traceback.format_exc()}"
             error_messages.append(error_msg)
 
@@ -1429,6 +1440,21 @@ The following companies are not yet in the knowledge base:
             # Load KB status when app starts
             app.load(fn=load_kb_status, outputs=[kb_status_banner])
 
+            # Connect the SEC EDGAR MCP servers once, on Gradio's event loop (where
+            # analyses run), and keep them up across analyses until the app exits
+            async def warm_up_edgar_pool():
+                if not AgentConfig.ENABLE_EDGAR_INTEGRATION:
+                    return
+                from financial_research_agent.utils.mcp_pool import get_edgar_server_pool
+
+                pool = get_edgar_server_pool()
+                if pool.persistent and pool.is_started:
+                    return
+                healthy = await pool.start(persistent=True)
+                print(f"✓ SEC EDGAR MCP pool ready ({healthy}/{pool.size} servers healthy)")
+
+            app.load(fn=warm_up_edgar_pool)
+
             # State to track visibility and content
             details_state = gr.State(value={"visible": False, "content": ""})
 
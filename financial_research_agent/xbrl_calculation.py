@@ -8,12 +8,13 @@ This approach uses the official SEC calculation linkbases instead of custom
 aggregation logic, ensuring consistency with XBRL taxonomy standards.
 """
 
-import requests
 import xml.etree.ElementTree as ET
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import logging
 
+from financial_research_agent.cache.http_cache import get_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,7 +68,8 @@ class XBRLCalculationParser:
         for cal_url in cal_urls:
             try:
                 logger.info(f"Attempting to fetch calculation linkbase: {cal_url}")
-                response = requests.get(cal_url, headers=headers, timeout=10)
+                # Linkbases live in the accession folder, so repeats come from the disk cache
+                response = get_http_client().get(cal_url, headers=headers, timeout=10)
 
                 if response.status_code == 200:
                     self.parse_from_xml(response.content)
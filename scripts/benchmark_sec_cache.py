@@ -0,0 +1,146 @@
+"""
+Benchmark SQLite connection overhead in the SEC financial cache.
+
+Seeds a throwaway cache database with synthetic filings, then runs the same
+CachedFinancialManager.get_key_metrics() workload twice:
+
+1. Legacy mode - a fresh connection (plus PRAGMAs) for every call
+2. Pooled mode - one long-lived connection per thread
+
+Usage:
+    uv run python scripts/benchmark_sec_cache.py
+    uv run python scripts/benchmark_sec_cache.py --tickers 20 --rounds 50
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from financial_research_agent.cache.cached_manager import CachedFinancialManager
+from financial_research_agent.cache.connection_pool import SQLiteConnectionPool
+
+
+SAMPLE_CONCEPTS = {
+    'balance_sheet': [
+        ('us-gaap_Assets', 'Total assets'),
+        ('us-gaap_Liabilities', 'Total liabilities'),
+        ('us-gaap_StockholdersEquity', "Total stockholders' equity"),
+        ('us-gaap_CashAndCashEquivalentsAtCarryingValue', 'Cash and cash equivalents'),
+    ],
+    'income_statement': [
+        ('us-gaap_Revenues', 'Total revenue'),
+        ('us-gaap_NetIncomeLoss', 'Net income'),
+    ],
+    'cash_flow': [
+        ('us-gaap_NetCashProvidedByUsedInOperatingActivities', 'Net cash from operating activities'),
+    ],
+}
+
+
+def seed_database(manager: CachedFinancialManager, tickers: list, filings_per_ticker: int = 4):
+    """Insert synthetic filings so lookups hit real rows."""
+    now = datetime.now().isoformat()
+
+    with manager.cache.connection() as conn:
+        for ticker in tickers:
+            for i in range(filings_per_ticker):
+                filing_date = f"{2025 - i}-03-31"
+                cursor = conn.execute(
+                    """
+                    INSERT INTO filings_metadata (
+                        ticker, form_type, filing_date, cached_at, last_accessed
+                    ) VALUES (?, ?, ?, ?, ?)
+                """,
+                    (ticker, '10-K' if i == 0 else '10-Q', filing_date, now, now),
+                )
+                filing_id = cursor.lastrowid
+
+                for table, concepts in SAMPLE_CONCEPTS.items():
+                    conn.executemany(
+                        f"""
+                        INSERT INTO {table} (filing_id, ticker, filing_date, concept, label, value)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                        [
+                            (filing_id, ticker, filing_date, concept, label, 1_000_000.0 * (n + 1))
+                            for n, (concept, label) in enumerate(concepts)
+                        ],
+                    )
+
+    manager.cache.refresh_latest_values()
+
+
+def run_workload(manager: CachedFinancialManager, tickers: list, rounds: int) -> float:
+    """Run get_key_metrics for every ticker, `rounds` times. Returns seconds."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for ticker in tickers:
+            manager.get_key_metrics(ticker)
+    return time.perf_counter() - start
+
+
+def measure_open_cost(db_path: Path, samples: int = 200) -> float:
+    """Average cost of one connect + PRAGMA setup, in milliseconds."""
+    pool = SQLiteConnectionPool(db_path, persistent=False)
+    start = time.perf_counter()
+    for _ in range(samples):
+        with pool.connection():
+            pass
+    return (time.perf_counter() - start) / samples * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark SEC cache connection pooling')
+    parser.add_argument('--tickers', type=int, default=10, help='Number of synthetic tickers')
+    parser.add_argument('--rounds', type=int, default=20, help='Workload repetitions')
+    args = parser.parse_args()
+
+    tickers = [f"T{i:03d}" for i in range(args.tickers)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "benchmark.db"
+        manager = CachedFinancialManager(str(db_path))
+        seed_database(manager, tickers)
+
+        print("🚀 SEC Cache Connection Benchmark")
+        print("=" * 60)
+        print(f"   Tickers: {len(tickers)}  Rounds: {args.rounds}")
+        print(f"   Open + PRAGMA cost: {measure_open_cost(db_path):.3f} ms per connection")
+
+        results = {}
+        for mode, persistent in [('legacy', False), ('pooled', True)]:
+            manager.cache._pool.close_all()
+            manager.cache._pool = SQLiteConnectionPool(db_path, persistent=persistent)
+
+            # One call to count connections for a single get_key_metrics()
+            before = manager.cache.get_connection_stats()
+            manager.get_key_metrics(tickers[0])
+            after = manager.cache.get_connection_stats()
+
+            elapsed = run_workload(manager, tickers, args.rounds)
+            results[mode] = {
+                'opens_per_call': after['connections_opened'] - before['connections_opened'],
+                'pragmas_per_call': after['pragmas_executed'] - before['pragmas_executed'],
+                'elapsed': elapsed,
+                'per_call_ms': elapsed / (len(tickers) * args.rounds) * 1000,
+            }
+
+        manager.close()
+
+    print("\n📊 get_key_metrics() per call:")
+    print(f"   {'Mode':<8} {'Opens':>6} {'PRAGMAs':>8} {'Time (ms)':>10}")
+    for mode, r in results.items():
+        print(f"   {mode:<8} {r['opens_per_call']:>6} {r['pragmas_per_call']:>8} {r['per_call_ms']:>10.3f}")
+
+    speedup = results['legacy']['elapsed'] / results['pooled']['elapsed']
+    print(f"\n   🚀 Speedup: {speedup:.1f}x faster with pooled connections")
+
+
+if __name__ == "__main__":
+    main()
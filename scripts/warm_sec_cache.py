@@ -0,0 +1,69 @@
+"""
+Warm the SEC financial cache for a universe of tickers.
+
+Fetches filings concurrently (rate limited to SEC's 10 requests/second)
+and writes them through a single SQLite writer thread.
+
+Usage:
+    uv run python scripts/warm_sec_cache.py AAPL MSFT NVDA
+    uv run python scripts/warm_sec_cache.py --file tickers.txt --workers 8 --defer-indexes
+"""
+
+import argparse
+import logging
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from financial_research_agent.cache import SecFinancialCache, warm_cache
+
+
+def load_tickers(args) -> list:
+    """Collect tickers from the command line and/or a file (one per line, # comments)."""
+    tickers = list(args.tickers)
+    if args.file:
+        for line in Path(args.file).read_text().splitlines():
+            line = line.split('#')[0].strip()
+            if line:
+                tickers.append(line)
+    return tickers
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Warm the SEC financial cache')
+    parser.add_argument('tickers', nargs='*', help='Ticker symbols')
+    parser.add_argument('--file', type=str, help='File with one ticker per line')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent fetch workers')
+    parser.add_argument('--max-filings', type=int, default=4, help='Filings per ticker')
+    parser.add_argument('--force', action='store_true', help='Re-cache tickers that are already current')
+    parser.add_argument('--defer-indexes', action='store_true', help='Rebuild indexes once at the end')
+    parser.add_argument('--db', type=str, default='data/sec_cache/financials.db', help='Cache database path')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
+    tickers = load_tickers(args)
+    if not tickers:
+        parser.error('No tickers given')
+
+    cache = SecFinancialCache(args.db)
+    results = warm_cache(
+        tickers,
+        workers=args.workers,
+        cache=cache,
+        max_filings=args.max_filings,
+        force_refresh=args.force,
+        defer_indexes=args.defer_indexes,
+    )
+    cache.close()
+
+    failed = [r for r in results.values() if r.get('error')]
+    print(f"\n✅ Warmed {len(results) - len(failed)}/{len(results)} tickers")
+    for r in failed:
+        print(f"   ❌ {r['ticker']}: {r['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Tests for chart generation from already-extracted statements (no SEC access).
+"""
+
+import json
+
+import pandas as pd
+
+from financial_research_agent.visualization import chart_generator
+from financial_research_agent.visualization.chart_generator import generate_charts_for_analysis
+
+
+def _statements_data() -> dict:
+    periods = ["2024-09-28", "2023-09-30"]
+    income = pd.DataFrame([
+        {"concept": "us-gaap_Revenues", "label": "Revenues", periods[0]: 391.0e9, periods[1]: 383.3e9},
+        {"concept": "us-gaap_GrossProfit", "label": "Gross Profit", periods[0]: 180.7e9, periods[1]: 169.1e9},
+        {"concept": "us-gaap_NetIncomeLoss", "label": "Net Income", periods[0]: 93.7e9, periods[1]: 97.0e9},
+    ])
+    balance = pd.DataFrame([
+        {"concept": "us-gaap_Assets", "label": "Total Assets", periods[0]: 365.0e9, periods[1]: 352.6e9},
+        {"concept": "us-gaap_Liabilities", "label": "Total Liabilities", periods[0]: 308.0e9, periods[1]: 290.4e9},
+        {"concept": "us-gaap_StockholdersEquity", "label": "Total Stockholders' Equity",
+         periods[0]: 57.0e9, periods[1]: 62.1e9},
+    ])
+    return {"income_statement_df": income, "balance_sheet_df": balance}
+
+
+class TestChartsFromStatements:
+    """Charts reuse the statement DataFrames of the analysis"""
+
+    def test_does_not_fetch_from_sec(self, tmp_path, monkeypatch):
+        def no_sec(*args, **kwargs):
+            raise AssertionError("SEC should not be contacted")
+
+        monkeypatch.setattr(chart_generator, "get_filing_registry", no_sec)
+        monkeypatch.setattr(chart_generator, "set_identity", no_sec)
+        # PNG export needs Chrome; JSON output is enough here
+        monkeypatch.setattr(chart_generator.go.Figure, "write_image", lambda *args, **kwargs: None)
+
+        count = generate_charts_for_analysis(tmp_path, "AAPL", statements_data=_statements_data())
+
+        assert count == 2
+        revenue = json.loads((tmp_path / "chart_revenue_profitability.json").read_text())
+        assert [trace["name"] for trace in revenue["data"]] == ["Revenue", "Gross Profit", "Net Income"]
+        assert (tmp_path / "chart_balance_sheet.json").exists()
+
+    def test_missing_statement_skips_chart(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(chart_generator.go.Figure, "write_image", lambda *args, **kwargs: None)
+        data = _statements_data()
+        generator = chart_generator.FinancialChartGenerator(
+            "AAPL", "test", statements={"income_statement": data["income_statement_df"]}
+        )
+
+        assert generator.create_balance_sheet_composition_chart() is None
+        assert generator.create_revenue_profitability_chart() is not None
+
+    def test_prefers_unfiltered_statements(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(chart_generator.go.Figure, "write_image", lambda *args, **kwargs: None)
+        data = _statements_data()
+        raw_income = data["income_statement_df"].copy()
+        raw_income["2022-09-24"] = [394.3e9, 170.8e9, 99.8e9]
+        data["raw_income_statement_df"] = raw_income
+
+        generate_charts_for_analysis(tmp_path, "AAPL", statements_data=data)
+
+        revenue = json.loads((tmp_path / "chart_revenue_profitability.json").read_text())
+        assert len(revenue["data"][0]["x"]) == 3
@@ -0,0 +1,97 @@
+"""
+Tests for packing retrieved chunks into the synthesis prompt context.
+"""
+
+from financial_research_agent.rag.context_packing import estimate_tokens, pack_context
+
+
+def _para(label: str) -> str:
+    return f"{label}: " + "revenue grew on strong services demand and pricing. " * 3
+
+
+def _chunk(section: str, chunk_num: int, paragraphs: list[str], section_num: int = 1, **extra) -> tuple:
+    metadata = {
+        "ticker": "TEST",
+        "analysis_type": "financial_analysis",
+        "period": "Q3 FY2025",
+        "section": section,
+        "section_num": section_num,
+        "chunk_num": chunk_num,
+        **extra,
+    }
+    return f"### {section}\n\n" + "\n\n".join(paragraphs), metadata
+
+
+def _results(chunks: list[tuple], distances: list[float]) -> dict:
+    return {
+        "documents": [[document for document, _ in chunks]],
+        "metadatas": [[metadata for _, metadata in chunks]],
+        "distances": [distances],
+    }
+
+
+class TestPackContext:
+    """Test dedupe, merging and budgeting"""
+
+    def test_adjacent_chunks_merge_without_overlap(self):
+        results = _results(
+            [
+                _chunk("Revenue", 1, [_para("P2"), _para("P3")]),
+                _chunk("Revenue", 0, [_para("P1"), _para("P2")]),
+            ],
+            [0.2, 0.3],
+        )
+
+        packed = pack_context(results)
+
+        assert packed.chunks == 2
+        assert packed.excerpts == 1
+        assert packed.text.count("P2:") == 1
+        assert packed.text.index("P1:") < packed.text.index("P2:") < packed.text.index("P3:")
+        assert packed.text.count("### Revenue") == 0
+        assert packed.tokens_saved > 0
+        assert packed.tokens_after == estimate_tokens(packed.text)
+
+    def test_repeated_paragraphs_across_excerpts_are_dropped(self):
+        results = _results(
+            [
+                _chunk("Revenue", 0, [_para("Shared"), _para("A")]),
+                _chunk("Outlook", 0, [_para("Shared"), _para("B")], section_num=2),
+            ],
+            [0.1, 0.2],
+        )
+
+        packed = pack_context(results)
+
+        assert packed.excerpts == 2
+        assert packed.text.count("Shared:") == 1
+
+    def test_budget_keeps_top_ranked_excerpts(self):
+        # A lexical hit reranked first can have a worse vector distance
+        reranked = _chunk("Reranked", 0, [_para("Reranked")], section_num=1)
+        vector = _chunk("Vector", 0, [_para("Vector")], section_num=2)
+        results = _results([reranked, vector], [0.9, 0.1])
+        one_excerpt = pack_context(_results([reranked], [0.9]))
+
+        packed = pack_context(results, token_budget=one_excerpt.tokens_after + 5)
+
+        assert "Reranked:" in packed.text
+        assert "Vector:" not in packed.text
+        assert packed.dropped == 1
+
+    def test_merged_batch_results_keep_closest_excerpts(self):
+        high = _chunk("High", 0, [_para("High")], section_num=2)
+        low = _chunk("Low", 0, [_para("Low")], section_num=1)
+        results = {**_results([low, high], [0.9, 0.1]), "merged": True}
+        one_excerpt = pack_context(_results([high], [0.1]))
+
+        packed = pack_context(results, token_budget=one_excerpt.tokens_after + 5)
+
+        assert "High:" in packed.text
+        assert "Low:" not in packed.text
+        assert packed.dropped == 1
+        assert packed.tokens_after <= one_excerpt.tokens_after + 5
+
+    def test_empty_results(self):
+        assert pack_context({}).text == "No relevant excerpts found."
+        assert pack_context({"documents": [[]], "metadatas": [[]], "distances": [[]]}).excerpts == 0
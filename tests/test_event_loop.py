@@ -0,0 +1,112 @@
+"""
+Tests for the background event loop used by sync-to-async bridges.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from financial_research_agent.utils.edgar_executor import run_edgar_io
+from financial_research_agent.utils.event_loop import (
+    BackgroundEventLoop,
+    LoopLagMonitor,
+    get_background_loop,
+    run_coroutine,
+)
+
+
+async def _loop_thread_name():
+    await asyncio.sleep(0)
+    return threading.current_thread().name
+
+
+class TestBackgroundEventLoop:
+    """Test the long-lived loop thread"""
+
+    def test_calls_from_many_threads_share_one_loop(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            names = list(executor.map(lambda _: run_coroutine(_loop_thread_name()), range(8)))
+
+        assert set(names) == {"background-event-loop"}
+        assert get_background_loop() is get_background_loop()
+
+    def test_loop_bound_resources_survive_between_calls(self):
+        async def get_loop():
+            return asyncio.get_running_loop()
+
+        assert run_coroutine(get_loop()) is run_coroutine(get_loop())
+
+    def test_exceptions_propagate(self):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_coroutine(fail())
+
+    def test_submit_returns_future(self):
+        loop = BackgroundEventLoop(name="test-loop")
+        try:
+            future = loop.submit(_loop_thread_name())
+            assert future.result(timeout=5) == "test-loop"
+        finally:
+            loop.stop()
+
+        assert not loop.is_running
+
+    def test_blocking_run_from_loop_thread_is_rejected(self):
+        loop = BackgroundEventLoop(name="test-loop")
+        try:
+            async def nested():
+                coro = _loop_thread_name()
+                try:
+                    loop.run(coro)
+                finally:
+                    coro.close()
+
+            with pytest.raises(RuntimeError, match="await the coroutine"):
+                loop.run(nested(), timeout=5)
+        finally:
+            loop.stop()
+
+
+class TestSynthesisAgentCache:
+    """Test that the RAG synthesis agent is built once"""
+
+    def test_agent_reused_and_prompt_rendered_per_run(self):
+        from financial_research_agent.rag.synthesis_agent import get_rag_synthesis_agent
+
+        agent = get_rag_synthesis_agent()
+
+        assert get_rag_synthesis_agent() is agent
+        assert get_rag_synthesis_agent(enable_web_search=False) is not agent
+        assert "{current_time}" not in agent.instructions(None, agent)
+
+
+class TestLoopLagMonitor:
+    """Test lag measurement and that offloaded EDGAR work keeps the loop responsive"""
+
+    def test_blocking_call_on_loop_is_detected(self):
+        async def main():
+            async with LoopLagMonitor(interval=0.01, stall_threshold=0.1) as monitor:
+                await asyncio.sleep(0.03)
+                time.sleep(0.3)  # blocks the loop thread
+                await asyncio.sleep(0.05)
+            return monitor.stats()
+
+        stats = asyncio.run(main())
+        assert stats["max_lag_ms"] >= 250
+        assert stats["stalls"] >= 1
+
+    def test_edgar_io_executor_keeps_loop_responsive(self):
+        async def main():
+            async with LoopLagMonitor(interval=0.01, stall_threshold=0.1) as monitor:
+                results = await asyncio.gather(*(run_edgar_io(time.sleep, 0.2) for _ in range(3)))
+            return results, monitor.stats()
+
+        results, stats = asyncio.run(main())
+        assert results == [None, None, None]
+        assert stats["samples"] > 5
+        assert stats["stalls"] == 0
@@ -0,0 +1,159 @@
+"""
+Tests for the shared edgartools object registry (no network access required).
+"""
+
+import threading
+import time
+
+import pytest
+
+from financial_research_agent.cache.filing_registry import FilingRegistry
+
+
+class FakeFiling:
+    def __init__(self, accession, filing_date='2025-03-31'):
+        self.accession_no = accession
+        self.filing_date = filing_date
+        self.obj_calls = 0
+
+    def obj(self):
+        self.obj_calls += 1
+        return type('TenQ', (), {'financials': f"financials-{self.accession_no}"})()
+
+    def xbrl(self):
+        return f"xbrl-{self.accession_no}"
+
+
+class FakeFilings:
+    def __init__(self, *filings):
+        self.filings = list(filings)
+
+    def __len__(self):
+        return len(self.filings)
+
+    def latest(self, n=1):
+        return self.filings[0]
+
+
+class TestFilingRegistry:
+    """Test LRU bounds, coalescing and the edgartools resolvers"""
+
+    def test_loads_once_then_hits(self):
+        registry = FilingRegistry()
+        calls = []
+
+        for _ in range(3):
+            assert registry.get_or_load('k', lambda: calls.append(1) or 'value') == 'value'
+
+        assert len(calls) == 1
+        assert registry.stats()['hits'] == 2
+
+    def test_lru_eviction(self):
+        registry = FilingRegistry(max_entries=2)
+        registry.get_or_load('a', lambda: 1)
+        registry.get_or_load('b', lambda: 2)
+        registry.get_or_load('a', lambda: 1)  # 'a' is now most recent
+        registry.get_or_load('c', lambda: 3)
+
+        reloaded = []
+        for key in ('a', 'c', 'b'):
+            registry.get_or_load(key, lambda key=key: reloaded.append(key))
+
+        assert reloaded == ['b']
+        assert registry.stats()['evictions'] == 2
+
+    def test_concurrent_misses_are_coalesced(self):
+        registry = FilingRegistry()
+        calls = []
+        release = threading.Event()
+
+        def slow_loader():
+            calls.append(1)
+            release.wait(timeout=5)
+            return 'shared'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get_or_load('key', slow_loader)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert calls == [1]
+        assert results == ['shared'] * 5
+        assert registry.stats()['coalesced'] == 4
+
+    def test_failures_are_not_cached(self):
+        registry = FilingRegistry()
+
+        def failing():
+            raise RuntimeError("SEC unavailable")
+
+        with pytest.raises(RuntimeError):
+            registry.get_or_load('key', failing)
+
+        assert registry.get_or_load('key', lambda: 'ok') == 'ok'
+
+    def test_ttl_expiry(self):
+        registry = FilingRegistry()
+        registry.get_or_load('key', lambda: 'old', ttl=0)
+
+        assert registry.get_or_load('key', lambda: 'new', ttl=60) == 'new'
+
+    def test_financials_parsed_once_per_accession(self):
+        registry = FilingRegistry()
+        filing = FakeFiling('0000320193-25-000001')
+
+        first = registry.financials(filing)
+        # A different Filing instance for the same accession shares the entry
+        second = registry.financials(FakeFiling('0000320193-25-000001'))
+
+        assert first == second == 'financials-0000320193-25-000001'
+        assert filing.obj_calls == 1
+
+    def test_invalidate_ticker_keeps_accession_entries(self):
+        registry = FilingRegistry()
+        registry.get_or_load(('company', 'AAPL'), lambda: 'company')
+        registry.get_or_load(('financials', 'acc-1'), lambda: 'financials')
+
+        registry.invalidate('aapl')
+
+        assert registry.stats()['entries'] == 1
+
+    def test_parsed_filings_have_their_own_bound(self):
+        registry = FilingRegistry(max_parsed_entries=2)
+        registry.get_or_load(('company', 'AAPL'), lambda: 'company')
+        for accession in ('acc-1', 'acc-2', 'acc-3'):
+            registry.xbrl(FakeFiling(accession))
+
+        reloaded = []
+        for accession in ('acc-3', 'acc-2', 'acc-1'):
+            registry.get_or_load(('xbrl', accession), lambda accession=accession: reloaded.append(accession))
+        registry.get_or_load(('company', 'AAPL'), lambda: reloaded.append('company'))
+
+        assert reloaded == ['acc-1']
+
+    def test_failed_latest_filing_lookup_is_retried(self):
+        registry = FilingRegistry()
+        filing = FakeFiling('acc-1')
+
+        class FlakyCompany:
+            calls = 0
+
+            def get_filings(self, form, **kwargs):
+                FlakyCompany.calls += 1
+                if FlakyCompany.calls == 1:
+                    raise ConnectionError("SEC unavailable")
+                return FakeFilings(filing) if form == '10-Q' else FakeFilings()
+
+        registry.get_or_load(('company', 'AAPL'), FlakyCompany, ttl=60)
+
+        with pytest.raises(ConnectionError):
+            registry.latest_filing('AAPL', ['10-Q'])
+
+        assert registry.latest_filing('AAPL', ['10-Q']) is filing
@@ -159,6 +159,105 @@ class TestFinancialDataManager:
         assert comparison['MSFT']['metrics']['revenue'] is not None
 
 
+class TestMetricsCache:
+    """Test the metrics/ratios read-through cache (no network access required)"""
+    
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        from financial_research_agent.financial_data_manager import FinancialDataManager, FinancialMetrics
+        
+        manager = FinancialDataManager(cache_db_path=str(tmp_path / "financials.db"))
+        manager.fetch_count = 0
+        manager.available_periods = 5
+        manager.latest_accession = '0000000000-25-000001'
+        
+        def fake_fetch(ticker, periods):
+            manager.fetch_count += 1
+            return [
+                FinancialMetrics(
+                    ticker=ticker,
+                    company_name='Test Company',
+                    fiscal_year=f'FY {2025 - i}',
+                    source='test',
+                    revenue=1_000_000.0 * (i + 1),
+                    net_income=100_000.0,
+                    accession_number=manager.latest_accession,
+                )
+                for i in range(min(periods, manager.available_periods))
+            ]
+        
+        monkeypatch.setattr(manager, '_fetch_metrics', fake_fetch)
+        monkeypatch.setattr(manager, '_resolve_latest_accession', lambda ticker: manager.latest_accession)
+        return manager
+    
+    def test_second_read_hits_cache(self, manager):
+        first = manager.get_metrics('TEST', periods=2)
+        second = manager.get_metrics('TEST', periods=2)
+        
+        assert manager.fetch_count == 1
+        assert [asdict(m) for m in second] == [asdict(m) for m in first]
+        assert [m.fiscal_year for m in second] == ['FY 2025', 'FY 2024']
+    
+    def test_more_periods_than_cached_refetches(self, manager):
+        manager.get_metrics('TEST', periods=1)
+        manager.get_metrics('TEST', periods=3)
+        
+        assert manager.fetch_count == 2
+    
+    def test_short_history_is_a_hit(self, manager):
+        manager.available_periods = 1
+        for _ in range(3):
+            assert len(manager.get_metrics('TEST', periods=3)) == 1
+        
+        assert manager.fetch_count == 1
+    
+    def test_expired_rows_refetch(self, manager):
+        manager.get_metrics('TEST', periods=1)
+        with manager._pool.connection() as conn:
+            conn.execute("UPDATE metrics_cache SET cached_at = '2000-01-01T00:00:00'")
+        
+        manager.get_metrics('TEST', periods=1)
+        assert manager.fetch_count == 2
+    
+    def test_newer_accession_invalidates(self, manager):
+        manager.get_metrics('TEST', periods=1)
+        manager.get_ratios('TEST', periods=1)
+        assert manager.fetch_count == 1
+        
+        manager.latest_accession = '0000000000-25-000002'
+        manager.get_ratios('TEST', periods=1)
+        assert manager.fetch_count == 2
+        with manager._pool.connection() as conn:
+            stamps = {row[0] for row in conn.execute(
+                "SELECT accession_number FROM metrics_cache UNION SELECT accession_number FROM ratios_cache"
+            )}
+        assert stamps == {'0000000000-25-000002'}
+    
+    def test_unstamped_rows_expire_by_ttl_only(self, manager):
+        manager.latest_accession = None
+        manager.get_metrics('TEST', periods=1)
+        
+        manager.latest_accession = '0000000000-25-000002'
+        manager.get_metrics('TEST', periods=1)
+        assert manager.fetch_count == 1
+    
+    def test_ratios_are_cached(self, manager):
+        first = manager.get_ratios('TEST', periods=1)
+        second = manager.get_ratios('TEST', periods=1)
+        
+        assert manager.fetch_count == 1
+        assert second[0].profit_margin == pytest.approx(first[0].profit_margin)
+    
+    def test_force_refresh_and_invalidate(self, manager):
+        manager.get_ratios('TEST', periods=1)
+        manager.get_ratios('TEST', periods=1, force_refresh=True)
+        assert manager.fetch_count == 2
+        
+        manager.invalidate('TEST')
+        manager.get_ratios('TEST', periods=1)
+        assert manager.fetch_count == 3
+
+
 class TestEdgartoolsIntegration:
     """Test edgartools-specific functionality"""
     
@@ -0,0 +1,125 @@
+"""
+Tests for the persistent SEC HTTP cache (no network access required).
+"""
+
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from financial_research_agent.cache import http_cache
+from financial_research_agent.cache.http_cache import create_cached_client, is_immutable_url
+
+
+FILING_URL = "https://www.sec.gov/Archives/edgar/data/320193/000032019325000073/aapl-20250628_cal.xml"
+INDEX_URL = "https://data.sec.gov/submissions/CIK0000320193.json"
+
+
+@pytest.fixture
+def sec(tmp_path):
+    """A cached client over a fake SEC that counts requests and honors If-None-Match."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        headers = {'Date': formatdate(usegmt=True), 'ETag': '"v1"'}
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304, headers=headers)
+        return httpx.Response(200, headers=headers, content=b"<xml/>")
+
+    http_cache._stats.reset()
+
+    def make_client(index_ttl=900):
+        return create_cached_client(tmp_path / "http", index_ttl=index_ttl, transport=httpx.MockTransport(handler))
+
+    return make_client, calls
+
+
+class TestHttpCache:
+    """Test the SEC freshness policy and counters"""
+
+    def test_immutable_url_detection(self):
+        assert is_immutable_url(FILING_URL)
+        assert is_immutable_url("/Archives/edgar/data/320193/0000320193-25-000073-index.htm")
+        assert not is_immutable_url(INDEX_URL)
+        assert not is_immutable_url("https://www.sec.gov/Archives/edgar/data/320193/")
+
+    def test_filing_documents_are_served_from_disk(self, sec):
+        make_client, calls = sec
+
+        first = make_client().get(FILING_URL)
+        # A new client (e.g. the next process) still hits the disk cache
+        second = make_client(index_ttl=0).get(FILING_URL)
+
+        assert first.content == second.content == b"<xml/>"
+        assert len(calls) == 1
+        assert second.extensions['from_cache']
+
+    def test_stale_index_is_revalidated_with_etag(self, sec):
+        make_client, calls = sec
+        client = make_client(index_ttl=0)
+
+        client.get(INDEX_URL)
+        response = client.get(INDEX_URL)
+
+        assert len(calls) == 2
+        assert calls[1].headers['If-None-Match'] == '"v1"'
+        assert response.status_code == 200
+        assert response.content == b"<xml/>"
+
+    def test_fresh_index_is_not_refetched(self, sec):
+        make_client, calls = sec
+        client = make_client(index_ttl=900)
+
+        client.get(INDEX_URL)
+        client.get(INDEX_URL)
+
+        assert len(calls) == 1
+
+    def test_counters(self, sec):
+        make_client, _ = sec
+        client = make_client(index_ttl=0)
+
+        client.get(FILING_URL)   # miss
+        client.get(FILING_URL)   # hit
+        client.get(INDEX_URL)    # miss
+        client.get(INDEX_URL)    # revalidated (304)
+
+        stats = http_cache.get_http_cache_stats()
+        assert stats['misses'] == 2
+        assert stats['hits'] == 1
+        assert stats['revalidated'] == 1
+        assert stats['hit_rate'] == 0.5
+
+
+class TestEdgarInstall:
+    """Test that the edgartools hook is only claimed when edgartools uses it"""
+
+    def test_installed_edgartools_reads_factory_hooks(self):
+        from edgar import httpclient
+
+        assert http_cache._edgar_reads_client_factories(httpclient)
+
+    def test_unused_hooks_are_not_installed(self, tmp_path, monkeypatch):
+        import edgar
+
+        def _client_factory(**kwargs):
+            return httpx.Client(**kwargs)
+
+        async def async_http_client(**kwargs):
+            return httpx.AsyncClient(**kwargs)
+
+        # A release that kept the attributes but no longer reads them
+        fake = type("httpclient", (), {
+            "client_factory_class": httpx.Client,
+            "asyncclient_factory_class": httpx.AsyncClient,
+            "_client_factory": staticmethod(_client_factory),
+            "async_http_client": staticmethod(async_http_client),
+            "close_clients": staticmethod(lambda: None),
+        })
+        monkeypatch.setattr(edgar, "httpclient", fake, raising=False)
+        monkeypatch.setattr(http_cache, "_edgar_installed", False)
+        monkeypatch.delenv("SEC_HTTP_CACHE", raising=False)
+
+        assert not http_cache.install_edgar_http_cache(tmp_path / "http")
+        assert fake.client_factory_class is httpx.Client
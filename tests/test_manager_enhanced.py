@@ -0,0 +1,141 @@
+"""
+Tests for EnhancedFinancialResearchManager stages that run without SEC access.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+from rich.console import Console
+
+from financial_research_agent import edgar_tools
+from financial_research_agent import manager_enhanced
+from financial_research_agent.agent_definitions.financial_metrics_agent import FinancialMetrics
+from financial_research_agent.manager_enhanced import EnhancedFinancialResearchManager
+from financial_research_agent.printer import Printer
+
+
+def _metrics() -> FinancialMetrics:
+    ratios = dict.fromkeys(
+        [
+            "current_ratio", "quick_ratio", "cash_ratio", "debt_to_equity", "debt_to_assets",
+            "interest_coverage", "equity_ratio", "gross_profit_margin", "operating_margin",
+            "net_profit_margin", "return_on_assets", "return_on_equity", "asset_turnover",
+            "inventory_turnover", "receivables_turnover", "days_sales_outstanding",
+            "balance_sheet_verification_error", "balance_sheet_total_assets",
+            "balance_sheet_total_liabilities", "balance_sheet_total_equity",
+        ]
+    )
+    return FinancialMetrics(
+        executive_summary="Solid quarter.",
+        period="Q3 2024",
+        filing_date="2024-11-01",
+        filing_reference="10-Q",
+        calculation_notes=[],
+        balance_sheet_verified=True,
+        balance_sheet={},
+        income_statement={},
+        cash_flow_statement={},
+        **ratios,
+    )
+
+
+def _statement(rows: dict[str, tuple[float, float]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "label": list(rows),
+            "concept": [f"us-gaap_{label.replace(' ', '')}" for label in rows],
+            "2024-09-30": [current for current, _ in rows.values()],
+            "2023-09-30": [prior for _, prior in rows.values()],
+            "abstract": [False] * len(rows),
+        }
+    )
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Manager wired to stubs instead of the EDGAR MCP server and the LLM."""
+    mgr = EnhancedFinancialResearchManager.__new__(EnhancedFinancialResearchManager)
+    mgr.console = Console(quiet=True)
+    mgr.printer = Printer(mgr.console)
+    mgr.session_dir = tmp_path
+    mgr.edgar_server = object()
+    mgr.unified_manager = None
+    mgr.cost_tracker = None
+    mgr.xbrl_warnings = []
+    mgr.statements_data = None
+
+    statements_data = {
+        "company_name": "Apple Inc.",
+        "ticker": "AAPL",
+        "current_period": "2024-09-30",
+        "prior_period": "2023-09-30",
+        "filing_reference": "10-K filed 2024-11-01",
+        "balance_sheet_df": _statement({
+            "Total Assets": (364_980e6, 352_583e6),
+            "Total Liabilities": (308_030e6, 290_437e6),
+            "Total Stockholders' Equity": (56_950e6, 62_146e6),
+        }),
+        "income_statement_df": _statement({
+            "Revenue": (391_035e6, 383_285e6),
+            "Net Income": (93_736e6, 96_995e6),
+        }),
+        "cash_flow_statement_df": _statement({
+            "Net Cash Provided by Operating Activities": (118_254e6, 110_543e6),
+            "Capital Expenditures": (-9_447e6, -10_959e6),
+        }),
+    }
+
+    async def fake_extract(server, lookup_key):
+        return statements_data
+
+    async def fake_run(agent, query, max_turns):
+        return SimpleNamespace(final_output_as=lambda cls: _metrics())
+
+    monkeypatch.setattr(edgar_tools, "extract_financial_data_enhanced", fake_extract)
+    monkeypatch.setattr(manager_enhanced.Runner, "run", fake_run)
+    monkeypatch.setattr(mgr, "_copy_xbrl_audit_files", lambda company_name: None)
+    return mgr
+
+
+class TestGatherFinancialMetrics:
+    """Metrics stage on a successful deterministic extraction"""
+
+    def test_returns_metrics_from_extracted_statements(self, manager, tmp_path):
+        metrics = asyncio.run(manager._gather_financial_metrics("Analyze Apple", ticker="AAPL"))
+
+        assert isinstance(metrics, FinancialMetrics)
+        assert metrics.balance_sheet, "deterministic statements should replace the agent's"
+        assert manager.statements_data["company_name"] == "Apple Inc."
+        assert (tmp_path / "03_financial_statements.md").exists()
+        assert (tmp_path / "04_financial_metrics.md").exists()
+        assert not (tmp_path / "error_log.txt").exists()
+
+
+class TestStageGraph:
+    """Research stage dependencies"""
+
+    def test_risk_specialist_does_not_wait_for_metrics(self, manager):
+        manager.edgar_enabled = True
+        manager.ticker = "AAPL"
+
+        stages = manager._build_stage_graph("Analyze Apple").stages
+
+        assert stages["risk"].inputs == ("search",)
+        assert stages["financials"].inputs == ("search", "metrics")
+        assert {"financials", "risk"} <= set(stages["report"].inputs)
+
+    def test_specialist_status_waits_for_every_specialist(self, manager):
+        manager._specialist_outcomes = dict.fromkeys(("financials", "risk"))
+
+        async def outcome(succeeded):
+            return succeeded
+
+        asyncio.run(manager._run_specialist("risk", outcome(False)))
+        assert manager.printer.items["specialist_analysis"] == ("Running specialist analyses (financials)...", False)
+
+        asyncio.run(manager._run_specialist("financials", outcome(True)))
+        assert manager.printer.items["specialist_analysis"] == (
+            "Specialist analyses partially complete (risk unavailable)", True
+        )
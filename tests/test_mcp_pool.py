@@ -0,0 +1,104 @@
+"""
+Tests for the MCP server pool.
+"""
+
+import asyncio
+
+import pytest
+
+from financial_research_agent.utils.mcp_pool import MCPServerPool
+
+
+class FakeServer:
+    """Stands in for MCPServerStdio (connect / list_tools / cleanup)."""
+
+    def __init__(self, log: list, fail_connect: bool = False):
+        self.log = log
+        self.fail_connect = fail_connect
+        self.healthy = True
+        self.connected = False
+
+    async def connect(self):
+        if self.fail_connect:
+            raise ConnectionError("spawn failed")
+        self.connected = True
+        self.log.append(("connect", self))
+
+    async def list_tools(self):
+        if not self.healthy:
+            raise RuntimeError("server crashed")
+        return []
+
+    async def cleanup(self):
+        self.connected = False
+        self.log.append(("cleanup", self))
+
+
+def _pool(log: list, size: int = 1, **kwargs) -> MCPServerPool:
+    return MCPServerPool(lambda: FakeServer(log), size=size, connect_timeout=1.0, **kwargs)
+
+
+class TestMCPServerPool:
+    """Test leasing, restarts and shutdown"""
+
+    def test_leases_share_least_loaded_servers(self):
+        log = []
+
+        async def scenario():
+            pool = _pool(log, size=2)
+            assert await pool.start() == 2
+
+            async with pool.lease() as first, pool.lease() as second:
+                assert first.connected and second.connected
+                assert first is not second
+                assert pool.active_leases == 2
+
+            assert pool.active_leases == 0
+            await pool.shutdown()
+
+        asyncio.run(scenario())
+
+        connected = [server for event, server in log if event == "connect"]
+        cleaned = [server for event, server in log if event == "cleanup"]
+        assert len(connected) == 2
+        assert set(cleaned) == set(connected)
+
+    def test_unhealthy_server_is_restarted(self):
+        log = []
+
+        async def scenario():
+            pool = _pool(log, health_check_interval=0.05)
+            async with pool.lease() as server:
+                original = server
+            original.healthy = False
+
+            # The next health check notices the crash and reconnects
+            async with asyncio.timeout(2.0):
+                while pool.stats()["servers"][0]["restarts"] == 0:
+                    await asyncio.sleep(0.02)
+
+            async with pool.lease(timeout=2.0) as server:
+                assert server is not original
+                assert server.connected
+
+            assert not original.connected
+            assert pool.stats()["servers"][0]["restarts"] == 1
+            await pool.shutdown()
+
+        asyncio.run(scenario())
+
+    def test_lease_times_out_when_no_server_connects(self):
+        log = []
+
+        async def scenario():
+            pool = MCPServerPool(lambda: FakeServer(log, fail_connect=True), connect_timeout=1.0)
+            assert await pool.start() == 0
+
+            with pytest.raises(TimeoutError, match="spawn failed"):
+                async with pool.lease(timeout=0.1):
+                    pass
+
+            await pool.shutdown()
+            assert not pool.is_started
+
+        asyncio.run(scenario())
@@ -0,0 +1,392 @@
+"""
+Tests for the SQLite SEC financial cache (no network access required).
+"""
+
+import os
+import threading
+from datetime import datetime
+
+import pytest
+
+# Ensure EDGAR identity is set
+os.environ.setdefault('EDGAR_IDENTITY', 'Test User test@example.com')
+
+
+def _seed_filing(cache, ticker='TEST', filing_date='2025-03-31', form_type='10-K', rows=None):
+    """Insert one filing with a few line items directly through the cache connection."""
+    now = datetime.now().isoformat()
+    if rows is None:
+        rows = {
+            'balance_sheet': [('us-gaap_Assets', 'Total assets', 2_000_000.0)],
+            'income_statement': [('us-gaap_Revenues', 'Total revenue', 1_000_000.0)],
+            'cash_flow': [('us-gaap_NetCashProvidedByUsedInOperatingActivities', 'Net cash from operations', 300_000.0)],
+        }
+
+    with cache.connection() as conn:
+        cursor = conn.execute(
+            """
+            INSERT INTO filings_metadata (ticker, form_type, filing_date, cached_at, last_accessed)
+            VALUES (?, ?, ?, ?, ?)
+        """,
+            (ticker, form_type, filing_date, now, now),
+        )
+        filing_id = cursor.lastrowid
+        for table, items in rows.items():
+            for concept, label, value in items:
+                conn.execute(
+                    f"""
+                    INSERT INTO {table} (filing_id, ticker, filing_date, concept, label, value)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    (filing_id, ticker, filing_date, concept, label, value),
+                )
+    cache.refresh_latest_values(ticker)
+    return filing_id
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from financial_research_agent.cache.sec_financial_cache import SecFinancialCache
+
+    cache = SecFinancialCache(str(tmp_path / "financials.db"))
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def manager(tmp_path):
+    from financial_research_agent.cache.cached_manager import CachedFinancialManager
+
+    manager = CachedFinancialManager(str(tmp_path / "financials.db"))
+    yield manager
+    manager.close()
+
+
+class TestConnectionPool:
+    """Test pooled thread-local connections"""
+
+    def test_reuses_one_connection_per_thread(self, cache):
+        _seed_filing(cache)
+        before = cache.get_connection_stats()['connections_opened']
+
+        cache.check_cache_status('TEST')
+        cache.get_cached_financials('TEST')
+        cache.search_line_items('assets', ticker='TEST')
+        cache.get_specific_items('TEST', ['Total assets'])
+
+        assert cache.get_connection_stats()['connections_opened'] == before
+
+    def test_get_key_metrics_opens_single_connection(self, manager):
+        _seed_filing(manager.cache)
+        manager.cache.close()
+        before = manager.cache.get_connection_stats()['connections_opened']
+
+        metrics = manager.get_key_metrics('TEST')
+
+        assert metrics['assets'] == 2_000_000.0
+        assert metrics['revenue'] == 1_000_000.0
+        assert manager.cache.get_connection_stats()['connections_opened'] - before == 1
+
+    def test_separate_connection_per_thread(self, cache):
+        connections = []
+
+        def borrow():
+            with cache.connection() as conn:
+                connections.append(conn)
+
+        threads = [threading.Thread(target=borrow) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(c) for c in connections}) == 3
+
+    def test_transaction_rolls_back_on_error(self, cache):
+        with pytest.raises(RuntimeError):
+            with cache._pool.transaction() as conn:
+                _seed_filing(cache)
+                raise RuntimeError("boom")
+
+        assert cache.check_cache_status('TEST')['cached'] is False
+
+
+class TestBulkIngest:
+    """Test batched statement ingest"""
+
+    STATEMENT = {
+        'data': [
+            {'concept': 'us-gaap_AssetsAbstract', 'label': 'Assets', 'is_abstract': True, 'values': {}},
+            {
+                'concept': 'us-gaap_Assets',
+                'label': 'Total assets',
+                'values': {'instant_2025-03-31': 2_000_000, 'instant_2024-03-31': 1_800_000},
+                'units': {'instant_2025-03-31': 'usd'},
+                'level': 1,
+            },
+            {
+                'concept': 'us-gaap_Goodwill',
+                'label': 'Goodwill',
+                'values': {'instant_2025-03-31': '', 'instant_2024-03-31': 'n/a', 'instant_2023-03-31': 50},
+            },
+            {'concept': 'us-gaap_Other', 'label': 'Other', 'values': {}},
+        ]
+    }
+
+    def test_normalize_keeps_first_usable_value(self, cache):
+        rows = cache._normalize_statement(self.STATEMENT)
+
+        assert rows == [
+            ('us-gaap_Assets', 'Total assets', 2_000_000.0, 'usd', 1),
+            ('us-gaap_Goodwill', 'Goodwill', 50.0, 'usd', 0),
+        ]
+
+    def test_bulk_writes_all_statements(self, cache):
+        filing_id = _seed_filing(cache, rows={})
+
+        with cache.connection() as conn:
+            counts = cache._cache_statements_bulk(
+                conn, filing_id, 'test', '2025-03-31',
+                {'balance': self.STATEMENT, 'income': self.STATEMENT, 'cash_flow': {'data': []}},
+            )
+
+        assert counts == {'balance': 2, 'income': 2, 'cash_flow': 0}
+        assert cache._get_filing_item_count(filing_id) == 4
+        assert cache.get_specific_items('TEST', ['us-gaap_Goodwill'])['us-gaap_Goodwill'] == 50.0
+
+    def test_invalid_statement_type(self, cache):
+        with cache.connection() as conn:
+            with pytest.raises(ValueError):
+                cache._cache_statements_bulk(conn, 1, 'TEST', '2025-03-31', {'segments': self.STATEMENT})
+
+    def test_deferred_indexes_are_rebuilt(self, cache):
+        def index_names():
+            with cache.connection() as conn:
+                rows = conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'balance_sheet'"
+                ).fetchall()
+            return {row['name'] for row in rows}
+
+        before = index_names()
+
+        with cache.deferred_indexes():
+            assert index_names() == {'idx_bs_filing'}
+            _seed_filing(cache)
+
+        assert index_names() == before
+
+
+class TestCacheWarmer:
+    """Test the parallel cache warmer (SEC calls replaced with canned data)"""
+
+    def _offline(self, cache, monkeypatch, fail_first=()):
+        calls = {}
+
+        def get_required_filings(ticker):
+            calls[ticker] = calls.get(ticker, 0) + 1
+            if ticker in fail_first and calls[ticker] == 1:
+                raise ConnectionError("SEC unavailable")
+            return {
+                'annual': {'form': '10-K', 'filing_date': '2025-03-31'},
+                'quarterlies': [{'form': '10-Q', 'filing_date': '2025-06-30'}],
+                'is_foreign': False,
+                'accounting_standard': 'US-GAAP',
+                'company': None,
+            }
+
+        def fetch_filing_statements(ticker, filing_data, company=None):
+            return {'balance': TestBulkIngest.STATEMENT}
+
+        monkeypatch.setattr(cache, 'get_required_filings', get_required_filings)
+        monkeypatch.setattr(cache, 'fetch_filing_statements', fetch_filing_statements)
+        return calls
+
+    def test_token_bucket_limits_rate(self):
+        import time
+        from financial_research_agent.cache.cache_warmer import TokenBucket
+
+        bucket = TokenBucket(rate=20, capacity=1)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+
+        assert time.monotonic() - start >= 0.18
+
+    def test_warm_cache_writes_every_ticker(self, cache, monkeypatch):
+        from financial_research_agent.cache import warm_cache
+
+        self._offline(cache, monkeypatch)
+        progress = []
+
+        results = warm_cache(
+            ['aapl', 'MSFT', 'NVDA'], workers=3, cache=cache, rate_limit=1000,
+            progress_callback=lambda fraction, message: progress.append(fraction),
+        )
+
+        assert set(results) == {'AAPL', 'MSFT', 'NVDA'}
+        assert all(r['filings_cached'] == 2 and r['total_items'] == 4 for r in results.values())
+        assert progress[-1] == 1.0
+
+        # Second run finds everything current
+        results = warm_cache(['AAPL'], cache=cache)
+        assert results['AAPL']['from_cache'] is True
+
+    def test_warm_cache_retries_with_backoff(self, cache, monkeypatch):
+        from financial_research_agent.cache import CacheWarmer
+
+        calls = self._offline(cache, monkeypatch, fail_first=('AAPL',))
+
+        results = CacheWarmer(cache, workers=2, rate_limit=1000, backoff_seconds=0.01).warm(['AAPL'])
+
+        assert calls['AAPL'] == 2
+        assert results['AAPL']['attempts'] == 2
+        assert 'error' not in results['AAPL']
+
+
+class TestPeriodAssembly:
+    """Test set-based multi-period retrieval"""
+
+    def _seed_periods(self, cache):
+        for i, date in enumerate(['2024-03-31', '2024-06-30', '2024-09-30']):
+            _seed_filing(cache, filing_date=date, form_type='10-Q' if i else '10-K', rows={
+                'balance_sheet': [
+                    ('us-gaap_Assets', 'Total assets', 100.0 + i),
+                    ('us-gaap_Liabilities', 'Total liabilities', 50.0 + i),
+                ],
+                'income_statement': [('us-gaap_Revenues', 'Total revenue', 10.0 + i)],
+                'cash_flow': [],
+            })
+
+    def test_dict_shape_newest_first(self, cache):
+        self._seed_periods(cache)
+
+        data = cache.get_cached_financials('test', periods=2)
+
+        assert [p['filing_date'] for p in data['periods']] == ['2024-09-30', '2024-06-30']
+        latest = data['periods'][0]
+        assert [item['concept'] for item in latest['balance_sheet']] == ['us-gaap_Assets', 'us-gaap_Liabilities']
+        assert latest['income_statement'][0]['value'] == 12.0
+        assert latest['cash_flow'] == []
+        assert latest['form_type'] == '10-Q'
+
+    def test_matrix_pivots_concepts_by_period(self, cache):
+        self._seed_periods(cache)
+
+        df = cache.get_financials_matrix('TEST', periods=3)
+
+        assert list(df.columns) == ['label', '2024-09-30', '2024-06-30', '2024-03-31']
+        assert df.loc[('balance_sheet', 'us-gaap_Assets'), '2024-03-31'] == 100.0
+        assert df.loc[('income_statement', 'us-gaap_Revenues'), 'label'] == 'Total revenue'
+        assert len(df) == 3
+
+    def test_filing_date_ties_pick_one_filing(self, cache):
+        _seed_filing(cache, filing_date='2024-09-30', form_type='10-K')
+        _seed_filing(cache, filing_date='2024-09-30', form_type='10-K/A', rows={
+            'balance_sheet': [('us-gaap_Assets', 'Total assets', 42.0)],
+            'income_statement': [],
+            'cash_flow': [],
+        })
+
+        data = cache.get_cached_financials('TEST', periods=1)
+
+        assert len(data['periods']) == 1
+        assert data['periods'][0]['form_type'] == '10-K/A'
+        assert data['periods'][0]['balance_sheet'][0]['value'] == 42.0
+
+    def test_not_cached(self, cache):
+        assert cache.get_cached_financials('NONE') is None
+        assert cache.get_financials_matrix('NONE') is None
+
+
+class TestLineItemSearch:
+    """Test FTS5 line-item search and the LIKE fallback"""
+
+    ROWS = {
+        'balance_sheet': [
+            ('us-gaap_LiabilitiesCurrent', 'Total current liabilities', 500.0),
+            ('us-gaap_AssetsCurrent', 'Total current assets', 900.0),
+        ],
+        'income_statement': [('us-gaap_Revenues', 'Total revenue', 1_000.0)],
+        'cash_flow': [],
+    }
+
+    def test_ranked_search_across_statements(self, cache):
+        _seed_filing(cache, rows=self.ROWS)
+
+        results = cache.search_line_items('current liab', ticker='test')
+
+        assert [r['label'] for r in results] == ['Total current liabilities']
+        assert results[0]['statement_type'] == 'balance_sheet'
+        assert results[0]['value'] == 500.0
+
+        labels = [r['label'] for r in cache.search_line_items('total')]
+        assert set(labels) == {'Total current liabilities', 'Total current assets', 'Total revenue'}
+
+    def test_statement_filter(self, cache):
+        _seed_filing(cache, rows=self.ROWS)
+
+        results = cache.search_line_items('total', statement_type='income')
+
+        assert [r['concept'] for r in results] == ['us-gaap_Revenues']
+        assert cache.search_line_items('total', statement_type='segments') == []
+
+    def test_index_follows_deletes_and_backfills(self, cache, tmp_path):
+        from financial_research_agent.cache.sec_financial_cache import SecFinancialCache
+
+        filing_id = _seed_filing(cache, rows=self.ROWS)
+        with cache.connection() as conn:
+            conn.execute("DELETE FROM income_statement WHERE filing_id = ?", (filing_id,))
+            conn.execute("DROP TABLE line_items_fts")
+
+        # Reopening recreates the index from existing rows
+        reopened = SecFinancialCache(str(cache.db_path))
+        assert reopened.search_line_items('revenue') == []
+        assert len(reopened.search_line_items('current')) == 2
+        reopened.close()
+
+    def test_like_fallback(self, cache):
+        _seed_filing(cache, rows=self.ROWS)
+        cache._fts_enabled = False
+
+        results = cache.search_line_items('LiabilitiesCurrent')
+
+        assert [r['label'] for r in results] == ['Total current liabilities']
+
+
+class TestLatestConceptValues:
+    """Test the materialized concept -> value table"""
+
+    def _store(self, cache, filing_date, assets, revenue):
+        statement = lambda concept, label, value: {'data': [{
+            'concept': concept, 'label': label, 'values': {f'instant_{filing_date}': value},
+        }]}
+        return cache.store_filing('TEST', {'form': '10-Q', 'filing_date': filing_date}, {
+            'balance': statement('us-gaap_Assets', 'Total assets', assets),
+            'income': statement('ifrs-full_Revenue', 'Revenue', revenue),
+        })
+
+    def test_ingest_keeps_newest_value(self, cache):
+        self._store(cache, '2025-06-30', 200.0, 20.0)
+        self._store(cache, '2025-03-31', 100.0, 10.0)  # older filing cached later
+
+        latest = cache.get_latest_values('test', ['us-gaap_Assets', 'ifrs-full_Revenue', 'missing'])
+
+        assert latest['us-gaap_Assets'] == {'value': 200.0, 'filing_date': '2025-06-30', 'statement': 'balance_sheet'}
+        assert latest['ifrs-full_Revenue']['value'] == 20.0
+        assert 'missing' not in latest
+
+    def test_refresh_rebuilds_from_statements(self, cache):
+        self._store(cache, '2025-06-30', 200.0, 20.0)
+        with cache.connection() as conn:
+            conn.execute("DELETE FROM latest_concept_values")
+
+        assert cache.refresh_latest_values('TEST') == 2
+        assert cache.get_latest_values('TEST', ['us-gaap_Assets'])['us-gaap_Assets']['value'] == 200.0
+
+    def test_get_metrics_resolves_in_one_query(self, manager):
+        self._store(manager.cache, '2025-06-30', 200.0, 20.0)
+
+        metrics = manager.get_metrics('TEST', ['assets', 'revenue', 'cash', 'Total assets'])
+
+        assert metrics == {'assets': 200.0, 'revenue': 20.0, 'cash': None, 'Total assets': 200.0}
+        assert manager.compare(['TEST'], ['assets']) == {'TEST': {'assets': 200.0}}
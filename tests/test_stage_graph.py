@@ -0,0 +1,103 @@
+"""
+Tests for the dependency-graph stage executor.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from financial_research_agent.utils.stage_graph import StageGraph
+
+
+def _run(graph: StageGraph) -> dict:
+    return asyncio.run(graph.run())
+
+
+class TestStageGraph:
+    """Test scheduling, failure handling and timing records"""
+
+    def test_independent_stages_overlap(self):
+        graph = StageGraph()
+
+        async def slow(value, **_):
+            await asyncio.sleep(0.2)
+            return value
+
+        graph.add_stage("plan", lambda: slow("plan"))
+        graph.add_stage("search", lambda plan: slow(f"search({plan})"), inputs=("plan",))
+        graph.add_stage("metrics", lambda: slow("metrics"))
+        graph.add_stage(
+            "report",
+            lambda search, metrics: slow(f"report({search}, {metrics})"),
+            inputs=("search", "metrics"),
+        )
+
+        results = _run(graph)
+
+        assert results["report"] == "report(search(plan), metrics)"
+        records = graph.records
+        # metrics does not wait for plan/search
+        assert records["metrics"].start_s < records["plan"].end_s
+        assert records["search"].start_s >= records["plan"].end_s
+        assert records["report"].start_s >= max(records["search"].end_s, records["metrics"].end_s)
+        # plan -> search -> report; a serial run would take 0.8s
+        assert graph.total_s < 0.75
+
+    def test_failure_cancels_dependents_and_reraises(self):
+        graph = StageGraph()
+
+        async def fail():
+            raise RuntimeError("boom")
+
+        async def never(a):
+            return a
+
+        async def slow():
+            await asyncio.sleep(5)
+
+        graph.add_stage("a", fail)
+        graph.add_stage("b", never, inputs=("a",))
+        graph.add_stage("c", slow)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            _run(graph)
+
+        assert graph.records["a"].status == "failed"
+        assert graph.records["b"].status == "cancelled"
+        assert graph.records["c"].status == "cancelled"
+
+    def test_rejects_cycles_and_unknown_inputs(self):
+        async def noop(**_):
+            return None
+
+        graph = StageGraph()
+        graph.add_stage("a", noop, inputs=("b",))
+        graph.add_stage("b", noop, inputs=("a",))
+        with pytest.raises(ValueError, match="cycle"):
+            _run(graph)
+
+        graph = StageGraph()
+        graph.add_stage("a", noop, inputs=("missing",))
+        with pytest.raises(ValueError, match="unknown"):
+            _run(graph)
+
+    def test_timings_saved_and_progress_callback(self, tmp_path):
+        started = []
+        graph = StageGraph(on_stage_start=lambda stage: started.append(stage.name))
+
+        async def noop(**_):
+            return None
+
+        graph.add_stage("first", noop, description="First...")
+        graph.add_stage("second", noop, inputs=("first",))
+        _run(graph)
+
+        path = tmp_path / "stage_timings.json"
+        graph.save_timings(path)
+        timings = json.loads(path.read_text())
+
+        assert started == ["first", "second"]
+        assert [stage["name"] for stage in timings["stages"]] == ["first", "second"]
+        assert all(stage["status"] == "done" for stage in timings["stages"])
+        assert timings["stages"][1]["inputs"] == ["first"]
@@ -0,0 +1,101 @@
+"""
+Tests for the Parquet statement snapshot store (no network access required).
+"""
+
+import pandas as pd
+import pytest
+
+from financial_research_agent.cache.statement_store import StatementStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return StatementStore(tmp_path / "statements")
+
+
+@pytest.fixture
+def balance_sheet():
+    return pd.DataFrame({
+        'concept': ['us-gaap_Assets', 'us-gaap_Liabilities'],
+        'label': ['Total assets', 'Total liabilities'],
+        'abstract': [False, False],
+        '2025-03-31': [2_000_000.0, 1_500_000.0],
+        '2024-12-31': [1_900_000.0, None],
+    })
+
+
+class TestStatementStore:
+    """Test snapshot round trips, deduplication and export"""
+
+    def test_round_trip(self, store, balance_sheet):
+        store.put('0000320193', '0000320193-25-000001', {'balance_sheet': balance_sheet},
+                  metadata={'ticker': 'AAPL'})
+
+        # CIK padding does not matter
+        snapshot = store.get(320193, '0000320193-25-000001', ['balance_sheet'])
+
+        assert snapshot is not None
+        pd.testing.assert_frame_equal(snapshot['frames']['balance_sheet'], balance_sheet)
+        assert snapshot['metadata']['ticker'] == 'AAPL'
+
+    def test_missing_statement_is_a_miss(self, store, balance_sheet):
+        store.put(1, 'acc-1', {'balance_sheet': balance_sheet})
+
+        assert store.get(1, 'acc-1', ['balance_sheet', 'cash_flow']) is None
+        assert store.get(1, 'acc-2') is None
+
+    def test_puts_merge_statements_and_metadata(self, store, balance_sheet):
+        store.put(1, 'acc-1', {'balance_sheet': balance_sheet}, metadata={'filing_url': 'a'})
+        store.put(1, 'acc-1', {'cash_flow': balance_sheet.head(1)}, metadata={'xbrl': {'x': 1}})
+
+        snapshot = store.get(1, 'acc-1')
+        assert set(snapshot['frames']) == {'balance_sheet', 'cash_flow'}
+        assert snapshot['metadata']['filing_url'] == 'a'
+        assert snapshot['metadata']['xbrl'] == {'x': 1}
+
+    def test_identical_frames_share_one_object(self, store, balance_sheet):
+        first = store.put(1, 'acc-1', {'balance_sheet': balance_sheet})
+        second = store.put(2, 'acc-2', {'balance_sheet': balance_sheet.copy()})
+
+        assert first == second
+        assert store.stats()['objects'] == 1
+        assert store.stats()['filings'] == 2
+
+    def test_read_table_is_memory_mapped_arrow(self, store, balance_sheet):
+        digest = store.put(1, 'acc-1', {'balance_sheet': balance_sheet})['balance_sheet']
+
+        table = store.read_table(digest)
+        assert table.num_rows == 2
+        assert 'label' in table.column_names
+
+    def test_mixed_object_columns_are_stored(self, store):
+        df = pd.DataFrame({'label': ['Revenue', 'Shares'], '2025-03-31': [100.0, 'n/a']})
+
+        store.put(1, 'acc-1', {'income_statement': df})
+
+        stored = store.get(1, 'acc-1')['frames']['income_statement']
+        assert list(stored['2025-03-31']) == ['100.0', 'n/a']
+
+    def test_export_csv(self, store, balance_sheet, tmp_path):
+        store.put(1, 'acc-1', {'balance_sheet': balance_sheet, 'xbrl_balance_sheet': balance_sheet})
+
+        written = store.export_csv(1, 'acc-1', tmp_path / "debug", 'AAPL', '20250331')
+
+        assert list(written) == ['balance_sheet']
+        path = tmp_path / "debug" / "xbrl_raw_balance_sheet_AAPL_20250331.csv"
+        assert written['balance_sheet'] == path
+        assert len(pd.read_csv(path)) == 2
+
+    def test_legacy_raw_data_is_dropped_from_snapshot_results(self, store, balance_sheet):
+        from financial_research_agent.edgar_tools import _enhanced_statement_result
+
+        store.put(1, 'acc-1', {'balance_sheet': balance_sheet}, metadata={
+            'statements': {'balance_sheet': {'name': 'BalanceSheet', 'raw_data': [{'concept': 'x'}]}},
+        })
+
+        snapshot = store.get(1, 'acc-1')
+        info = snapshot['metadata']['statements']['balance_sheet']
+        result = _enhanced_statement_result(info, snapshot['frames']['balance_sheet'])
+
+        assert 'raw_data' not in result
+        assert result['name'] == 'BalanceSheet'
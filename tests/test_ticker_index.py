@@ -0,0 +1,118 @@
+"""
+Tests for the local ticker index used by query ticker extraction.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from financial_research_agent.rag import ticker_index, utils
+from financial_research_agent.rag.ticker_index import TickerIndex
+from financial_research_agent.rag.utils import extract_tickers_from_query
+
+
+SEC_TICKERS = {
+    "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    "1": {"cik_str": 19617, "ticker": "JPM", "title": "JPMORGAN CHASE & CO"},
+    "2": {"cik_str": 1067983, "ticker": "BRK-B", "title": "BERKSHIRE HATHAWAY INC"},
+    "3": {"cik_str": 1067983, "ticker": "BRK-A", "title": "BERKSHIRE HATHAWAY INC"},
+    "4": {"cik_str": 1800, "ticker": "ABT", "title": "ABBOTT LABORATORIES"},
+    "5": {"cik_str": 1045810, "ticker": "NVDA", "title": "NVIDIA CORP"},
+    "6": {"cik_str": 1326801, "ticker": "META", "title": "Meta Platforms, Inc."},
+}
+
+
+@pytest.fixture
+def index(tmp_path):
+    path = tmp_path / "sec_company_tickers.json"
+    path.write_text(json.dumps(SEC_TICKERS))
+    index = TickerIndex(path=path)
+    assert index.load()
+    return index
+
+
+@pytest.fixture
+def default_index(index, monkeypatch):
+    monkeypatch.setattr(ticker_index, "_default_index", index)
+    return index
+
+
+class TestTickerIndex:
+    """Test lookups and name matching"""
+
+    def test_ticker_lookup_normalizes_share_classes(self, index):
+        assert index.is_ticker("aapl")
+        assert index.is_ticker("BRK.B")
+        assert index.is_ticker("BRK-A")
+        assert not index.is_ticker("ZZZZ")
+        assert index.company("JPM")["cik"] == 19617
+
+    def test_longest_match_wins(self, index):
+        assert index.match_names("How is Berkshire Hathaway doing vs JP Morgan?") == ["BRK.B", "JPM"]
+
+    def test_multi_word_sec_names_match_without_suffix(self, index):
+        assert index.match_names("abbott laboratories margins") == ["ABT"]
+        # Single SEC words are too ambiguous to match on their own
+        assert index.match_names("abbott margins") == []
+
+    def test_missing_file_leaves_aliases_only(self, tmp_path):
+        index = TickerIndex(path=tmp_path / "missing.json")
+        assert not index.load()
+        assert not index.is_loaded
+        assert index.match_names("apple") == ["AAPL"]
+
+    def test_ensure_fresh_skips_recent_file(self, index):
+        assert not index.is_stale()
+        assert index.ensure_fresh() is None
+
+        old = time.time() - 48 * 3600
+        os.utime(index.path, (old, old))
+        assert index.is_stale()
+
+    def test_cold_start_waits_for_running_refresh(self, tmp_path, monkeypatch):
+        index = TickerIndex(path=tmp_path / "missing.json")
+
+        def slow_refresh():
+            time.sleep(0.1)
+            index._build(SEC_TICKERS)
+            return True
+
+        monkeypatch.setattr(index, "refresh", slow_refresh)
+        assert index.ensure_fresh() is not None
+
+        assert index.wait_until_loaded(timeout=5)
+        assert index.is_ticker("NVDA")
+
+
+class TestExtractTickers:
+    """Test query extraction against the local index (no network)"""
+
+    def test_names_and_explicit_tickers(self, default_index):
+        assert sorted(extract_tickers_from_query("Compare Apple and ABT")) == ["AAPL", "ABT"]
+
+    def test_unknown_symbols_are_rejected(self, default_index):
+        assert extract_tickers_from_query("What about ZZZZ revenue?") == []
+
+    def test_cold_index_falls_back_to_edgartools(self, tmp_path, monkeypatch):
+        cold = TickerIndex(path=tmp_path / "missing.json")
+        monkeypatch.setattr(ticker_index, "_default_index", cold)
+        checked = []
+
+        def validate(ticker):
+            checked.append(ticker)
+            return ticker == "AVGO"
+
+        monkeypatch.setattr(utils, "_validate_ticker_with_edgar", validate)
+
+        assert extract_tickers_from_query("How is AVGO doing vs ZZZZ?") == ["AVGO"]
+        assert sorted(checked) == ["AVGO", "ZZZZ"]
+
+    def test_loaded_index_skips_edgartools(self, default_index, monkeypatch):
+        def validate(ticker):
+            raise AssertionError("edgartools should not be called")
+
+        monkeypatch.setattr(utils, "_validate_ticker_with_edgar", validate)
+
+        assert extract_tickers_from_query("What about ZZZZ revenue?") == []